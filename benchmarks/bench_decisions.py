@@ -0,0 +1,50 @@
+"""
+    Benchmark of DecisionRegistry with 10M pending decisions
+
+    python -m benchmarks.bench_decisions
+"""
+from time import perf_counter
+import numpy as np
+from mab.decisions import DecisionRegistry
+from mab.epsilongreedy import EpsilonGreedy
+
+N_ARMS = 100
+PENDING = 10_000_000
+BATCH = 100_000
+SINGLE = 200_000
+
+
+def main():
+    mab = EpsilonGreedy(0.1, n_arms=N_ARMS, array_backed=True)
+    registry = DecisionRegistry(mab, capacity=PENDING, ttl=3600.0)
+    print(f"ring for {PENDING} decisions: {registry.nbytes / 2 ** 20:.0f} MiB")
+
+    start = perf_counter()
+    batches = [registry.select_arms(BATCH)[1] for _ in range(PENDING // BATCH)]
+    elapsed = perf_counter() - start
+    print(f"select_arms + register: {PENDING / elapsed:,.0f} decisions/s, "
+          f"pending {registry.pending}")
+
+    ids = np.concatenate(batches)
+    np.random.shuffle(ids)
+    rewards = (np.random.random(PENDING) < 0.05).astype(np.float64)
+    start = perf_counter()
+    for chunk in range(0, PENDING, BATCH):
+        registry.reward_many(ids[chunk : chunk + BATCH], rewards[chunk : chunk + BATCH])
+    elapsed = perf_counter() - start
+    print(f"reward_many (random order): {PENDING / elapsed:,.0f} rewards/s, "
+          f"pending {registry.pending}")
+
+    # ring is full again: every new decision drops the oldest one
+    registry.select_arms(PENDING)
+    start = perf_counter()
+    for _ in range(SINGLE):
+        _, decision_id = registry.select_version()
+        registry.reward(decision_id - PENDING // 2, 1.0)
+    elapsed = perf_counter() - start
+    print(f"select_version + reward at {registry.pending} pending: "
+          f"{SINGLE / elapsed:,.0f} op/s")
+
+
+if __name__ == "__main__":
+    main()
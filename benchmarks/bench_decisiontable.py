@@ -0,0 +1,60 @@
+"""
+    Benchmark of DecisionTable: regret against throughput for staleness knobs
+
+    python -m benchmarks.bench_decisiontable
+"""
+from time import perf_counter
+import numpy as np
+from mab.decisiontable import DecisionTable
+from mab.epsilongreedy import EpsilonGreedy
+from mab.softmax import Softmax
+from mab.ucb import UCB1
+
+N_ARMS = 100
+STEPS = 100_000
+REBUILD_EVERY = [10, 100, 1000, 10000]
+
+
+def algorithms():
+    """Fresh bandits to compare"""
+    return {
+        "EpsilonGreedy(0.1)": EpsilonGreedy(0.1, n_arms=N_ARMS, array_backed=True),
+        "Softmax(0.05)": Softmax(n_arms=N_ARMS, temperature=0.05, array_backed=True),
+        "UCB1": UCB1(n_arms=N_ARMS, array_backed=True),
+    }
+
+
+def run(bandit, probabilities: np.ndarray, seed: int):
+    """Select and update for STEPS, returns (decisions per second, regret)"""
+    rng = np.random.default_rng(seed)
+    uniforms = rng.random(STEPS).tolist()
+    chosen = np.empty(STEPS, dtype=np.int64)
+    reward_rates = probabilities.tolist()
+
+    start = perf_counter()
+    for step, uniform in enumerate(uniforms):
+        arm = bandit.select_arm()
+        bandit.update(arm, float(uniform < reward_rates[arm]))
+        chosen[step] = arm
+    elapsed = perf_counter() - start
+
+    regret = float((probabilities.max() - probabilities[chosen]).sum())
+    return STEPS / elapsed, regret
+
+
+def main():
+    probabilities = np.random.default_rng(0).uniform(0.01, 0.1, N_ARMS)
+    print(f"{N_ARMS} Bernoulli arms, {STEPS} select+update")
+    print(f"{'algorithm':<20}{'mode':<22}{'op/s':>10}{'regret':>10}")
+    for name in algorithms():
+        ops, regret = run(algorithms()[name], probabilities, 1)
+        print(f"{name:<20}{'direct':<22}{ops:>10.0f}{regret:>10.0f}")
+        for rebuild_every in REBUILD_EVERY:
+            table = DecisionTable(algorithms()[name], rebuild_every, max_age=None)
+            ops, regret = run(table, probabilities, 1)
+            mode = f"table every {rebuild_every}"
+            print(f"{'':<20}{mode:<22}{ops:>10.0f}{regret:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+    Benchmark of UpdateLog replay against update per record
+
+    python -m benchmarks.bench_journal
+"""
+import shutil
+import tempfile
+from time import perf_counter
+import numpy as np
+from mab.betats import BetaTS
+from mab.journal import RECORD, UpdateLog
+
+N_ARMS = 1000
+RECORDS = 10_000_000
+BATCH = 100_000
+EVENTS = 100
+LOOP_RECORDS = 500_000
+
+
+def main():
+    path = tempfile.mkdtemp()
+    try:
+        log = UpdateLog(path, BetaTS(n_arms=N_ARMS, array_backed=True), compact_every=2 * RECORDS)
+        start = perf_counter()
+        for batch in range(RECORDS // BATCH):
+            log.update_many(
+                np.random.randint(log.mab.n_arms, size=BATCH), np.random.random(BATCH) < 0.1
+            )
+            if batch % (RECORDS // BATCH // EVENTS) == 0:
+                log.add_arm()
+        log.close()
+        elapsed = perf_counter() - start
+        size = RECORDS * RECORD.itemsize / 2 ** 20
+        print(f"write {RECORDS} updates ({size:.0f} MiB): {RECORDS / elapsed:,.0f} records/s")
+
+        start = perf_counter()
+        recovered = UpdateLog(path)
+        elapsed = perf_counter() - start
+        print(f"replay with update_many and {EVENTS} add_arm events: "
+              f"{recovered.replayed / elapsed:,.0f} records/s")
+        recovered.close()
+
+        records = np.fromfile(f"{path}/log.0", dtype=RECORD, count=LOOP_RECORDS)
+        records = records[records["kind"] == 0]
+        mab = BetaTS(n_arms=2 * N_ARMS, array_backed=True)
+        start = perf_counter()
+        for arm, reward in zip(records["arm"].tolist(), records["reward"].tolist()):
+            mab.update(arm, reward)
+        elapsed = perf_counter() - start
+        print(f"replay with update per record: {len(records) / elapsed:,.0f} records/s")
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    main()
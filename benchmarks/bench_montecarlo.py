@@ -0,0 +1,53 @@
+"""
+    Benchmark of MonteCarloSimulation against simpy EventsSimulation
+
+    python -m benchmarks.bench_montecarlo
+"""
+from time import perf_counter
+import simpy
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+from mab.montecarlo import MonteCarloSimulation
+from mab.realtime import EventsSimulation
+from mab.rewards import bernoulli_arms
+
+PROBS = [0.05, 0.04, 0.03, 0.02, 0.01]
+SIMPY_HORIZON = 100_000
+HORIZON = 1_000_000
+BLOCK_SIZES = [1, 100, 1000]
+
+
+def algorithms():
+    """Fresh bandits to compare"""
+    return {
+        "EpsilonGreedy(0.1)": EpsilonGreedy(0.1, n_arms=len(PROBS), array_backed=True),
+        "BetaTS": BetaTS(n_arms=len(PROBS), array_backed=True),
+    }
+
+
+def main():
+    print(f"{len(PROBS)} Bernoulli arms, steps per second")
+    print(f"{'algorithm':<20}{'engine':<28}{'steps/s':>12}")
+    for name in algorithms():
+        env = simpy.Environment()
+        EventsSimulation(env, algorithms()[name], bernoulli_arms(PROBS, seed=1))
+        start = perf_counter()
+        env.run(until=SIMPY_HORIZON)
+        steps = SIMPY_HORIZON / (perf_counter() - start)
+        print(f"{name:<20}{'simpy EventsSimulation':<28}{steps:>12,.0f}")
+
+        for block_size in BLOCK_SIZES:
+            horizon = HORIZON if block_size > 1 else SIMPY_HORIZON
+            simulation = MonteCarloSimulation(
+                algorithms()[name], bernoulli_arms(PROBS), horizon=horizon,
+                block_size=block_size, seed=1,
+            )
+            start = perf_counter()
+            simulation.run()
+            steps = horizon / (perf_counter() - start)
+            engine = f"MonteCarlo block {block_size}"
+            print(f"{'':<20}{engine:<28}{steps:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
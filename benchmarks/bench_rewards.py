@@ -0,0 +1,36 @@
+"""
+    Benchmark of reward generation for all the arms of a step
+
+    python -m benchmarks.bench_rewards
+"""
+from time import perf_counter
+from mab.rewards import RewardSource, bernoulli_arms
+
+PROBS = [0.05, 0.04, 0.03, 0.02, 0.01]
+STEPS = 1_000_000
+
+
+def main():
+    print(f"{len(PROBS)} Bernoulli arms, {STEPS:,} steps")
+    print(f"{'method':<28}{'steps/s':>14}")
+
+    arms = bernoulli_arms(PROBS, seed=1)
+    start = perf_counter()
+    for _ in range(STEPS):
+        list(map(lambda x: x.draw(), arms))
+    print(f"{'draw() of every arm':<28}{STEPS / (perf_counter() - start):>14,.0f}")
+
+    source = RewardSource(bernoulli_arms(PROBS, seed=1))
+    start = perf_counter()
+    for _ in range(STEPS):
+        source.draw_row()
+    print(f"{'RewardSource.draw_row()':<28}{STEPS / (perf_counter() - start):>14,.0f}")
+
+    source = RewardSource(bernoulli_arms(PROBS, seed=1))
+    start = perf_counter()
+    source.draw_matrix(STEPS)
+    print(f"{'RewardSource.draw_matrix':<28}{STEPS / (perf_counter() - start):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+    Benchmark of SimulationRunner with different number of processes
+
+    python -m benchmarks.bench_runner
+"""
+import os
+from time import perf_counter
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+from mab.runner import SimulationRunner
+
+PROBS = [0.05, 0.04, 0.03, 0.02, 0.01]
+HORIZON = 20_000
+N_SIMS = 8
+WORKERS = [1, 2, 4]
+
+
+def main():
+    algorithms = [EpsilonGreedy(0.1, n_arms=len(PROBS)), BetaTS(n_arms=len(PROBS))]
+    print(f"{len(algorithms)} algorithms x {N_SIMS} simulations x {HORIZON} steps, "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'workers':<10}{'seconds':>10}{'speedup':>10}")
+    baseline = None
+    for workers in WORKERS:
+        runner = SimulationRunner(
+            algorithms, PROBS, HORIZON, n_sims=N_SIMS, max_workers=workers, seed=1
+        )
+        start = perf_counter()
+        runner.run()
+        seconds = perf_counter() - start
+        baseline = baseline or seconds
+        print(f"{workers:<10}{seconds:>10.2f}{baseline / seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
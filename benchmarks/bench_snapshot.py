@@ -0,0 +1,76 @@
+"""
+    Benchmark of binary snapshot against pickle and dict2MAB paths
+
+    python -m benchmarks.bench_snapshot
+"""
+import codecs
+import pickle
+import timeit
+import numpy as np
+from mab.betats import BetaTS
+from mab.snapshot import from_bytes
+from mab.tools import dict2MAB
+
+N_ARMS = 100_000
+REPEAT = 5
+
+
+def build(n_arms: int) -> BetaTS:
+    """BetaTS with some state in every arm"""
+    mab = BetaTS(n_arms=n_arms, array_backed=True)
+    mab.update_many(
+        np.random.randint(n_arms, size=10 * n_arms),
+        np.random.random(10 * n_arms) < 0.1,
+    )
+    return mab
+
+
+def best_time(statement) -> float:
+    """Best time of statement in milliseconds"""
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT)) * 1000
+
+
+def main():
+    mab = build(N_ARMS)
+
+    pickled = mab.pickle()
+    snapshot = mab.to_bytes()
+    state = mab.to_dict()
+
+    rows = [
+        (
+            "pickle (base64)",
+            len(pickled),
+            best_time(mab.pickle),
+            best_time(lambda: pickle.loads(codecs.decode(pickled.encode(), "base64"))),
+        ),
+        (
+            "to_dict / dict2MAB",
+            None,
+            best_time(mab.to_dict),
+            best_time(lambda: dict2MAB(state)),
+        ),
+        (
+            "to_bytes / from_bytes",
+            len(snapshot),
+            best_time(mab.to_bytes),
+            best_time(lambda: from_bytes(snapshot)),
+        ),
+        (
+            "from_bytes (bytearray)",
+            len(snapshot),
+            None,
+            best_time(lambda: from_bytes(bytearray(snapshot))),
+        ),
+    ]
+
+    print(f"BetaTS with {N_ARMS} arms, best of {REPEAT}")
+    print(f"{'path':<24}{'size, KB':>10}{'dump, ms':>10}{'load, ms':>10}")
+    for name, size, dump, load in rows:
+        size = "-" if size is None else f"{size / 1024:.0f}"
+        dump = "-" if dump is None else f"{dump:.1f}"
+        print(f"{name:<24}{size:>10}{dump:>10}{load:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
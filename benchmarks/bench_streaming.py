@@ -0,0 +1,40 @@
+"""
+    Benchmark of memory of EventsSimulation with full histories and in streaming mode
+
+    python -m benchmarks.bench_streaming
+"""
+import tracemalloc
+from time import perf_counter
+import simpy
+from mab.epsilongreedy import EpsilonGreedy
+from mab.realtime import EventsSimulation
+from mab.rewards import bernoulli_arms
+
+PROBS = [0.05, 0.04, 0.03, 0.02, 0.01]
+HORIZON = 200_000
+MODES = {
+    "full histories": {},
+    "every 1000 steps": {"checkpoint_every": 1000},
+    "log-spaced (x1.1)": {"checkpoint_growth": 1.1},
+}
+
+
+def main():
+    print(f"{len(PROBS)} Bernoulli arms, {HORIZON:,} steps")
+    print(f"{'mode':<22}{'checkpoints':>12}{'peak MiB':>10}{'steps/s':>12}")
+    for mode, kwargs in MODES.items():
+        env = simpy.Environment()
+        algorithm = EpsilonGreedy(0.1, n_arms=len(PROBS), seed=1)
+        tracemalloc.start()
+        simulation = EventsSimulation(env, algorithm, bernoulli_arms(PROBS, seed=1), **kwargs)
+        start = perf_counter()
+        env.run(until=HORIZON)
+        seconds = perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+        print(f"{mode:<22}{len(simulation.rewards):>12,}{peak:>10.1f}"
+              f"{HORIZON / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
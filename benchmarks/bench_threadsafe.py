@@ -0,0 +1,65 @@
+"""
+    Multi-threaded stress benchmark of ThreadSafeMAB
+    against one lock around a plain MAB
+
+    python -m benchmarks.bench_threadsafe
+"""
+import threading
+from time import perf_counter
+import numpy as np
+from mab.betats import BetaTS
+from mab.threadsafe import ThreadSafeMAB
+
+N_ARMS = 100
+OPERATIONS = 20_000
+THREAD_COUNTS = [1, 2, 4, 8]
+
+
+class LockedMAB:
+    """Baseline: every call takes one global lock"""
+
+    def __init__(self, mab):
+        self._mab = mab
+        self._lock = threading.Lock()
+
+    def select_arm(self) -> int:
+        """Select arm under the lock"""
+        with self._lock:
+            return self._mab.select_arm()
+
+    def update(self, chosen_arm: int, reward: float):
+        """Update arm under the lock"""
+        with self._lock:
+            self._mab.update(chosen_arm, reward)
+
+
+def run(bandit, n_threads: int) -> float:
+    """Operations (select + update) per second for all the threads"""
+    probabilities = np.linspace(0.01, 0.1, N_ARMS)
+
+    def work(seed):
+        rewards = np.random.default_rng(seed).random(OPERATIONS).tolist()
+        for reward in rewards:
+            arm = bandit.select_arm()
+            bandit.update(arm, float(reward < probabilities[arm]))
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(n_threads)]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return n_threads * OPERATIONS / (perf_counter() - start)
+
+
+def main():
+    print(f"BetaTS with {N_ARMS} arms, {OPERATIONS} select+update per thread")
+    print(f"{'threads':>8}{'locked, op/s':>16}{'thread-safe, op/s':>20}")
+    for n_threads in THREAD_COUNTS:
+        locked = run(LockedMAB(BetaTS(n_arms=N_ARMS, array_backed=True)), n_threads)
+        sharded = run(ThreadSafeMAB(BetaTS(n_arms=N_ARMS, array_backed=True)), n_threads)
+        print(f"{n_threads:>8}{locked:>16.0f}{sharded:>20.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+    Benchmark of UCB1 decisions with the lazy index against the full scan
+    for growing number of arms. Per-decision cost of the lazy index should
+    grow much slower than the number of arms
+
+    python -m benchmarks.bench_ucb
+"""
+from time import perf_counter
+import numpy as np
+from mab.ucb import UCB1
+
+ARMS = [1_000, 10_000, 100_000]
+DECISIONS = 20_000
+SCAN_DECISIONS = 200
+
+
+def warm_bandit(n_arms: int, lazy_index: bool, array_backed: bool) -> UCB1:
+    """Bandit where every arm was played a few times"""
+    rng = np.random.default_rng(0)
+    counts = rng.integers(5, 50, n_arms)
+    values = rng.random(n_arms) * 0.1
+    return UCB1(
+        counts.tolist(),
+        values.tolist(),
+        array_backed=array_backed,
+        lazy_index=lazy_index,
+    )
+
+
+def decisions_per_us(mab: UCB1, n_decisions: int) -> float:
+    """Microseconds per select_arm + update"""
+    rewards = np.random.default_rng(1).random(n_decisions) < 0.05
+    start = perf_counter()
+    for reward in rewards.tolist():
+        mab.update(mab.select_arm(), float(reward))
+    return (perf_counter() - start) / n_decisions * 1e6
+
+
+def main():
+    print(f"{'arms':>8} {'backing':>7} {'scan us':>9} {'lazy us':>9}")
+    for n_arms in ARMS:
+        for array_backed in (False, True):
+            scan = decisions_per_us(
+                warm_bandit(n_arms, False, array_backed), SCAN_DECISIONS
+            )
+            lazy = decisions_per_us(warm_bandit(n_arms, True, array_backed), DECISIONS)
+            backing = "array" if array_backed else "list"
+            print(f"{n_arms:>8} {backing:>7} {scan:>9.1f} {lazy:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+    Benchmark of UISimulation customer by customer and in batches
+
+    python -m benchmarks.bench_uisimulation
+"""
+from time import perf_counter
+import simpy
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+from mab.realtime import UISimulation
+from mab.rewards import bernoulli_arms
+
+PROBS = [0.05, 0.04, 0.03, 0.02, 0.01]
+MINUTES = 2000
+BATCH_SIZES = [1, 10, None]
+
+
+def algorithms():
+    """Fresh bandits to compare"""
+    return {
+        "EpsilonGreedy(0.1)": EpsilonGreedy(0.1, n_arms=len(PROBS)),
+        "BetaTS": BetaTS(n_arms=len(PROBS)),
+    }
+
+
+def main():
+    print(f"{len(PROBS)} Bernoulli arms, 50-100 customers per minute")
+    print(f"{'algorithm':<20}{'batch size':<12}{'customers/s':>14}")
+    for name in algorithms():
+        for batch_size in BATCH_SIZES:
+            env = simpy.Environment()
+            simulation = UISimulation(
+                env, algorithms()[name], bernoulli_arms(PROBS, seed=1), 50, 100,
+                seed=1, batch_size=batch_size,
+            )
+            start = perf_counter()
+            env.run(until=MINUTES)
+            customers = len(simulation.chosen_arms) / (perf_counter() - start)
+            label = "minute" if batch_size is None else str(batch_size)
+            print(f"{name:<20}{label:<12}{customers:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """AB testing Class for Multiarm Bandit Application"""
+from bisect import bisect_right
 from typing import List, Set
-from mab.mab import MAB
+import numpy as np
+from mab.mab import MAB, Seed
 
 
 class AB(MAB):
@@ -33,6 +35,9 @@ class AB(MAB):
     select_arm()
         select arm one by one sequentially
 
+    select_arms(n)
+        select n arms one by one sequentially
+
     """
     # pylint: disable=too-many-arguments
     def __init__(
@@ -43,6 +48,8 @@ class AB(MAB):
         version_ids: List[str] = None,
         current_arm: int = 0,
         active_arms: Set[int] = None,
+        array_backed: bool = False,
+        seed: Seed = None,
     ):
         """
         Args:
@@ -55,8 +62,13 @@ class AB(MAB):
             version_ids (list): list of version ids. Defaults to list of indexes as strings
             current_arm (int): Index of current arm to call. Defaults to 0
             active_arms (set): set of indexes of active arms
+            array_backed (bool): store per-arm state as numpy arrays. Defaults to False
+            seed (int, SeedSequence or Generator, optional): seed of the instance
+                random generator. Defaults to fresh entropy
         """
-        super().__init__(counts, values, n_arms, version_ids, active_arms)
+        super().__init__(
+            counts, values, n_arms, version_ids, active_arms, array_backed, seed
+        )
 
         self.current_arm = current_arm
 
@@ -81,21 +93,53 @@ class AB(MAB):
             int: index of the next arm to select following to the previous arm
         """
         current_arm = self.current_arm
-        # switch arm to the next position
-
-        if self.current_arm == self.n_arms - 1:
-            self.current_arm = 0
-        else:
-            self.current_arm += 1
-
-        while self.current_arm not in self.active_arms:
-            if self.current_arm == self.n_arms - 1:
-                self.current_arm = 0
-            else:
-                self.current_arm += 1
+        # switch arm to the next active position (active arms are sorted)
+        position = bisect_right(self.active_arms, current_arm)
+        if position == len(self.active_arms):
+            position = 0
+        self.current_arm = self.active_arms[position]
+
         # return the arm before
         return current_arm
 
+    def _continue_selections(self, previous):
+        """Take random generator and the position in the rotation of the previous copy"""
+        super()._continue_selections(previous)
+        self.current_arm = previous.current_arm
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """Select next n arms one by one
+
+        Args:
+            n (int): number of arms to select
+
+        Returns:
+            np.ndarray: indexes of the next n arms following to the previous arm
+        """
+        if n == 0:
+            return np.empty(0, dtype=np.int64)
+
+        active_arms = np.asarray(self.active_arms, dtype=np.int64)
+        # position of the first active arm after the current one
+        start = bisect_right(active_arms, self.current_arm) % len(active_arms)
+
+        arms = np.empty(n, dtype=np.int64)
+        arms[:1] = self.current_arm
+        arms[1:] = active_arms[(start + np.arange(n - 1)) % len(active_arms)]
+
+        self.current_arm = int(active_arms[(start + n - 1) % len(active_arms)])
+        return arms
+
+    def arm_probabilities(self) -> np.ndarray:
+        """Active arms take equal shares of selections one by one
+
+        Returns:
+            np.ndarray: probabilities of the arms
+        """
+        probabilities = np.zeros(self.n_arms)
+        probabilities[self.active_arms] = 1.0 / len(self.active_arms)
+        return probabilities
+
     def reset(self):
         """Reset the algorithm to the initial state"""
         super().reset()
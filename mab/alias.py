@@ -0,0 +1,109 @@
+"""
+    Alias table (Walker / Vose) for O(1) sampling from discrete distribution
+"""
+from typing import Sequence
+import numpy as np
+
+
+class AliasTable:
+    """
+    Alias table for O(1) sampling from discrete distribution
+
+    Building takes O(n), every draw after that needs one uniform number
+    and two lookups.
+
+    ...
+
+    Attributes:
+    ----------
+
+    outcomes : np.ndarray
+        values to return (arm indexes)
+
+    Methods:
+    -----------
+    draw(uniform)
+        map uniform number in [0, 1) into outcome
+
+    draw_many(uniforms)
+        map array of uniform numbers in [0, 1) into outcomes
+    """
+
+    def __init__(self, probabilities: Sequence[float], outcomes: Sequence[int] = None):
+        """
+        Args:
+            probabilities (Sequence[float]): weights of the outcomes (not need to be normalized)
+            outcomes (Sequence[int], optional): values to return.
+                Defaults to indexes of probabilities
+        """
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        size = len(probabilities)
+        assert size > 0
+
+        if outcomes is None:
+            outcomes = np.arange(size)
+        self.outcomes = np.asarray(outcomes, dtype=np.int64)
+
+        scaled = (probabilities * (size / probabilities.sum())).tolist()
+        threshold = [1.0] * size
+        alias = list(range(size))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            threshold[less] = scaled[less]
+            alias[less] = more
+            # the large one gives away the rest of the small column
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # leftovers are 1.0 up to rounding errors
+
+        self._threshold = np.array(threshold)
+        self._alias_outcomes = self.outcomes[alias]
+        # python copies make single draws cheaper than numpy scalar indexing
+        self._threshold_list = threshold
+        self._outcomes_list = self.outcomes.tolist()
+        self._alias_outcomes_list = self._alias_outcomes.tolist()
+
+    @property
+    def size(self) -> int:
+        """Number of the outcomes"""
+        return len(self.outcomes)
+
+    def draw(self, uniform: float) -> int:
+        """ Map uniform number into outcome.
+            Integer part of uniform * size selects the column,
+            fractional part is the coin to choose between outcome and its alias
+
+        Args:
+            uniform (float): uniform number in [0, 1)
+
+        Returns:
+            int: outcome
+        """
+        scaled = uniform * self.size
+        column = min(int(scaled), self.size - 1)
+        if scaled - column < self._threshold_list[column]:
+            return self._outcomes_list[column]
+        return self._alias_outcomes_list[column]
+
+    def draw_many(self, uniforms: np.ndarray) -> np.ndarray:
+        """ Map uniform numbers into outcomes. Vectorized version of draw
+
+        Args:
+            uniforms (np.ndarray): uniform numbers in [0, 1)
+
+        Returns:
+            np.ndarray: outcomes
+        """
+        scaled = np.asarray(uniforms) * self.size
+        column = np.minimum(scaled.astype(np.int64), self.size - 1)
+        return np.where(
+            scaled - column < self._threshold[column],
+            self.outcomes[column],
+            self._alias_outcomes[column],
+        )
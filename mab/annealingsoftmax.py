@@ -2,6 +2,9 @@
        The idea is to decrease the temerature paramters depending on time
 """
 from math import log
+from typing import List, Set
+import numpy as np
+from mab.mab import Seed
 from mab.softmax import Softmax
 
 
@@ -38,10 +41,53 @@ class AnnealingSoftmax(Softmax):
 
     select_arm()
         select index of arm to chose next (the core of the algorithm)
+
+    select_arms(n)
+        select n arms at once
     """
 
     _EPSILON = 0.0000001
 
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        counts: List[int] = None,
+        values: List[float] = None,
+        n_arms: int = None,
+        version_ids: List[str] = None,
+        active_arms: Set[int] = None,
+        temperature: float = 0.1,
+        array_backed: bool = False,
+        seed: Seed = None,
+    ):
+        """
+        Args:
+            temperature (float, optional): initial temperature.
+                                It's recalculated before every selection
+            counts (list[int]): number of times event happend for each arm.
+                                Defaults to [0] * n_arms
+            values (list[float]): total rewards for each arm
+                                Defaults to [0.0] * n_arms
+            n_arms (int): Number of arms. Defaults to len(counts)
+            version_ids (list): list of version ids.
+                                Defaults to list of indexes as strings
+            active_arms (set): set of indexes of active arms
+            array_backed (bool): store per-arm state as numpy arrays. Defaults to False
+            seed (int, SeedSequence or Generator, optional): seed of the instance
+                random generator. Defaults to fresh entropy
+        """
+        super().__init__(
+            counts,
+            values,
+            n_arms,
+            version_ids,
+            active_arms,
+            temperature,
+            array_backed,
+            seed,
+        )
+        self._refresh_active_count()
+
     @property
     def name(self) -> str:
         """Name of the algorithm (depends on parameters)
@@ -62,9 +108,79 @@ class AnnealingSoftmax(Softmax):
         Returns:
             int: arm to select next
         """
-        temp = 1
-        for arm in self.active_arms:
-            temp += self.counts[arm] + 1
-        self.temperature = 1.0 / log(temp + self._EPSILON)
+        self._anneal()
         # update epsilon if weaknes multipler was set
         return super().select_arm()
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """Anearing Softmax for n arms at once.
+           Temperature depends only on counts so it's the same for all of them
+
+        Args:
+            n (int): number of arms to select
+
+        Returns:
+            np.ndarray: indexes of the selected arms
+        """
+        self._anneal()
+        return super().select_arms(n)
+
+    def arm_probabilities(self) -> np.ndarray:
+        """Probabilities of selecting each arm with the annealed temperature
+
+        Returns:
+            np.ndarray: probabilities of the arms
+        """
+        self._anneal()
+        return super().arm_probabilities()
+
+    def _anneal(self):
+        """Update temperature with the number of the events for active arms. O(1)
+           Softmax distribution is recalculated only if temperature has changed
+        """
+        temp = 1 + self._active_count + len(self.active_arms)
+        self.temperature = 1.0 / log(temp + self._EPSILON)
+
+    def _refresh_active_count(self):
+        """Recalculate total count of the active arms"""
+        self._active_count = int(np.asarray(self.counts)[self.active_arms].sum())
+
+    def update(self, chosen_arm, reward):
+        """Update chosen arm and the total count of the active arms
+
+        Args:
+            chosen_arm (int or str): arm index or version_id
+            reward (float): reward
+        """
+        if isinstance(chosen_arm, str):
+            chosen_arm = self.version_id_index(chosen_arm)
+        super().update(chosen_arm, reward)
+        if self.is_active(chosen_arm):
+            self._active_count += 1
+
+    def update_many(self, chosen_arms, rewards):
+        """Update arms with the batch of rewards and the total count of the active arms
+
+        Args:
+            chosen_arms (array-like of int or str): arm indexes or version_ids
+            rewards (array-like of float): rewards
+        """
+        chosen_arms = self._arm_indexes(chosen_arms)
+        super().update_many(chosen_arms, rewards)
+        self._active_count += int(self._active_mask()[chosen_arms].sum())
+
+    def _active_changed(self, activated, deactivated):
+        """Move counts of activated and deactivated arms in or out of the active total
+
+        Args:
+            activated (list[int]): indexes of activated arms
+            deactivated (list[int]): indexes of deactivated arms
+        """
+        super()._active_changed(activated, deactivated)
+        self._active_count += sum(int(self.counts[index]) for index in activated)
+        self._active_count -= sum(int(self.counts[index]) for index in deactivated)
+
+    def _state_reloaded(self):
+        """Recalculate the active total after reset or state reload"""
+        super()._state_reloaded()
+        self._refresh_active_count()
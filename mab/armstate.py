@@ -0,0 +1,114 @@
+"""
+    Array backed per-arm state for Multiarm Bandits
+"""
+from typing import Dict, Sequence
+import numpy as np
+
+
+class ArmState:
+    """
+    Struct-of-arrays storage for per-arm state (counts, values, priors, ...)
+
+    Every column is kept as a contiguous numpy array with some spare capacity,
+    so adding arms is amortized O(1) and algorithms can work with the whole
+    column as a single vector. Writable numpy arrays of the column dtype are
+    adopted without copy (e.g. views of the snapshot buffer).
+
+    ...
+
+    Attributes:
+    ----------
+
+    n_arms : int
+        number of arms stored
+
+    Methods:
+    -----------
+    add_column(name, values, dtype)
+        add (or replace) column with the per-arm values
+
+    column(name)
+        return view of the column with n_arms values
+
+    append(n)
+        add n arms filled with the default values of each column
+    """
+
+    _MIN_CAPACITY = 8
+
+    def __init__(self, n_arms: int):
+        """
+        Args:
+            n_arms (int): number of arms
+        """
+        self.n_arms = n_arms
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._defaults: Dict[str, object] = {}
+
+    @property
+    def capacity(self) -> int:
+        """Number of arms that fit into the allocated buffers"""
+        if not self._buffers:
+            return self.n_arms
+        return min(len(buffer) for buffer in self._buffers.values())
+
+    @property
+    def columns(self) -> Sequence[str]:
+        """Names of the stored columns"""
+        return list(self._buffers)
+
+    def add_column(self, name: str, values: Sequence, dtype, default=0):
+        """ Add (or replace) column
+
+        Args:
+            name (str): name of the column
+            values (Sequence): values for each arm. Must have n_arms values
+            dtype: numpy dtype of the column
+            default (optional): value for the arms added later. Defaults to 0
+        """
+        adopt = (
+            isinstance(values, np.ndarray)
+            and values.dtype == dtype
+            and values.flags.writeable
+            and values.flags.c_contiguous
+        )
+        values = np.asarray(values, dtype=dtype)
+        assert values.shape == (self.n_arms,)
+
+        if adopt:
+            buffer = values
+        else:
+            buffer = np.full(max(self._MIN_CAPACITY, self.n_arms), default, dtype=dtype)
+            buffer[: self.n_arms] = values
+        self._buffers[name] = buffer
+        self._defaults[name] = default
+
+    def column(self, name: str) -> np.ndarray:
+        """ Return column values
+
+        Args:
+            name (str): name of the column
+
+        Returns:
+            np.ndarray: view of the column (writes go to the storage)
+        """
+        return self._buffers[name][: self.n_arms]
+
+    def append(self, n: int = 1):
+        """ Add n arms with the default values of every column.
+            Buffers grow geometrically so the cost is amortized O(1) per arm
+
+        Args:
+            n (int, optional): number of arms to add. Defaults to 1.
+        """
+        new_n_arms = self.n_arms + n
+        for name, buffer in self._buffers.items():
+            if new_n_arms > len(buffer):
+                capacity = max(new_n_arms, 2 * len(buffer), self._MIN_CAPACITY)
+                grown = np.full(capacity, self._defaults[name], dtype=buffer.dtype)
+                grown[: self.n_arms] = buffer[: self.n_arms]
+                self._buffers[name] = grown
+            else:
+                buffer[self.n_arms : new_n_arms] = self._defaults[name]
+
+        self.n_arms = new_n_arms
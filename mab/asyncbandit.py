@@ -0,0 +1,213 @@
+"""
+    Asyncio serving facade for Multiarm Bandits
+"""
+import asyncio
+import copy
+from dataclasses import dataclass
+from time import perf_counter
+from typing import List, Optional, Union
+from mab.mab import MAB
+
+
+@dataclass
+class FlushStats:
+    """ Statistics of the update flushes """
+
+    flushes: int = 0
+    updates: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean seconds of one flush"""
+        return self.total_latency / max(1, self.flushes)
+
+
+class AsyncBandit:
+    """
+    Asyncio facade for Multiarm Bandit
+
+    Decisions are made right away with the current state. Updates are put
+    into in-memory queue and applied with one update_many call when the queue
+    reaches batch_size or flush_interval passed, so decisions never wait
+    for the update path. Background flushes (flush_async) apply the queue to
+    a copy of the bandit in the default executor and swap it in as mab, so
+    the event loop keeps serving decisions while update_many runs. Copying is
+    O(n_arms) on the loop, for few arms flush() is cheaper.
+
+    ...
+
+    Attributes:
+    ----------
+
+    mab: MAB
+        multiarm bandit (replaced with the updated copy by flush_async)
+
+    batch_size : int
+        queue size to trigger flush
+
+    flush_interval : float
+        maximum seconds between flushes
+
+    stats : FlushStats
+        statistics of the flushes
+
+    Methods:
+    -----------
+    select_arm(), select_version(), select_arms(n), select_versions(n)
+        select with the current state
+
+    update(chosen_arm, reward)
+        put update into the queue
+
+    flush()
+        apply queued updates on the calling thread
+
+    flush_async()
+        apply queued updates to a copy off the event loop and swap it in
+
+    start(), close()
+        start and stop background flushing (or use "async with")
+    """
+
+    def __init__(self, mab: MAB, batch_size: int = 1000, flush_interval: float = 0.05):
+        """
+        Args:
+            mab (MAB): multiarm bandit
+            batch_size (int, optional): queue size to trigger flush. Defaults to 1000.
+            flush_interval (float, optional): maximum seconds between flushes.
+                Defaults to 0.05.
+        """
+        self.mab = mab
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats = FlushStats()
+
+        self._arms: List[int] = []
+        self._rewards: List[float] = []
+        # batches applied by flush() while flush_async updates the copy
+        self._in_flight: Optional[List[tuple]] = None
+        # created by start to bind it with the running loop
+        self._batch_ready = None
+        self._flusher = None
+        self._closing = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of queued updates"""
+        return len(self._arms)
+
+    async def select_arm(self) -> int:
+        """Select arm with the current state"""
+        return self.mab.select_arm()
+
+    async def select_version(self) -> str:
+        """Select version with the current state"""
+        return self.mab.select_version()
+
+    async def select_arms(self, n: int):
+        """Select n arms with the current state"""
+        return self.mab.select_arms(n)
+
+    async def select_versions(self, n: int) -> List[str]:
+        """Select n versions with the current state"""
+        return self.mab.select_versions(n)
+
+    async def update(self, chosen_arm: Union[int, str], reward: float):
+        """ Put update into the queue
+
+        Args:
+            chosen_arm (int or str): arm index or version_id
+            reward (float): reward
+        """
+        if isinstance(chosen_arm, str):
+            chosen_arm = self.mab.version_id_index(chosen_arm)
+        self._arms.append(chosen_arm)
+        self._rewards.append(reward)
+        if len(self._arms) >= self.batch_size and self._batch_ready is not None:
+            self._batch_ready.set()
+
+    def flush(self):
+        """Apply queued updates with one update_many call on the calling thread
+           (the event loop waits for it, see flush_async)
+        """
+        if not self._arms:
+            return
+
+        arms, rewards = self._arms, self._rewards
+        self._arms, self._rewards = [], []
+
+        start = perf_counter()
+        self.mab.update_many(arms, rewards)
+        if self._in_flight is not None:
+            # the copy updated by flush_async gets them before it's swapped in
+            self._in_flight.append((arms, rewards))
+        self._record_flush(len(arms), perf_counter() - start)
+
+    async def flush_async(self):
+        """Apply queued updates to a copy of the bandit in the default executor
+           and swap it in. Selections continue with the current bandit meanwhile
+        """
+        if not self._arms or self._in_flight is not None:
+            return
+
+        arms, rewards = self._arms, self._rewards
+        self._arms, self._rewards = [], []
+
+        start = perf_counter()
+        updated = copy.deepcopy(self.mab)
+        self._in_flight = []
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, updated.update_many, arms, rewards
+            )
+            for batch in self._in_flight:
+                updated.update_many(*batch)
+        finally:
+            self._in_flight = None
+
+        updated._continue_selections(self.mab)
+        self.mab = updated
+        self._record_flush(len(arms), perf_counter() - start)
+
+    def _record_flush(self, updates: int, latency: float):
+        self.stats.flushes += 1
+        self.stats.updates += updates
+        self.stats.last_latency = latency
+        self.stats.max_latency = max(self.stats.max_latency, latency)
+        self.stats.total_latency += latency
+
+    async def _flush_forever(self):
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self.flush_async()
+
+    def start(self):
+        """Start background flushing. Must be called with running event loop"""
+        if self._flusher is None:
+            self._batch_ready = asyncio.Event()
+            self._closing = False
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_forever())
+
+    async def close(self):
+        """Stop background flushing and apply the rest of the queue"""
+        if self._flusher is not None:
+            # the flusher finishes the flush in progress (its copy isn't lost)
+            self._closing = True
+            self._batch_ready.set()
+            await self._flusher
+            self._flusher = None
+        await self.flush_async()
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -1,10 +1,9 @@
 """
     Thompson Sampling Muli-armed banded with Betta Distribution
 """
-from math import inf
 from typing import List, Set
-from numpy.random import beta as beta_distribution
-from mab.mab import MAB
+import numpy as np
+from mab.mab import MAB, Seed
 
 
 class BetaTS(MAB):
@@ -45,11 +44,19 @@ class BetaTS(MAB):
     select_arm()
         select index of arm to chose next (the core of the algorythm)
 
+    select_arms(n)
+        select n arms at once
+
     update(chosen_arm, reward)
         updated chosen arm with the recieved reward
+
+    update_many(chosen_arms, rewards)
+        update arms with the batch of rewards
     
     """
 
+    _ARM_COLUMNS = dict(MAB._ARM_COLUMNS, alpha=(np.float64, 1), beta=(np.float64, 1))
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -60,6 +67,8 @@ class BetaTS(MAB):
         n_arms: int = None,
         version_ids: List[str] = None,
         active_arms: Set[int] = None,
+        array_backed: bool = False,
+        seed: Seed = None,
     ):
         """[summary]
 
@@ -79,19 +88,22 @@ class BetaTS(MAB):
 
             active_arms (set): list with indexes of active versions. 
                 When it's none it's set as all the versions
+
+            array_backed (bool): store per-arm state as numpy arrays. Defaults to False
+
+            seed (int, SeedSequence or Generator, optional): seed of the instance
+                random generator used for sampling. Defaults to fresh entropy
         """
-        super().__init__(counts, values, n_arms, version_ids, active_arms)
+        super().__init__(
+            counts, values, n_arms, version_ids, active_arms, array_backed, seed
+        )
         if alpha is None:
             alpha = [1] * self.n_arms
 
         if beta is None:
             beta = [1] * self.n_arms
 
-        self.alpha = alpha
-        self.beta = beta
-
-        self.__init_alpha = alpha[:]
-        self.__init_beta = beta[:]
+        self._set_arm_columns(alpha=alpha, beta=beta)
 
     @property
     def name(self) -> str:
@@ -113,16 +125,47 @@ class BetaTS(MAB):
         Returns:
             int: arm to select next
         """
-        mx_ = -inf
-        selected_arm = 0
-        for arm in range(self.n_arms):
-            if arm not in self.active_arms:
-                tetta = beta_distribution(self.alpha[arm], self.beta[arm])
-                if mx_ < tetta:
-                    mx_ = tetta
-                    selected_arm = arm
+        # one draw from posterior of every active arm
+        if self._arm_state is None:
+            alpha, beta, rng = self.alpha, self.beta, self._rng
+            return max(self.active_arms, key=lambda arm: rng.beta(alpha[arm], beta[arm]))
+        active_arms = np.asarray(self.active_arms, dtype=np.int64)
+        tetta = self._rng.beta(
+            np.asarray(self.alpha)[active_arms], np.asarray(self.beta)[active_arms]
+        )
+        return int(active_arms[np.argmax(tetta)])
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """Thompson Sampling for n arms at once with n x active_arms Beta matrix
 
-        return selected_arm
+        Args:
+            n (int): number of arms to select
+
+        Returns:
+            np.ndarray: indexes of the selected arms
+        """
+        active_arms = np.asarray(self.active_arms, dtype=np.int64)
+        tetta = self._rng.beta(
+            np.asarray(self.alpha)[active_arms],
+            np.asarray(self.beta)[active_arms],
+            size=(n, len(active_arms)),
+        )
+        return active_arms[np.argmax(tetta, axis=1)]
+
+    def arm_probabilities(self) -> np.ndarray:
+        """Probabilities of each arm to have the best posterior draw.
+           Estimated with _PROBABILITY_DRAWS Thompson samples
+
+        Returns:
+            np.ndarray: probabilities of the arms
+        """
+        # keep the Beta matrix of every chunk about 1M values
+        chunk = max(1, 2 ** 20 // len(self.active_arms))
+        wins = np.zeros(self.n_arms)
+        for start in range(0, self._PROBABILITY_DRAWS, chunk):
+            n = min(chunk, self._PROBABILITY_DRAWS - start)
+            wins += np.bincount(self.select_arms(n), minlength=self.n_arms)
+        return wins / self._PROBABILITY_DRAWS
 
     def update(self, chosen_arm, reward):
         """Update paramters of the algorithm
@@ -131,12 +174,36 @@ class BetaTS(MAB):
             chosen_arm (int): arm that received the reward
             reward (int): value of reward
         """
+        if isinstance(chosen_arm, str):
+            chosen_arm = self.version_id_index(chosen_arm)
+
         super().update(chosen_arm, reward)
         self.alpha[chosen_arm] += int(reward)
         self.beta[chosen_arm] += int(1 - reward)
 
-    def reset(self):
-        """Reset the Algorithm to the initial state"""
-        super().reset()
-        self.alpha = self.__init_alpha[:]
-        self.beta = self.__init_beta[:]
+    def update_many(self, chosen_arms, rewards):
+        """Update paramters of the algorithm with the batch of rewards
+
+        Args:
+            chosen_arms (array-like of int or str): arms that received the rewards
+            rewards (array-like of int): values of rewards
+        """
+        chosen_arms = self._arm_indexes(chosen_arms)
+        rewards = np.asarray(rewards, dtype=np.float64)
+        super().update_many(chosen_arms, rewards)
+
+        for name, increments in self._column_increments(rewards).items():
+            column = np.asarray(getattr(self, name))
+            delta = np.bincount(chosen_arms, weights=increments, minlength=self.n_arms)
+            self._assign_arm_column(name, column + delta.astype(column.dtype))
+
+    def _column_increments(self, rewards: np.ndarray) -> dict:
+        """Increments of alpha and beta for every reward
+
+        Args:
+            rewards (np.ndarray): rewards
+
+        Returns:
+            dict: column name -> increments
+        """
+        return {"alpha": np.trunc(rewards), "beta": np.trunc(1 - rewards)}
@@ -0,0 +1,211 @@
+"""
+    Registry of pending decisions for delayed rewards
+"""
+from time import monotonic
+from typing import Callable, Tuple
+import numpy as np
+from mab.mab import MAB
+
+_RESOLVED = -1
+
+
+class DecisionRegistry:
+    """
+    Registry of decisions waiting for delayed rewards
+
+    Selection returns decision id with the arm. When the reward arrives
+    (maybe minutes later) it is applied to the arm of the decision by id.
+    Pending decisions are kept in a ring of arrays (arm, issue time, sequence
+    number) indexed by decision_id % capacity, so ids are plain integers and
+    the memory is fixed: 20 bytes per decision. Decisions are issued in time
+    order, so expired ones are always at the tail of the ring. When the ring
+    is full the oldest decision is dropped.
+
+    ...
+
+    Attributes:
+    ----------
+
+    mab: MAB
+        multiarm bandit
+
+    capacity : int
+        maximum number of pending decisions
+
+    ttl : float
+        seconds to wait for the reward of decision
+
+    expired : int
+        number of decisions evicted without reward (by ttl or capacity)
+
+    Methods:
+    -----------
+    select_arm(), select_version(), select_arms(n), select_versions(n)
+        select and register decision, returns (selection, decision_id)
+
+    reward(decision_id, reward)
+        apply reward to the arm of the pending decision
+
+    reward_many(decision_ids, rewards)
+        apply batch of rewards with one update_many
+
+    expire()
+        evict decisions older than ttl
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        mab: MAB,
+        capacity: int = 1_000_000,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = monotonic,
+    ):
+        """
+        Args:
+            mab (MAB): multiarm bandit
+            capacity (int, optional): maximum pending decisions. Defaults to 1_000_000.
+            ttl (float, optional): seconds to wait for reward. Defaults to 3600.0.
+            clock (Callable, optional): time source. Defaults to time.monotonic.
+        """
+        self.mab = mab
+        self.capacity = capacity
+        self.ttl = ttl
+        self.expired = 0
+
+        self._clock = clock
+        self._arms = np.zeros(capacity, dtype=np.int32)
+        self._issued_at = np.zeros(capacity, dtype=np.float64)
+        self._seqs = np.full(capacity, _RESOLVED, dtype=np.int64)
+        self._next_seq = 0  # id of the next decision
+        self._oldest_seq = 0  # ids below it are evicted
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of decisions waiting for the reward"""
+        return self._pending
+
+    @property
+    def nbytes(self) -> int:
+        """Memory of the ring in bytes"""
+        return self._arms.nbytes + self._issued_at.nbytes + self._seqs.nbytes
+
+    def _ring_slices(self, start: int, stop: int):
+        """Slices of the ring holding sequence numbers [start, stop)"""
+        start = max(start, stop - self.capacity)
+        if start >= stop:
+            return []
+        first, last = start % self.capacity, (stop - 1) % self.capacity + 1
+        if first < last:
+            return [slice(first, last)]
+        return [slice(first, self.capacity), slice(0, last)]
+
+    def _evict_until(self, seq: int):
+        """Drop decisions with ids below seq"""
+        for ring in self._ring_slices(self._oldest_seq, seq):
+            live = self._seqs[ring] != _RESOLVED
+            n_live = int(np.count_nonzero(live))
+            self._pending -= n_live
+            self.expired += n_live
+            self._seqs[ring] = _RESOLVED
+        self._oldest_seq = max(self._oldest_seq, seq)
+
+    def expire(self) -> int:
+        """ Evict decisions older than ttl
+
+        Returns:
+            int: number of evicted pending decisions
+        """
+        expired = self.expired
+        cutoff = self._clock() - self.ttl
+        seq = self._oldest_seq
+        for ring in self._ring_slices(self._oldest_seq, self._next_seq):
+            # issue times are sorted inside of the ring slice
+            n_old = int(np.searchsorted(self._issued_at[ring], cutoff, side="left"))
+            seq += n_old
+            if n_old < ring.stop - ring.start:
+                break
+        self._evict_until(seq)
+        return self.expired - expired
+
+    def _register(self, arms) -> np.ndarray:
+        """Put decisions for arms into the ring and return their ids"""
+        n = len(arms)
+        assert n <= self.capacity
+        self.expire()
+        self._evict_until(self._next_seq + n - self.capacity)
+
+        seqs = np.arange(self._next_seq, self._next_seq + n, dtype=np.int64)
+        slots = seqs % self.capacity
+        self._arms[slots] = arms
+        self._issued_at[slots] = self._clock()
+        self._seqs[slots] = seqs
+        self._next_seq += n
+        self._pending += n
+        return seqs
+
+    def select_arm(self) -> Tuple[int, int]:
+        """Select arm and register decision. Returns (arm, decision_id)"""
+        arm = self.mab.select_arm()
+        return arm, int(self._register([arm])[0])
+
+    def select_version(self) -> Tuple[str, int]:
+        """Select version and register decision. Returns (version_id, decision_id)"""
+        arm, decision_id = self.select_arm()
+        return self.mab.version_ids[arm], decision_id
+
+    def select_arms(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Select n arms and register decisions. Returns (arms, decision_ids)"""
+        arms = np.asarray(self.mab.select_arms(n))
+        return arms, self._register(arms)
+
+    def select_versions(self, n: int) -> Tuple[list, np.ndarray]:
+        """Select n versions and register decisions. Returns (version_ids, decision_ids)"""
+        arms, decision_ids = self.select_arms(n)
+        version_ids = self.mab.version_ids
+        return [version_ids[arm] for arm in arms], decision_ids
+
+    def reward(self, decision_id: int, reward: float) -> bool:
+        """ Apply reward to the arm of pending decision
+
+        Args:
+            decision_id (int): id returned by selection
+            reward (float): reward
+
+        Returns:
+            bool: False if decision is unknown, expired or already rewarded
+        """
+        slot = decision_id % self.capacity
+        if decision_id < self._oldest_seq or self._seqs[slot] != decision_id:
+            return False
+
+        self._seqs[slot] = _RESOLVED
+        self._pending -= 1
+        self.mab.update(int(self._arms[slot]), reward)
+        return True
+
+    def reward_many(self, decision_ids, rewards) -> int:
+        """ Apply batch of rewards with one update_many call.
+            Unknown, expired and repeated ids are skipped
+
+        Args:
+            decision_ids (array-like of int): ids returned by selection
+            rewards (array-like of float): rewards
+
+        Returns:
+            int: number of applied rewards
+        """
+        decision_ids = np.asarray(decision_ids, dtype=np.int64)
+        rewards = np.asarray(rewards, dtype=np.float64)
+        decision_ids, first = np.unique(decision_ids, return_index=True)
+        rewards = rewards[first]
+
+        slots = decision_ids % self.capacity
+        valid = (decision_ids >= self._oldest_seq) & (self._seqs[slots] == decision_ids)
+        slots = slots[valid]
+        if len(slots):
+            self._seqs[slots] = _RESOLVED
+            self._pending -= len(slots)
+            self.mab.update_many(self._arms[slots], rewards[valid])
+        return len(slots)
@@ -0,0 +1,128 @@
+"""
+    Precomputed decision tables for high-QPS selection
+"""
+from time import monotonic
+from typing import List, Optional, Union
+import numpy as np
+from mab.alias import AliasTable
+from mab.mab import MAB
+
+
+class DecisionTable:
+    """
+    Multiarm Bandit serving selections from precomputed alias table
+
+    Alias table over arm_probabilities() of the bandit is rebuilt every
+    rebuild_every updates or max_age seconds (whichever comes first), and
+    selections between rebuilds are O(1) draws from it. Decisions use
+    the state up to rebuild_every updates or max_age seconds old.
+    Call rebuild after changing active arms. State changing with selections
+    (decaying epsilon) advances with every served selection.
+
+    ...
+
+    Attributes:
+    ----------
+
+    mab: MAB
+        multiarm bandit with arm_probabilities (EpsilonGreedy, Softmax, UCB1, ...)
+
+    rebuild_every : int
+        maximum number of updates between rebuilds
+
+    max_age : float
+        maximum seconds between rebuilds (None to rebuild only by updates)
+
+    rebuilds : int
+        number of built tables
+
+    Methods:
+    -----------
+    select_arm(), select_version(), select_arms(n), select_versions(n)
+        select with the table
+
+    update(chosen_arm, reward), update_many(chosen_arms, rewards)
+        update the bandit
+
+    rebuild()
+        build the table with the current state
+    """
+
+    def __init__(
+        self, mab: MAB, rebuild_every: int = 1000, max_age: Optional[float] = 0.01
+    ):
+        """
+        Args:
+            mab (MAB): multiarm bandit
+            rebuild_every (int, optional): maximum updates between rebuilds.
+                Defaults to 1000.
+            max_age (float, optional): maximum seconds between rebuilds.
+                Defaults to 0.01.
+        """
+        self.mab = mab
+        self.rebuild_every = rebuild_every
+        self.max_age = max_age
+        self.rebuilds = 0
+
+        self._table: Optional[AliasTable] = None
+        self._updates = 0
+        self._built_at = 0.0
+
+    def rebuild(self):
+        """Build the table with the current state of the bandit"""
+        probabilities = self.mab.arm_probabilities()
+        arms = np.flatnonzero(probabilities)
+        self._table = AliasTable(probabilities[arms], arms)
+        self._updates = 0
+        self._built_at = monotonic()
+        self.rebuilds += 1
+
+    def _current_table(self) -> AliasTable:
+        if (
+            self._table is None
+            or self._updates >= self.rebuild_every
+            or (self.max_age is not None and monotonic() - self._built_at >= self.max_age)
+        ):
+            self.rebuild()
+        return self._table
+
+    def select_arm(self) -> int:
+        """Select arm with the table. O(1) between rebuilds"""
+        arm = self._current_table().draw(self.mab._uniform())
+        self.mab._advance(1)
+        return arm
+
+    def select_version(self) -> str:
+        """Select version with the table"""
+        return self.mab.version_ids[self.select_arm()]
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """Select n arms with the table"""
+        arms = self._current_table().draw_many(self.mab._rng.random(n))
+        self.mab._advance(n)
+        return arms
+
+    def select_versions(self, n: int) -> List[str]:
+        """Select n versions with the table"""
+        version_ids = self.mab.version_ids
+        return [version_ids[arm] for arm in self.select_arms(n).tolist()]
+
+    def update(self, chosen_arm: Union[int, str], reward: float):
+        """ Update the bandit
+
+        Args:
+            chosen_arm (int or str): arm index or version_id
+            reward (float): reward
+        """
+        self.mab.update(chosen_arm, reward)
+        self._updates += 1
+
+    def update_many(self, chosen_arms, rewards):
+        """ Update the bandit with the batch of rewards
+
+        Args:
+            chosen_arms (array-like of int or str): arm indexes or version_ids
+            rewards (array-like of float): rewards
+        """
+        self.mab.update_many(chosen_arms, rewards)
+        self._updates += len(rewards)
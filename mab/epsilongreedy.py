@@ -2,9 +2,9 @@
     EpsilonGreedy Muli-armed banded
 """
 
-import random
 from typing import List, Set
-from mab.mab import MAB
+import numpy as np
+from mab.mab import MAB, Seed
 
 
 class EpsilonGreedy(MAB):
@@ -47,6 +47,9 @@ class EpsilonGreedy(MAB):
     select_arm()
         select index of arm to chose next (the core of the algorithm)
 
+    select_arms(n)
+        select n arms at once
+
     update(chosen_arm, reward)
         updated chosen arm with the received reward
     """
@@ -61,6 +64,8 @@ class EpsilonGreedy(MAB):
         version_ids: List[str] = None,
         active_arms: Set[int] = None,
         weakness_mult: float = None,
+        array_backed: bool = False,
+        seed: Seed = None,
     ):
         """
         Args:
@@ -80,8 +85,14 @@ class EpsilonGreedy(MAB):
                 The idea is to decrease epsilon by that values 
 
             active_arms (set): list with indexes of active versions
+
+            array_backed (bool): store per-arm state as numpy arrays. Defaults to False
+            seed (int, SeedSequence or Generator, optional): seed of the instance
+                random generator. Defaults to fresh entropy
         """
-        super().__init__(counts, values, n_arms, version_ids, active_arms)
+        super().__init__(
+            counts, values, n_arms, version_ids, active_arms, array_backed, seed
+        )
         self.epsilon = epsilon  # probablity of choosing random arm
         self.weakness_mult = None
 
@@ -113,23 +124,64 @@ class EpsilonGreedy(MAB):
         Returns:
             int: arm to select next
         """
-        if self.weakness_mult is not None:
-            self.epsilon *= self.weakness_mult
+        self._advance(1)
+
+        if self._uniform() > self.epsilon:
+            # the best active arm (the first one in case of ties)
+            if self._arm_state is None:
+                return max(self.active_arms, key=self.values.__getitem__)
+            values = np.where(self._active_mask(), self.values, -np.inf)
+            return int(np.argmax(values))
 
-        def argmax(values, active_arms):
-            max_val = -1
-            ind = 0
-            for i, val in enumerate(values):
-                if i in active_arms and val > max_val:
-                    max_val = val
-                    ind = i
+        return self.active_arms[int(self._uniform() * len(self.active_arms))]
 
-            return ind
+    def select_arms(self, n: int) -> np.ndarray:
+        """EpsilonGreedy for n arms at once
 
-        if random.random() > self.epsilon:
-            return argmax(self.values, self.active_arms)
+        Args:
+            n (int): number of arms to select
 
-        return random.sample(self.active_arms, 1)[0]
+        Returns:
+            np.ndarray: indexes of the selected arms
+        """
+        if self.weakness_mult is not None:
+            epsilon = self.epsilon * self.weakness_mult ** np.arange(1, n + 1)
+        else:
+            epsilon = self.epsilon
+        self._advance(n)
+
+        values = np.where(self._active_mask(), self.values, -np.inf)
+        arms = np.full(n, np.argmax(values), dtype=np.int64)
+
+        explore = self._rng.random(n) <= epsilon
+        active_arms = np.asarray(self.active_arms, dtype=np.int64)
+        arms[explore] = active_arms[
+            self._rng.integers(len(active_arms), size=int(explore.sum()))
+        ]
+        return arms
+
+    def _continue_selections(self, previous):
+        """Take random generator and epsilon decayed by selections of the previous copy"""
+        super()._continue_selections(previous)
+        if self.weakness_mult is not None:
+            self.epsilon = previous.epsilon
+
+    def _advance(self, n: int):
+        """Decay epsilon by n selections"""
+        if self.weakness_mult is not None:
+            self.epsilon *= self.weakness_mult ** n
+
+    def arm_probabilities(self) -> np.ndarray:
+        """Probabilities of selecting each arm with the current epsilon
+
+        Returns:
+            np.ndarray: probabilities of the arms
+        """
+        probabilities = np.zeros(self.n_arms)
+        probabilities[self.active_arms] = self.epsilon / len(self.active_arms)
+        values = np.where(self._active_mask(), self.values, -np.inf)
+        probabilities[np.argmax(values)] += 1.0 - self.epsilon
+        return probabilities
 
     def reset(self):
         """Reset the Algorythm to the initial state"""
@@ -0,0 +1,310 @@
+"""
+    Append-only update log of Multiarm Bandit with snapshot compaction
+
+    Directory layout:
+
+    snapshot      generation (uint64) and binary snapshot of the state
+    log.<gen>     fixed 16 bytes records appended after the snapshot <gen>
+
+    Record is kind (uint8), 3 bytes padding, arm (uint32), reward (float64).
+    ADD_ARM record keeps length of the version id in arm and is_active in reward
+    and is followed by VERSION records with 15 bytes of the utf-8 version id each.
+"""
+import os
+from typing import Optional, Union
+import numpy as np
+from mab.mab import MAB
+from mab.snapshot import from_bytes
+
+UPDATE = 0
+ADD_ARM = 1
+ACTIVATE = 2
+DEACTIVATE = 3
+VERSION = 255
+
+RECORD = np.dtype([("kind", "u1"), ("pad", "u1", 3), ("arm", "<u4"), ("reward", "<f8")])
+_CHUNK = RECORD.itemsize - 1
+_GENERATION = np.dtype("<u8")
+
+_SNAPSHOT = "snapshot"
+
+
+class UpdateLog:
+    """
+    Durable Multiarm Bandit with append-only update log
+
+    Every change (update, add_arm, activate_arm, deactivate_arm) is applied to
+    the bandit and appended to the log. Records are buffered and written on
+    flush (or when buffer is full). Every compact_every records the state is
+    written as new snapshot and the log starts over. On start the snapshot is
+    loaded and the log is replayed with update_many between the arm events.
+
+    ...
+
+    Attributes:
+    ----------
+
+    path : str
+        directory of the snapshot and the log
+
+    mab: MAB
+        recovered multiarm bandit (changes must go through the log)
+
+    compact_every : int
+        number of records to trigger compaction
+
+    buffer_size : int
+        number of records buffered before write
+
+    replayed : int
+        number of records replayed on start
+
+    Methods:
+    -----------
+    update(chosen_arm, reward), update_many(chosen_arms, rewards)
+        apply and log updates
+
+    add_arm(version_id, is_active), activate_arm(index), deactivate_arm(index)
+        apply and log arm events
+
+    flush()
+        write buffered records (and fsync)
+
+    compact()
+        write snapshot and start new log
+
+    close()
+        flush and close the log (or use "with")
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        path: str,
+        mab: Optional[MAB] = None,
+        compact_every: int = 1_000_000,
+        buffer_size: int = 1024,
+        fsync: bool = True,
+    ):
+        """ Open the log and recover the bandit if the directory has a snapshot
+
+        Args:
+            path (str): directory of the snapshot and the log
+            mab (MAB, optional): initial bandit for the new directory.
+                Ignored if the directory has a snapshot
+            compact_every (int, optional): records to trigger compaction.
+                Defaults to 1_000_000.
+            buffer_size (int, optional): records buffered before write. Defaults to 1024.
+            fsync (bool, optional): fsync on flush. Defaults to True.
+        """
+        self.path = path
+        self.compact_every = compact_every
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.replayed = 0
+
+        self._buffer = np.zeros(buffer_size, dtype=RECORD)
+        self._buffered = 0
+        self._records = 0
+        self._file = None
+
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(self._snapshot_path()):
+            self._generation, self.mab = self._read_snapshot()
+            self._replay()
+        else:
+            if mab is None:
+                raise ValueError(f"No snapshot in {path}, initial mab is required")
+            self.mab = mab
+            self._generation = 0
+            self._write_snapshot()
+            # log left without snapshot belongs to another bandit
+            open(self._log_path(self._generation), "wb").close()
+        self._remove_stale_logs()
+        self._file = open(self._log_path(self._generation), "ab")
+
+    def _snapshot_path(self) -> str:
+        return os.path.join(self.path, _SNAPSHOT)
+
+    def _log_path(self, generation: int) -> str:
+        return os.path.join(self.path, f"log.{generation}")
+
+    def _read_snapshot(self):
+        with open(self._snapshot_path(), "rb") as file:
+            data = bytearray(file.read())
+        generation = int(np.frombuffer(data, dtype=_GENERATION, count=1)[0])
+        return generation, from_bytes(memoryview(data)[_GENERATION.itemsize :])
+
+    def _write_snapshot(self):
+        path = self._snapshot_path()
+        with open(path + ".tmp", "wb") as file:
+            file.write(np.array([self._generation], dtype=_GENERATION).tobytes())
+            file.write(self.mab.to_bytes())
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(path + ".tmp", path)
+
+    def _remove_stale_logs(self):
+        current = f"log.{self._generation}"
+        for name in os.listdir(self.path):
+            if name.startswith("log.") and name != current:
+                os.remove(os.path.join(self.path, name))
+
+    def _replay(self):
+        """Apply records of the current log to the bandit"""
+        path = self._log_path(self._generation)
+        if not os.path.exists(path):
+            return
+        # a torn record at the end of the log is ignored
+        count = os.path.getsize(path) // RECORD.itemsize
+        records = np.fromfile(path, dtype=RECORD, count=count)
+        kinds, arms, rewards = records["kind"], records["arm"], records["reward"]
+
+        start = 0
+        for position in np.flatnonzero(kinds != UPDATE):
+            if position < start:
+                continue  # VERSION records of the ADD_ARM
+            if start < position:
+                self.mab.update_many(arms[start:position], rewards[start:position])
+            start = position + 1
+
+            kind, arm = kinds[position], int(arms[position])
+            if kind == ADD_ARM:
+                n_chunks = -(-arm // _CHUNK)
+                if start + n_chunks > len(records):
+                    count = position  # torn version id
+                    break
+                chunks = records[start : start + n_chunks].view(np.uint8)
+                chunks = chunks.reshape(n_chunks, RECORD.itemsize)[:, 1:]
+                version_id = chunks.tobytes()[:arm].decode()
+                self.mab.add_arm(version_id, is_active=bool(rewards[position]))
+                start += n_chunks
+            elif kind == ACTIVATE:
+                self.mab.activate_arm(arm)
+            elif kind == DEACTIVATE:
+                self.mab.deactivate_arm(arm)
+        else:
+            if start < count:
+                self.mab.update_many(arms[start:], rewards[start:])
+
+        self.replayed = self._records = count
+        if count * RECORD.itemsize != os.path.getsize(path):
+            with open(path, "r+b") as file:
+                file.truncate(count * RECORD.itemsize)
+
+    def _append(self, kind: int, arm: int = 0, reward: float = 0.0):
+        if self._buffered == self.buffer_size:
+            self._write()
+        self._buffer[self._buffered] = (kind, 0, arm, reward)
+        self._buffered += 1
+        self._records += 1
+
+    def _write(self, records: Optional[np.ndarray] = None):
+        self._file.write(self._buffer[: self._buffered].tobytes())
+        self._buffered = 0
+        if records is not None:
+            self._file.write(records.tobytes())
+            self._records += len(records)
+
+    def _maybe_compact(self):
+        if self._records >= self.compact_every:
+            self.compact()
+
+    def update(self, chosen_arm: Union[int, str], reward: float):
+        """ Apply and log update
+
+        Args:
+            chosen_arm (int or str): arm index or version_id
+            reward (float): reward
+        """
+        if isinstance(chosen_arm, str):
+            chosen_arm = self.mab.version_id_index(chosen_arm)
+        self.mab.update(chosen_arm, reward)
+        self._append(UPDATE, chosen_arm, reward)
+        self._maybe_compact()
+
+    def update_many(self, chosen_arms, rewards):
+        """ Apply and log batch of updates
+
+        Args:
+            chosen_arms (array-like of int or str): arm indexes or version_ids
+            rewards (array-like of float): rewards
+        """
+        chosen_arms = self.mab._arm_indexes(chosen_arms)
+        rewards = np.asarray(rewards, dtype=np.float64)
+        self.mab.update_many(chosen_arms, rewards)
+
+        records = np.zeros(len(chosen_arms), dtype=RECORD)
+        records["arm"] = chosen_arms
+        records["reward"] = rewards
+        self._write(records)
+        self._maybe_compact()
+
+    def add_arm(self, version_id: str = None, is_active: bool = True):
+        """ Apply and log adding of the arm
+
+        Args:
+            version_id (str, optional): version id of the arm. Defaults to None.
+            is_active (bool, optional): activate the arm. Defaults to True.
+        """
+        self.mab.add_arm(version_id, is_active)
+        encoded = self.mab.version_ids[-1].encode()
+        self._append(ADD_ARM, len(encoded), float(is_active))
+
+        n_chunks = -(-len(encoded) // _CHUNK)
+        chunks = np.zeros((n_chunks, RECORD.itemsize), dtype=np.uint8)
+        chunks[:, 0] = VERSION
+        chunks[:, 1:] = np.frombuffer(
+            encoded.ljust(n_chunks * _CHUNK, b"\0"), np.uint8
+        ).reshape(n_chunks, _CHUNK)
+        self._write(chunks.view(RECORD).reshape(-1))
+        self._maybe_compact()
+
+    def activate_arm(self, index: int):
+        """ Apply and log activation of the arm
+
+        Args:
+            index (int): index of the arm
+        """
+        self.mab.activate_arm(index)
+        self._append(ACTIVATE, index)
+
+    def deactivate_arm(self, index: int):
+        """ Apply and log deactivation of the arm
+
+        Args:
+            index (int): index of the arm
+        """
+        self.mab.deactivate_arm(index)
+        self._append(DEACTIVATE, index)
+
+    def flush(self):
+        """Write buffered records to the log (and fsync)"""
+        self._write()
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def compact(self):
+        """ Write snapshot of the current state and start new log.
+            Crash at any moment leaves either old or new snapshot with its log
+        """
+        self.flush()
+        self._file.close()
+        self._generation += 1
+        self._file = open(self._log_path(self._generation), "wb")
+        self._write_snapshot()
+        self._remove_stale_logs()
+        self._records = 0
+
+    def close(self):
+        """Write buffered records and close the log"""
+        if self._file is not None and not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,10 +1,35 @@
 """
     Mulitarm Bandint base Class
 """
+import copy
 import pickle
 import codecs
+import uuid
+from bisect import bisect_left, insort
 from typing import List, Union
 from abc import ABC
+import numpy as np
+from mab.armstate import ArmState
+
+# seed of the per-instance random generator (np.random.default_rng argument)
+Seed = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+
+def spawn_seeds(seed: Seed, n: int) -> list:
+    """ Independent child seeds for n random generators (SeedSequence.spawn)
+
+    Args:
+        seed (int, SeedSequence or Generator, optional): parent seed
+        n (int): number of seeds
+
+    Returns:
+        list: seeds for np.random.default_rng
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed.spawn(n)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(n)
 
 
 class MAB(ABC):
@@ -28,6 +53,10 @@ class MAB(ABC):
     version_ids: list
         list of version_ids
 
+    array_backed: bool
+        if True per-arm state (counts, values, ...) is stored
+        as contiguous numpy arrays instead of lists
+
     Methods:
     -----------
     reset()
@@ -40,12 +69,30 @@ class MAB(ABC):
         return version_id for the selected arm 
         (same as select_arm but with version id as output)
 
+    select_arms(n)
+        select indexes of n arms at once
+
+    select_versions(n)
+        return version_ids for n selected arms
+
+    arm_probabilities()
+        return probabilities of selecting each arm
+
     update(chosen_arm, reward)
         updated chosen arm with the received reward
 
+    update_many(chosen_arms, rewards)
+        update arms with the batch of rewards
+
     pickle()
         return pickled self as encoded string
 
+    to_bytes()
+        return compact binary snapshot of self
+
+    export_delta(full), merge(other)
+        exchange learning with copies of the bandit on other nodes
+
     """
 
     counts: List[int] = None
@@ -53,6 +100,10 @@ class MAB(ABC):
     n_arms: int = None
     version_ids: List[str] = None
     active_arms: List[int] = None
+    array_backed: bool = False
+
+    # per-arm state: name -> (dtype when array backed, value for the new arms)
+    _ARM_COLUMNS = {"counts": (np.int64, 0), "values": (np.float64, 0.0)}
 
     # pylint: disable=too-many-arguments
     # pylint: disable=too-many-instance-attributes
@@ -63,6 +114,8 @@ class MAB(ABC):
         n_arms: int = None,
         version_ids: List[str] = None,
         active_arms: List[int] = None,
+        array_backed: bool = False,
+        seed: Seed = None,
     ):
         """
         Args:
@@ -73,6 +126,9 @@ class MAB(ABC):
             n_arms (int): Number of arms. Defaults to len(counts)
             version_ids (list of strings): List with version ids to return
             active_arms (set): set of indexes of active arms
+            array_backed (bool): store per-arm state as numpy arrays. Defaults to False
+            seed (int, SeedSequence or Generator, optional): seed of the instance
+                random generator. Defaults to fresh entropy
         """
         if counts is None:
             # set up with zeroes if not defined
@@ -84,12 +140,16 @@ class MAB(ABC):
                 assert n_arms == len(counts)
 
         self.n_arms = len(counts)
-        self.counts = counts  # number of counts chose for each arm
-        self.values = values  # success rate for each arm
+        self.array_backed = array_backed
+        self._arm_state = ArmState(self.n_arms) if array_backed else None
 
         # we need save start values for reset calls
-        self.__init_counts = counts[:]
-        self.__init_values = values[:]
+        self.__init_columns = {}
+
+        # counts: number of counts chose for each arm
+        # values: success rate for each arm
+        self._set_arm_columns(counts=counts, values=values)
+        self._refresh_totals()
 
         if version_ids is None:
             self.version_ids = list(map(str, range(self.n_arms)))
@@ -97,18 +157,84 @@ class MAB(ABC):
             self.version_ids = version_ids
             assert isinstance(version_ids, list)
 
-        self.__version_to_index = {v: i for i, v in enumerate(self.version_ids)}
+        self.__version_to_index = dict(zip(self.version_ids, range(self.n_arms)))
 
         if active_arms is None:
-            active_arms = list(range(self.n_arms))
+            active_arms = range(self.n_arms)
 
-        self.active_arms = active_arms
+        # active arms are indexed twice: sorted list of indexes
+        # and boolean mask for O(1) membership checks
+        self.active_arms = sorted(set(active_arms))
+        self._active_index = ArmState(self.n_arms)
+        self._active_index.add_column("active", np.zeros(self.n_arms), bool, False)
+        self._active_mask()[self.active_arms] = True
+
+        # every instance has its own stream, scalar draws are buffered
+        self._rng = np.random.default_rng(seed)
+        self._uniforms: List[float] = []
+
+        # state merged from other nodes (see mab.merge)
+        self._node_id = uuid.uuid4().hex
+        self._replication = None
 
     def __str__(self):
         return str(self.__class__.__name__)
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        if type(self) is not type(other):
+            return False
+        mine, theirs = dict(self), dict(other)
+        if mine.keys() != theirs.keys():
+            return False
+        for key, val in mine.items():
+            if isinstance(val, np.ndarray) or isinstance(theirs[key], np.ndarray):
+                if not np.array_equal(val, theirs[key]):
+                    return False
+            elif val != theirs[key]:
+                return False
+        return True
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # buffered uniforms are not worth the size of the pickle
+        state["_uniforms"] = []
+        if self._arm_state is not None:
+            # columns are views of the arm state buffers, bind them again on load
+            for name in self._arm_state.columns:
+                del state[name]
+        return state
+
+    def __setstate__(self, state):
+        if "_arm_state" not in state:
+            state = self._upgrade_state(state)
+        self.__dict__.update(state)
+        if self._arm_state is not None:
+            self._bind_arm_state()
+
+    def _upgrade_state(self, state: dict) -> dict:
+        """ State pickled before the private state (arm state, active index,
+            totals, random generator, node id) was added. The missing state is
+            built by __init__ from the public attributes
+
+        Args:
+            state (dict): old state
+
+        Returns:
+            dict: state of the current format
+        """
+        params = {key: val for key, val in state.items() if not key.startswith("_")}
+        upgraded = self.__class__(**params).__dict__
+        # attributes which __init__ derives from the parameters (decayed epsilon)
+        upgraded.update(params)
+        # initial columns were kept one per attribute (_MAB__init_counts, ...)
+        init_columns = upgraded["_MAB__init_columns"]
+        for key, val in state.items():
+            name = key.rpartition("__init_")[2]
+            if key.startswith("_") and "__init_" in key and name in self._ARM_COLUMNS:
+                init_columns[name] = list(val)
+            elif key in upgraded:
+                upgraded[key] = val
+        return upgraded
 
     def __iter__(self):
         # iterator in order to convert the model into dict
@@ -124,13 +250,142 @@ class MAB(ABC):
         Returns:
             [dict]: dictionary with the fields name and params
         """
-        return {"name": self.__class__.__name__, "params": dict(self)}
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from mab.merge import replication_state
+
+        params = {
+            key: val.tolist() if isinstance(val, np.ndarray) else val
+            for key, val in self
+        }
+        return {
+            "name": self.__class__.__name__,
+            "params": params,
+            "replication": replication_state(self),
+        }
+
+    def _set_arm_columns(self, **columns):
+        """ Set per-arm state (counts=..., values=..., ...)
+            columns must be declared in _ARM_COLUMNS
+        """
+        for name, column in columns.items():
+            if self._arm_state is None:
+                self.__init_columns[name] = list(column)
+                setattr(self, name, column)
+            else:
+                dtype, default = self._ARM_COLUMNS[name]
+                self.__init_columns[name] = np.array(column, dtype=dtype)
+                self._arm_state.add_column(name, column, dtype, default)
+                setattr(self, name, self._arm_state.column(name))
+
+    def _bind_arm_state(self):
+        """ Point per-arm attributes to the current arm state buffers """
+        for name in self._arm_state.columns:
+            setattr(self, name, self._arm_state.column(name))
+
+    def _state_changed(self):
+        """ Called after per-arm state or active arms change.
+            Algorithms override it to drop cached values
+        """
+
+    def _state_reloaded(self):
+        """ Called after per-arm state or active arms were replaced in bulk
+            (reset, load_arm_state).
+            Algorithms override it to rebuild incremental values
+        """
+        self._refresh_totals()
+        self._state_changed()
+
+    def load_arm_state(self, **columns):
+        """ Replace per-arm state, e.g. with the state of other process
+
+        Args:
+            columns: new values of per-arm columns (counts=..., values=..., ...)
+        """
+        for name, column in columns.items():
+            assert name in self._ARM_COLUMNS
+            self._assign_arm_column(name, np.asarray(column))
+        self._state_reloaded()
+
+    def _column_increments(self, rewards: np.ndarray) -> dict:
+        """ Increments of additive per-arm columns (besides counts and values)
+            for every reward. Empty for MAB
+
+        Args:
+            rewards (np.ndarray): rewards
+
+        Returns:
+            dict: column name -> increments
+        """
+        return {}
+
+    _UNIFORM_BLOCK = 1024
+    # selections to estimate probabilities of the arms
+    _PROBABILITY_DRAWS = 1024
+
+    def _uniform(self) -> float:
+        """ Uniform number in [0, 1) from the instance random generator.
+            Numbers are drawn in blocks to keep single draws cheap
+        """
+        if not self._uniforms:
+            self._uniforms = self._rng.random(self._UNIFORM_BLOCK).tolist()
+        return self._uniforms.pop()
+
+    def reseed(self, seed: Seed = None):
+        """ Replace the instance random generator
+
+        Args:
+            seed (int, SeedSequence or Generator, optional): new seed.
+                Defaults to fresh entropy
+        """
+        self._rng = np.random.default_rng(seed)
+        self._uniforms = []
+
+    def _continue_selections(self, previous: "MAB"):
+        """ Continue selections of the previous copy of the bandit (after the copy
+            was updated and swapped in): take its random generator.
+            Algorithms override it to take their selection state (AB.current_arm)
+
+        Args:
+            previous (MAB): copy of the bandit used for selections before
+        """
+        self.reseed(previous._rng)
+
+    def _active_mask(self) -> np.ndarray:
+        """ Boolean mask of active arms (writes go to the active index) """
+        return self._active_index.column("active")
+
+    def is_active(self, index: int) -> bool:
+        """ Check if arm is active. O(1)
+
+        Args:
+            index (int): index of the arm
+        """
+        return bool(self._active_mask()[index])
 
     def reset(self):
         """Reset MAB. Sets counts and values to the inital state"""
 
-        self.counts = self.__init_counts[:]
-        self.values = self.__init_values[:]
+        for name, init_column in self.__init_columns.items():
+            # arms added after init get the default values
+            _, default = self._ARM_COLUMNS[name]
+            if self._arm_state is None:
+                column = init_column + [default] * (self.n_arms - len(init_column))
+                setattr(self, name, column)
+            else:
+                column = getattr(self, name)
+                column[: len(init_column)] = init_column
+                column[len(init_column) :] = default
+
+        self._replication = None
+        self._state_reloaded()
+
+    def _initial_arm_column(self, name: str) -> np.ndarray:
+        """ Initial values of per-arm column (defaults for arms added after init) """
+        _, default = self._ARM_COLUMNS[name]
+        init_column = np.asarray(self.__init_columns[name])
+        column = np.full(self.n_arms, default, dtype=init_column.dtype)
+        column[: len(init_column)] = init_column
+        return column
 
     def select_arm(self) -> int:
         """Select Arm of MAB:
@@ -143,6 +398,53 @@ class MAB(ABC):
         """
         return self.version_ids[self.select_arm()]
 
+    def select_arms(self, n: int) -> np.ndarray:
+        """Select n arms at once (burst of decisions with the same state)
+           Algorithms override it with the vectorized implementation
+
+        Args:
+            n (int): number of arms to select
+
+        Returns:
+            np.ndarray: indexes of the selected arms
+        """
+        return np.fromiter((self.select_arm() for _ in range(n)), dtype=np.int64, count=n)
+
+    def select_versions(self, n: int) -> List[str]:
+        """ return version_ids for n selected arms
+
+        Args:
+            n (int): number of versions to select
+
+        Returns:
+            List[str]: selected version ids
+        """
+        version_ids = self.version_ids
+        return [version_ids[arm] for arm in self.select_arms(n).tolist()]
+
+    def arm_probabilities(self) -> np.ndarray:
+        """ Probabilities of selecting each arm with the current state.
+            Used to precompute decision tables (see mab.decisiontable)
+
+        Returns:
+            np.ndarray: probabilities of the arms (zero for inactive ones)
+        """
+        # estimated with selections of the copy, algorithms with known
+        # distribution override it
+        replica = copy.deepcopy(self)
+        replica.reseed(spawn_seeds(self._rng, 1)[0])
+        selections = replica.select_arms(self._PROBABILITY_DRAWS)
+        return np.bincount(selections, minlength=self.n_arms) / self._PROBABILITY_DRAWS
+
+    def _advance(self, n: int):
+        """ Advance the state which changes with every selection (like decaying
+            epsilon) by n selections made without select_arm (see mab.decisiontable).
+            Nothing for MAB
+
+        Args:
+            n (int): number of selections
+        """
+
     def update(self, chosen_arm: Union[int, str], reward: float) -> None:
         """Update chosen arm
 
@@ -155,30 +457,104 @@ class MAB(ABC):
 
         self.counts[chosen_arm] += 1
         count = self.counts[chosen_arm]
-        self.values[chosen_arm] = ((count - 1) / count) * self.values[
-            chosen_arm
-        ] + reward / count
+        value = self.values[chosen_arm]
+        self.values[chosen_arm] = ((count - 1) / count) * value + reward / count
 
-    def compare_to_ab(self):
-        """Compare collected rewards agains potential AB test ones
-           ## TODO run it on fly when we're updating 
-           # rewards now the operation in O(narms) the other case would be O(1)
+        self._total_count += 1
+        self._total_reward += reward
+        self._values_sum += self.values[chosen_arm] - value
+        self._state_changed()
+
+    def update_many(self, chosen_arms, rewards) -> None:
+        """Update arms with the batch of rewards.
+           Gives the same state as calling update for every pair
+
+        Args:
+            chosen_arms (array-like of int or str): arm indexes or version_ids
+            rewards (array-like of float): rewards
         """
+        chosen_arms = self._arm_indexes(chosen_arms)
+        rewards = np.asarray(rewards, dtype=np.float64)
+        assert chosen_arms.shape == rewards.shape
+
+        counts_delta = np.bincount(chosen_arms, minlength=self.n_arms)
+        rewards_delta = np.bincount(chosen_arms, weights=rewards, minlength=self.n_arms)
+
+        counts = np.asarray(self.counts)
+        values = np.array(self.values, dtype=np.float64)
+        new_counts = counts + counts_delta
+
+        # running mean of all the rewards for the updated arms
+        updated = counts_delta > 0
+        values[updated] = (
+            values[updated] * counts[updated] + rewards_delta[updated]
+        ) / new_counts[updated]
+
+        self._total_count += len(chosen_arms)
+        self._total_reward += float(rewards.sum())
+        self._values_sum += float(
+            (values[updated] - np.asarray(self.values, dtype=np.float64)[updated]).sum()
+        )
+
+        self._assign_arm_column("counts", new_counts)
+        self._assign_arm_column("values", values)
+        self._state_changed()
+
+    def _arm_indexes(self, chosen_arms) -> np.ndarray:
+        """ Convert arm indexes or version_ids into array of arm indexes """
+        chosen_arms = np.asarray(chosen_arms)
+        if chosen_arms.dtype.kind in "iu":
+            return chosen_arms.astype(np.int64, copy=False)
+
+        version_to_index = self.__version_to_index
+        return np.fromiter(
+            (version_to_index[v] for v in chosen_arms.tolist()),
+            dtype=np.int64,
+            count=len(chosen_arms),
+        )
+
+    def _assign_arm_column(self, name: str, column: np.ndarray):
+        """ Write new values of per-arm column keeping its storage """
+        if self._arm_state is None:
+            getattr(self, name)[:] = column.tolist()
+        else:
+            getattr(self, name)[:] = column
+
+    def _refresh_totals(self):
+        """ Recalculate running totals used by compare_to_ab from per-arm state """
+        counts = np.asarray(self.counts)
+        values = np.asarray(self.values, dtype=np.float64)
+        self._total_count = int(counts.sum())
+        self._total_reward = float(values @ counts)
+        self._values_sum = float(values.sum())
+
+    @property
+    def total_count(self) -> int:
+        """ Number of updates for all the arms """
+        return self._total_count
+
+    @property
+    def total_reward(self) -> float:
+        """ Sum of the rewards for all the arms """
+        return self._total_reward
+
+    @property
+    def difference_to_ab(self) -> float:
+        """ Collected rewards minus potential AB test ones. O(1) """
 
         # AB_rewards 2 cases n/2 * (rewards_1/counts_1) + n/2 * (rewards_2/counts_2) which is euqal
         # AB_rewards = n/2 (rewards_1/counts_1 + rewards_2/counts_2 )
         # rewards_1/counts_1 == values_1
-        # below is the caclulation of the second multiplier
-        ab_rewards = 0
-        total_rewards = 0
-        for i in range(self.n_arms):
-            ab_rewards += self.values[i]
-            total_rewards += self.values[i] * self.counts[i]
+        # multiply by total_count // n_arms. // operator to make it as integer for vis purposes
+        ab_rewards = self._values_sum * (self._total_count // self.n_arms)
 
-        # multiply result // n_arms. // operator to make it as integer for vis purposes
-        ab_rewards *= sum(self.counts) // self.n_arms
+        return self._total_reward - ab_rewards
 
-        return total_rewards - ab_rewards
+    def compare_to_ab(self):
+        """Compare collected rewards agains potential AB test ones
+           Totals are kept on fly while updating so it's O(1)
+        """
+        return self.difference_to_ab
 
     def pickle(self) -> str:
         """ Pickle itself into a string
@@ -189,6 +565,70 @@ class MAB(ABC):
 
         return codecs.encode(pickle.dumps(self), "base64").decode()
 
+    def to_bytes(self) -> bytes:
+        """ Serialize itself into compact binary snapshot.
+            Restore it with mab.snapshot.from_bytes
+
+        Returns:
+            [bytes]: snapshot with raw per-arm arrays
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from mab.snapshot import to_bytes
+
+        return to_bytes(self)
+
+    @property
+    def node_id(self) -> str:
+        """ Id of the node in merges. Random by default, kept by snapshots
+            (to_bytes, to_dict, pickle, deepcopy). New nodes are made with fork()
+        """
+        return self._node_id
+
+    @node_id.setter
+    def node_id(self, node_id: str):
+        self._node_id = node_id
+
+    def fork(self) -> "MAB":
+        """ Copy of the bandit as a new node for merges. The copy has merged
+            the learning of this node, so it isn't counted twice
+
+        Returns:
+            [MAB]: copy with new node_id
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from mab.merge import fork
+
+        replica = copy.deepcopy(self)
+        fork(replica)
+        return replica
+
+    def export_delta(self, full: bool = False) -> dict:
+        """ Export learning of this node to merge into copies on other nodes
+
+        Args:
+            full (bool, optional): export all the arms and all the known nodes
+                instead of own changes since the last export. Defaults to False.
+
+        Returns:
+            [dict]: delta for merge
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from mab.merge import export_delta
+
+        return export_delta(self, full)
+
+    def merge(self, other):
+        """ Merge delta or other bandit. Counts, values and additive parameters
+            are combined exactly and merging the same delta twice changes nothing
+
+        Args:
+            other (dict or MAB): delta from export_delta or bandit of other node
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from mab.merge import merge
+
+        merge(self, other)
+
     def add_version(self, version_id: str = None, is_active: bool = True):
         """ Add version to MAB
             Same as add ARM
@@ -205,9 +645,15 @@ class MAB(ABC):
             is_active (bool, optional): parameter if new version is active
         """
 
-        self.counts.append(0)
-        self.values.append(0.0)
+        if self._arm_state is None:
+            for name, (_, default) in self._ARM_COLUMNS.items():
+                getattr(self, name).append(default)
+        else:
+            self._arm_state.append()
+            self._bind_arm_state()
+        self._active_index.append()
         self.n_arms += 1
+        self._state_changed()
 
         if version_id is None:
             # add version as sting of n_arms if not defined
@@ -219,6 +665,57 @@ class MAB(ABC):
         if is_active:
             self.activate_arm(self.n_arms - 1)
 
+    def _set_active(self, index: int, is_active: bool) -> bool:
+        """ Flip arm in the active index without any checks
+
+        Args:
+            index (int): index of the arm
+            is_active (bool): new state of the arm
+
+        Returns:
+            bool: True if the state changed
+        """
+        mask = self._active_mask()
+        if mask[index] == is_active:
+            return False
+
+        mask[index] = is_active
+        if is_active:
+            insort(self.active_arms, index)
+            self._active_changed([index], [])
+        else:
+            del self.active_arms[bisect_left(self.active_arms, index)]
+            self._active_changed([], [index])
+        return True
+
+    def _swap_active(self, activate: List[int], deactivate: List[int]):
+        """ Activate and deactivate arms at once. New active arms and mask are
+            built aside and swapped in with one assignment each, so threads
+            selecting while the settings are applied (see SettingsWatcher)
+            see either the old or the new active arms, never a half changed list
+
+        Args:
+            activate (list[int]): indexes of inactive arms to activate
+            deactivate (list[int]): indexes of active arms to deactivate
+        """
+        mask = self._active_mask().copy()
+        mask[activate] = True
+        mask[deactivate] = False
+        active_arms = np.flatnonzero(mask).tolist()
+
+        self._active_index.add_column("active", mask, bool, False)
+        self.active_arms = active_arms
+        self._active_changed(activate, deactivate)
+
+    def _active_changed(self, activated: List[int], deactivated: List[int]):
+        """ Called after arms were activated or deactivated.
+            Algorithms override it to keep incremental values of active arms
+
+        Args:
+            activated (list[int]): indexes of activated arms
+            deactivated (list[int]): indexes of deactivated arms
+        """
+
     def activate_arm(self, index: int):
         """ Make inactive (or active) version active
 
@@ -226,7 +723,8 @@ class MAB(ABC):
             index (int): index of the arm
         """
         assert index < self.n_arms
-        self.active_arms.append(index)
+        if self._set_active(index, True):
+            self._state_changed()
 
     def activate_version(self, version_id):
         """ Activate MAB arm with id as version_id
@@ -242,8 +740,8 @@ class MAB(ABC):
         Args:
             index (int): index of the arm
         """
-        if index in self.active_arms and len(self.active_arms) > 2:
-            self.active_arms.remove(index)
+        if len(self.active_arms) > 2 and self._set_active(index, False):
+            self._state_changed()
 
     def deactivate_version(self, version_id):
         """ Make active (or inactive we don't through exception here) version inactive
@@ -263,23 +761,34 @@ class MAB(ABC):
 
     def sync_settings(self, mab_settings: dict):
         """ Syncornize MAB with external settings
-            for now is update if new arms in settings or if any arm became active or not active
+            for now is update if new arms in settings or if any arm became active or not active.
+            Only the difference with the current arm table is applied,
+            state of the arms is kept
 
         Args:
-            mab_settings (dict): [description]
+            mab_settings (dict): settings with the list of active_versions
         """
 
         active_versions = mab_settings["active_versions"]
+        version_to_index = self.__version_to_index
 
         # update new versions is not found
         for version in active_versions:
-            if version not in self.version_ids:
-                self.version_ids.append(version)
-                self.__version_to_index[version] = self.n_arms
-                self.n_arms += 1
+            if version not in version_to_index:
+                self.add_arm(version, is_active=False)
+
+        wanted = {version_to_index[v] for v in active_versions}
+        mask = self._active_mask()
+        activate = [index for index in wanted if not mask[index]]
+        if len(wanted) - len(activate) == len(self.active_arms):
+            # every active arm stays active
+            deactivate = []
+        else:
+            deactivate = [index for index in self.active_arms if index not in wanted]
 
-        # rewrite active arms
-        self.active_arms = list({self.__version_to_index[v] for v in active_versions})
+        if activate or deactivate:
+            self._swap_active(activate, deactivate)
+            self._state_changed()
 
     @property
     def active_versions(self) -> List[str]:
@@ -0,0 +1,262 @@
+"""
+    Mergeable state of Multiarm Bandits (G-counter per node)
+
+    Every node (copy of the bandit) owns its contribution: counts, sums of
+    rewards and additive columns (like BetaTS alpha/beta) on top of the initial
+    state. Delta is a dict of contributions keyed by node id and version id:
+
+    {node_id: {"version_ids": [...], "counts": [...], "rewards": [...], "alpha": [...]}}
+
+    Contributions only grow with counts, so merge keeps the entry with bigger
+    count per (node, version) and applying the same delta twice changes nothing.
+    Own contribution isn't stored: it is the state minus the initial state
+    minus merged contributions of other nodes, so update path has no overhead.
+
+    Snapshots (to_bytes, to_dict, pickle) and deepcopy keep the node id and the
+    ledger, so the restored bandit is the same node. New nodes are made with
+    MAB.fork(): the copy gets new id and has merged the contribution of the
+    original. Merging updates of own node id unknown to the node (deepcopy
+    updated separately) raises ValueError.
+"""
+import uuid
+from typing import Dict, List, Optional, Union
+import numpy as np
+
+
+class _Replication:
+    """Contributions of other nodes merged into the bandit"""
+
+    # pylint: disable=too-few-public-methods
+    def __init__(self):
+        # node id -> version id -> contribution row (counts, rewards, *additive columns)
+        self.ledger: Dict[str, Dict[str, np.ndarray]] = {}
+        # version id -> own contribution row sent with the last delta
+        self.exported: Dict[str, np.ndarray] = {}
+        # version id -> row of the state without contributions of any node
+        # (restored bandits, initial state is used if None)
+        self.base: Optional[Dict[str, np.ndarray]] = None
+
+
+def _columns(mab) -> List[str]:
+    """Names of additive contribution columns"""
+    return ["counts", "rewards"] + list(mab._column_increments(np.empty(0)))
+
+
+def _additive_state(mab, initial: bool = False) -> np.ndarray:
+    """Per-arm rows of counts, reward sums and additive columns"""
+    column = mab._initial_arm_column if initial else lambda name: getattr(mab, name)
+    counts = np.asarray(column("counts"), dtype=np.float64)
+    rows = [counts, np.asarray(column("values"), dtype=np.float64) * counts]
+    for name in _columns(mab)[2:]:
+        rows.append(np.asarray(column(name), dtype=np.float64))
+    return np.stack(rows, axis=1)
+
+
+def _replication(mab) -> _Replication:
+    if mab._replication is None:
+        mab._replication = _Replication()
+    return mab._replication
+
+
+def _default_row(mab) -> np.ndarray:
+    """Row of the arm added with the default state"""
+    names = _columns(mab)
+    return np.array([0.0, 0.0] + [mab._ARM_COLUMNS[name][1] for name in names[2:]])
+
+
+def _base(mab) -> np.ndarray:
+    """Per-arm rows of the state without contributions of any node"""
+    replication = mab._replication
+    if replication is None or replication.base is None:
+        return _additive_state(mab, initial=True)
+    base = np.tile(_default_row(mab), (mab.n_arms, 1))
+    for version_id, row in replication.base.items():
+        base[mab.version_id_index(version_id)] = row
+    return base
+
+
+def _own_contribution(mab) -> np.ndarray:
+    own = _additive_state(mab) - _base(mab)
+    for contributions in _replication(mab).ledger.values():
+        for version_id, row in contributions.items():
+            own[mab.version_id_index(version_id)] -= row
+    return own
+
+
+def export_delta(mab, full: bool = False) -> dict:
+    """ Export contributions for merge on other nodes
+
+    Args:
+        mab (MAB): multiarm bandit
+        full (bool, optional): export contributions of all the known nodes for all
+            the arms instead of own changes since the last export. Defaults to False.
+
+    Returns:
+        dict: delta
+    """
+    replication = _replication(mab)
+    own = _own_contribution(mab)
+    names = _columns(mab)
+
+    changed = []
+    for index, version_id in enumerate(mab.version_ids):
+        exported = replication.exported.get(version_id)
+        if full or exported is None or exported[0] != own[index, 0]:
+            if own[index, 0] > 0:
+                changed.append(index)
+                if not full:
+                    replication.exported[version_id] = own[index]
+
+    delta = {mab.node_id: _entry([mab.version_ids[i] for i in changed], own[changed], names)}
+    if full:
+        for node_id, contributions in replication.ledger.items():
+            rows = np.array(list(contributions.values())).reshape(-1, len(names))
+            delta[node_id] = _entry(list(contributions), rows, names)
+    return delta
+
+
+def _entry(version_ids: List[str], rows: np.ndarray, names: List[str]) -> dict:
+    entry = {"version_ids": version_ids}
+    for column, name in enumerate(names):
+        values = rows[:, column]
+        entry[name] = values.astype(np.int64).tolist() if name == "counts" else values.tolist()
+    return entry
+
+
+def _check_own_entry(mab, entry: dict):
+    """Own contribution relayed by other nodes can't be ahead of the state"""
+    own = _own_contribution(mab)
+    for position, version_id in enumerate(entry["version_ids"]):
+        try:
+            index = mab.version_id_index(version_id)
+        except KeyError:
+            index = None
+        if index is None or entry["counts"][position] > own[index, 0]:
+            raise ValueError(
+                f"Delta has updates of node {mab.node_id} unknown to the node: "
+                "copies merged with each other must be made with fork()"
+            )
+
+
+def merge(mab, other: Union[dict, "MAB"]):
+    """ Merge delta (or full state of other bandit) into the bandit.
+        Idempotent: merging the same delta again changes nothing
+
+    Args:
+        mab (MAB): multiarm bandit
+        other (dict or MAB): delta from export_delta or bandit of other node
+    """
+    if not isinstance(other, dict):
+        other = export_delta(other, full=True)
+
+    ledger = _replication(mab).ledger
+    names = _columns(mab)
+    increments = {}
+    for node_id, entry in other.items():
+        if node_id == mab.node_id:
+            _check_own_entry(mab, entry)
+            continue
+        contributions = ledger.setdefault(node_id, {})
+        for position, version_id in enumerate(entry["version_ids"]):
+            row = np.array([entry[name][position] for name in names], dtype=np.float64)
+            known = contributions.get(version_id)
+            if known is not None and known[0] >= row[0]:
+                continue
+            contributions[version_id] = row
+            increment = row if known is None else row - known
+            increments[version_id] = increments.get(version_id, 0) + increment
+
+    if not increments:
+        return
+
+    for version_id in increments:
+        try:
+            mab.version_id_index(version_id)
+        except KeyError:
+            mab.add_arm(version_id, is_active=False)
+
+    state = _additive_state(mab)
+    for version_id, increment in increments.items():
+        state[mab.version_id_index(version_id)] += increment
+
+    counts, rewards = state[:, 0], state[:, 1]
+    values = np.divide(
+        rewards, counts, out=np.asarray(mab.values, dtype=np.float64).copy(), where=counts > 0
+    )
+    columns = {"counts": np.rint(counts).astype(np.int64), "values": values}
+    for column, name in enumerate(names[2:], start=2):
+        columns[name] = state[:, column]
+    mab.load_arm_state(**columns)
+
+
+def _rows(entry: dict, names: List[str]) -> Dict[str, np.ndarray]:
+    """Rows of the entry by version id (inverse of _entry)"""
+    columns = np.array([entry[name] for name in names], dtype=np.float64)
+    return dict(zip(entry["version_ids"], columns.reshape(len(names), -1).T.copy()))
+
+
+def _entry_of(rows: Dict[str, np.ndarray], names: List[str]) -> dict:
+    return _entry(list(rows), np.array(list(rows.values())).reshape(-1, len(names)), names)
+
+
+def replication_state(mab) -> dict:
+    """ Node id and ledger of the bandit for snapshots (json serializable)
+
+    Args:
+        mab (MAB): multiarm bandit
+
+    Returns:
+        dict: replication state
+    """
+    replication = mab._replication or _Replication()
+    names = _columns(mab)
+    base = _base(mab)
+    # only the arms which don't start with the default state
+    changed = np.flatnonzero((base != _default_row(mab)).any(axis=1))
+    return {
+        "node_id": mab.node_id,
+        "base": _entry([mab.version_ids[i] for i in changed], base[changed], names),
+        "ledger": {
+            node_id: _entry_of(contributions, names)
+            for node_id, contributions in replication.ledger.items()
+        },
+        "exported": _entry_of(replication.exported, names),
+    }
+
+
+def load_replication_state(mab, state: dict):
+    """ Restore node id and ledger saved with replication_state
+
+    Args:
+        mab (MAB): restored multiarm bandit
+        state (dict): replication state
+    """
+    names = _columns(mab)
+    replication = _Replication()
+    replication.base = _rows(state["base"], names)
+    replication.ledger = {
+        node_id: _rows(entry, names) for node_id, entry in state["ledger"].items()
+    }
+    replication.exported = _rows(state["exported"], names)
+    mab._replication = replication
+    mab.node_id = state["node_id"]
+
+
+def fork(mab):
+    """ Make the copy of the bandit a new node, which has merged
+        the contribution of the original node (see MAB.fork)
+
+    Args:
+        mab (MAB): copy of the multiarm bandit
+    """
+    own = _own_contribution(mab)
+    replication = _replication(mab)
+    contributions = {
+        version_id: own[index]
+        for index, version_id in enumerate(mab.version_ids)
+        if own[index, 0] > 0
+    }
+    if contributions:
+        replication.ledger[mab.node_id] = contributions
+    replication.exported = {}
+    mab.node_id = uuid.uuid4().hex
@@ -72,7 +72,7 @@ class MetricsCalculator:
 
         for i in range(n_times):
             if experiment_rewards.possible_rewards[i]:
-                accuracy[experiment_rewards.times[i]] += int(
+                accuracy[experiment_rewards.times[i]] += float(
                     experiment_rewards.possible_rewards[i]
                     - experiment_rewards.rewards[i]
                 )
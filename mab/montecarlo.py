@@ -0,0 +1,184 @@
+""" Vectorized Monte Carlo simulation (no simpy) """
+import collections
+import copy
+from typing import List
+import numpy as np
+from mab import enums, metric
+from mab.mab import MAB, Seed, spawn_seeds
+from mab.rewards import draw_matrix
+
+
+class MonteCarloSimulation:
+    """
+    MonteCarloSimulation - n_sims independent runs of the algorithm
+    for horizon steps with NumPy instead of simpy events
+
+    Rewards of all the arms are drawn as a matrix for a block of steps, the
+    algorithm selects the whole block with select_arms and learns it with one
+    update_many. So the algorithm sees rewards with delay up to block_size
+    steps like batched production serving. block_size=1 gives the step by step
+    behaviour of EventsSimulation.
+
+    ...
+
+    Attributes:
+    ----------
+
+    algorithm: MAB
+        Multiarm Bandit algorithm (copied for every simulation)
+
+    arms: list
+        arms with reseed like BernoulliArm or UniformArm
+        (copied and reseeded for every simulation)
+
+    n_sims: int
+        number of simulations
+
+    horizon: int
+        number of steps of every simulation
+
+    block_size: int
+        number of steps selected and updated at once
+
+    chosen_arms, rewards, possible_rewards, cumulative_rewards: np.ndarray
+        n_sims x horizon results of the run
+
+    Methods:
+    -----------
+    run()
+        run simulations and return ExperimentRewards
+
+    calculate_metrics(metrics)
+        calculate metrics of the run
+    """
+
+    # rewards are drawn for at least that many steps at once
+    _DRAW_STEPS = 4096
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        algorithm: MAB,
+        arms: List,
+        n_sims: int = 1,
+        horizon: int = 1000,
+        block_size: int = 100,
+        seed: Seed = None,
+        name: str = None,
+    ):
+        """
+        Args:
+            algorithm (MAB): Multiarm Bandit algorithm
+            arms (list): arms with reseed like BernoulliArm or UniformArm
+            n_sims (int, optional): number of simulations. Defaults to 1.
+            horizon (int, optional): steps of every simulation. Defaults to 1000.
+            block_size (int, optional): steps selected and updated at once.
+                Defaults to 100.
+            seed (int, SeedSequence or Generator, optional): seed of the rewards
+                and copies of the algorithm. Defaults to fresh entropy
+            name (str, optional): name of the simulation
+        """
+        self.algorithm = algorithm
+        self.arms = arms
+        self.n_sims = n_sims
+        self.horizon = horizon
+        self.block_size = block_size
+        self.seed = seed
+        self.marketing_name = algorithm.marketing_name
+        self.name = algorithm.name if name is None else name
+
+        self.chosen_arms = None
+        self.rewards = None
+        self.possible_rewards = None
+        self.cumulative_rewards = None
+        self.metrics = collections.defaultdict(list)
+
+    def _run_one(self, sim: int, seed: Seed):
+        """Run one simulation into the row sim of the results"""
+        reward_seed, algorithm_seed = spawn_seeds(seed, 2)
+        arms = copy.deepcopy(self.arms)
+        for arm, arm_seed in zip(arms, spawn_seeds(reward_seed, len(arms))):
+            arm.reseed(arm_seed)
+        algorithm = copy.deepcopy(self.algorithm)
+        algorithm.reseed(algorithm_seed)
+
+        draw_steps = -(-self._DRAW_STEPS // self.block_size) * self.block_size
+        for start in range(0, self.horizon, draw_steps):
+            steps = min(draw_steps, self.horizon - start)
+            all_rewards = draw_matrix(arms, steps)
+            if self.block_size == 1:
+                chosen_arms = self._run_steps(algorithm, all_rewards)
+            else:
+                chosen_arms = self._run_blocks(algorithm, all_rewards)
+
+            draw = slice(start, start + steps)
+            self.chosen_arms[sim, draw] = chosen_arms
+            self.rewards[sim, draw] = all_rewards[np.arange(steps), chosen_arms]
+            self.possible_rewards[sim, draw] = (all_rewards > 0).any(axis=1)
+
+    @staticmethod
+    def _run_steps(algorithm: MAB, all_rewards: np.ndarray) -> np.ndarray:
+        """Select and update step by step. Returns chosen arms"""
+        chosen_arms = []
+        for step_rewards in all_rewards.tolist():
+            chosen_arm = algorithm.select_arm()
+            algorithm.update(chosen_arm, step_rewards[chosen_arm])
+            chosen_arms.append(chosen_arm)
+        return np.array(chosen_arms, dtype=np.int64)
+
+    def _run_blocks(self, algorithm: MAB, all_rewards: np.ndarray) -> np.ndarray:
+        """Select and update block by block. Returns chosen arms"""
+        chosen_arms = np.empty(len(all_rewards), dtype=np.int64)
+        for start in range(0, len(all_rewards), self.block_size):
+            block = slice(start, start + self.block_size)
+            arms = algorithm.select_arms(len(all_rewards[block]))
+            algorithm.update_many(arms, all_rewards[block][np.arange(len(arms)), arms])
+            chosen_arms[block] = arms
+        return chosen_arms
+
+    def run(self) -> metric.ExperimentRewards:
+        """ Run n_sims simulations
+
+        Returns:
+            ExperimentRewards: rewards of all the simulations one after another
+        """
+        shape = (self.n_sims, self.horizon)
+        self.chosen_arms = np.empty(shape, dtype=np.int64)
+        self.rewards = np.empty(shape)
+        self.possible_rewards = np.empty(shape, dtype=np.int64)
+
+        for sim, seed in enumerate(spawn_seeds(self.seed, self.n_sims)):
+            self._run_one(sim, seed)
+        self.cumulative_rewards = np.cumsum(self.rewards, axis=1)
+        return self.experiment_rewards()
+
+    def experiment_rewards(self) -> metric.ExperimentRewards:
+        """ Results of the run in the shape of ExperimentRewards
+
+        Returns:
+            ExperimentRewards: rewards of all the simulations one after another
+        """
+        times = np.tile(np.arange(1, self.horizon + 1), self.n_sims)
+        return metric.ExperimentRewards(
+            times=times.tolist(),
+            possible_rewards=self.possible_rewards.ravel().tolist(),
+            rewards=self.rewards.ravel().tolist(),
+            cumulative_rewards=self.cumulative_rewards.ravel().tolist(),
+            n_sims=self.n_sims,
+        )
+
+    def calculate_metrics(self, metrics: List[str] = None):
+        """Calculate metrics of the run
+            Args:
+                metrics (list, optional): [description].
+                List of metrics to make calculations
+                ["accuracy", "average_reward", "cumulative_reward", "regret"].
+            """
+        if not metrics:
+            metrics = enums.CORE_METRICS
+        experiment_rewards = self.experiment_rewards()
+        for metric_name in metrics:
+            self.metrics[metric_name] = metric.METRICS_MAPPING[metric_name](
+                experiment_rewards
+            )
@@ -2,7 +2,7 @@
     Multiarm Bandint that randomly select arm
 """
 
-import random
+import numpy as np
 from mab.mab import MAB
 
 
@@ -33,6 +33,9 @@ class RandomSelect(MAB):
     select_arm()
         select index of arm to chose next (the core of the algorythm)
 
+    select_arms(n)
+        randomly select n arms
+
     """
 
     @property
@@ -56,4 +59,26 @@ class RandomSelect(MAB):
             int: return random index of the next arm to select
         """
 
-        return random.sample(self.active_arms, 1)[0]
+        return self.active_arms[int(self._uniform() * len(self.active_arms))]
+
+    def arm_probabilities(self) -> np.ndarray:
+        """Active arms have equal probabilities
+
+        Returns:
+            np.ndarray: probabilities of the arms
+        """
+        probabilities = np.zeros(self.n_arms)
+        probabilities[self.active_arms] = 1.0 / len(self.active_arms)
+        return probabilities
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """Randomly select n arms
+
+        Args:
+            n (int): number of arms to select
+
+        Returns:
+            np.ndarray: random indexes of the arms
+        """
+        active_arms = np.asarray(self.active_arms, dtype=np.int64)
+        return active_arms[self._rng.integers(len(active_arms), size=n)]
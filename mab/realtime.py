@@ -1,14 +1,90 @@
 """ Module for realtime simulation"""
 import collections
-import random
-from typing import List, Dict
+import math
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 from simpy import Environment
 from mab import metric
-from mab.mab import MAB
+from mab.mab import MAB, Seed
 from mab import enums
+from mab.rewards import RewardSource
 
 
-class EventsSimulation:
+class _History:
+    """
+    Histories of the simulation: every step, or in streaming mode (checkpoint_every
+    or checkpoint_growth is set) online totals and checkpoints
+
+    In streaming mode rewards and possible_rewards keep means over the steps
+    between checkpoints (so metrics are per step averages of the window),
+    cumulative_rewards keeps totals at checkpoints,
+    checkpoint_times keeps the steps of checkpoints and arm_counts replaces
+    chosen_arms, so memory doesn't grow with the horizon. Checkpoints are every
+    checkpoint_every steps, or log-spaced with checkpoint_growth.
+    """
+
+    # pylint: disable=too-few-public-methods
+    # pylint: disable=attribute-defined-outside-init
+    def _init_history(
+        self, n_arms: int, checkpoint_every: Optional[int], checkpoint_growth: Optional[float]
+    ):
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_growth = checkpoint_growth
+        self.streaming = checkpoint_every is not None or checkpoint_growth is not None
+
+        self.chosen_arms = None if self.streaming else []
+        self.arm_counts = np.zeros(n_arms, dtype=np.int64) if self.streaming else None
+        self.rewards = []
+        self.cumulative_rewards = []
+        self.possible_rewards = []
+        self.checkpoint_times = []
+
+        self._total_rewards = 0
+        self._window_rewards = 0
+        self._window_possible_rewards = 0
+        self._next_checkpoint = self.checkpoint_every or 1
+
+    def _add_arms(self, chosen_arms: np.ndarray):
+        """Record the batch of selected arms"""
+        if self.streaming:
+            self.arm_counts += np.bincount(chosen_arms, minlength=len(self.arm_counts))
+        else:
+            self.chosen_arms.extend(chosen_arms.tolist())
+
+    def _record(self, reward: float, possible_reward: int):
+        """Record rewards of the step"""
+        self._total_rewards += reward
+        if not self.streaming:
+            self.rewards.append(reward)
+            self.possible_rewards.append(possible_reward)
+            self.cumulative_rewards.append(self._total_rewards)
+            return
+
+        self._window_rewards += reward
+        self._window_possible_rewards += possible_reward
+        if self.horizon >= self._next_checkpoint:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Retain means of the steps since the last checkpoint (streaming mode)"""
+        last_checkpoint = (self.checkpoint_times or [0])[-1]
+        if not self.streaming or last_checkpoint == self.horizon:
+            return
+        window = self.horizon - last_checkpoint
+        self.checkpoint_times.append(self.horizon)
+        self.rewards.append(self._window_rewards / window)
+        self.possible_rewards.append(self._window_possible_rewards / window)
+        self.cumulative_rewards.append(self._total_rewards)
+        self._window_rewards = 0
+        self._window_possible_rewards = 0
+
+        step = self.checkpoint_every or 1
+        if self.checkpoint_growth is not None:
+            step = max(step, math.ceil(self.horizon * (self.checkpoint_growth - 1)))
+        self._next_checkpoint = self.horizon + step
+
+
+class EventsSimulation(_History):
     """
     EventsSimulation - simulation the sequence of the events
 
@@ -25,6 +101,9 @@ class EventsSimulation:
     arms: list with Bernoulli arms
     name: None
 
+    checkpoint_every, checkpoint_growth: streaming mode with bounded memory,
+        histories are kept at checkpoints (checkpoint_times)
+
     Methods:
     -----------
     All the methods from MAB plus
@@ -34,11 +113,21 @@ class EventsSimulation:
     
     run()
         run simulation
+
+    checkpoint()
+        retain the steps since the last checkpoint (streaming mode)
     """
 
     # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments
     def __init__(
-        self, env: Environment, algorithm: MAB, arms: List[int], name: str = None
+        self,
+        env: Environment,
+        algorithm: MAB,
+        arms: List[int],
+        name: str = None,
+        checkpoint_every: Optional[int] = None,
+        checkpoint_growth: Optional[float] = None,
     ):
         """
         Args:
@@ -46,16 +135,19 @@ class EventsSimulation:
             n_sims(int): Number of simulations
             horizon(int): Maximum time
             name(str, optional): name of the simulation
+            checkpoint_every (int, optional): streaming mode with checkpoints
+                every checkpoint_every steps. Defaults to None (every step is kept)
+            checkpoint_growth (float, optional): streaming mode with log-spaced
+                checkpoints, every next is checkpoint_growth times further.
+                Defaults to None
         """
         self.env = env
         self.horizon = 0
         self.algorithm = algorithm
         self.arms = arms
+        self._reward_source = RewardSource(arms)
 
-        self.chosen_arms = []
-        self.rewards = []
-        self.cumulative_rewards = []
-        self.possible_rewards = []
+        self._init_history(len(arms), checkpoint_every, checkpoint_growth)
         self.marketing_name = algorithm.marketing_name
         if name is None:
             self.name = algorithm.name
@@ -78,20 +170,16 @@ class EventsSimulation:
             self.horizon += 1
 
             chosen_arm = self.algorithm.select_arm()
-            self.chosen_arms.append(chosen_arm)
+            if self.streaming:
+                self.arm_counts[chosen_arm] += 1
+            else:
+                self.chosen_arms.append(chosen_arm)
 
             # check out if any rewards for the current time and simulation
             # save 0 in possible rewards and 1 otherwise
-            all_rewards = list(map(lambda x: x.draw(), self.arms))
-            self.possible_rewards.append(int(sum(all_rewards) > 0))
-
+            all_rewards = self._reward_source.draw_row()
             reward = all_rewards[chosen_arm]
-            self.rewards.append(reward)
-
-            if self.cumulative_rewards:
-                self.cumulative_rewards.append(self.cumulative_rewards[-1] + reward)
-            else:
-                self.cumulative_rewards.append(reward)
+            self._record(reward, int(sum(all_rewards) > 0))
 
             self.algorithm.update(chosen_arm, reward)
 
@@ -109,7 +197,9 @@ class EventsSimulation:
             """
         if not metrics:
             metrics = enums.CORE_METRICS
-        times = list(range(1, self.horizon + 1))
+        # in streaming mode the metrics are at checkpoints (see checkpoint_times)
+        self.checkpoint()
+        times = list(range(1, len(self.rewards) + 1))
         if "accuracy" in metrics:
             self.metrics["accuracy"] = metric.MetricsCalculator.calculate_accuracy(
                 metric.ExperimentRewards(times, self.possible_rewards, self.rewards, 1)
@@ -135,7 +225,7 @@ class EventsSimulation:
             )
 
 
-class UISimulation:
+class UISimulation(_History):
     """
     UISimulation -  Simulation of the UI when random N users (between Nmin and Nmax) 
     come to the UI every minute and do some actions with preset arms 
@@ -155,6 +245,15 @@ class UISimulation:
     n_customers_high : int
         Maximum customers that show at current minute
 
+    batch_size : int
+        customers selected before their rewards are applied with one
+        update_many (feedback delay inside of the minute). 1 serves customers
+        one by one, None serves the whole minute as one batch
+
+    checkpoint_every, checkpoint_growth : int, float
+        streaming mode with bounded memory, histories are kept at checkpoints
+        (checkpoint_times)
+
     Methods:
     -----------
     All the methods from MAB plus
@@ -164,6 +263,9 @@ class UISimulation:
     
     run()
         run simulation
+
+    checkpoint()
+        retain the steps since the last checkpoint (streaming mode)
     """
 
     # pylint: disable=too-many-arguments
@@ -176,6 +278,10 @@ class UISimulation:
         n_customers_low: int,
         n_customers_high: int,
         name: str = None,
+        seed: Seed = None,
+        batch_size: Optional[int] = 1,
+        checkpoint_every: Optional[int] = None,
+        checkpoint_growth: Optional[float] = None,
     ):
         """
         Args:
@@ -183,22 +289,32 @@ class UISimulation:
             n_sims(int): Number of simulations
             horizon(int): Maximum time
             name(str, optional): name of the simulation
+            seed (int, SeedSequence or Generator, optional): seed of the
+                number of customers. Defaults to fresh entropy
+            batch_size (int, optional): customers selected and updated at once.
+                Defaults to 1 (one by one), None for the whole minute.
+            checkpoint_every (int, optional): streaming mode with checkpoints
+                every checkpoint_every minutes. Defaults to None (every minute is kept)
+            checkpoint_growth (float, optional): streaming mode with log-spaced
+                checkpoints, every next is checkpoint_growth times further.
+                Defaults to None
         """
         self.env = env
         self.horizon = 0
         self.algorithm = algorithm
         self.arms = arms
+        self._reward_source = RewardSource(arms)
+        self._rng = np.random.default_rng(seed)
 
         self.n_customers_low = n_customers_low
         self.n_customers_high = n_customers_high
+        self.batch_size = batch_size
 
-        self.chosen_arms = []
-        self.rewards = []
-        self.cumulative_rewards = []
-        self.possible_rewards = []
+        self._init_history(len(arms), checkpoint_every, checkpoint_growth)
         self.marketing_name = algorithm.marketing_name
 
         # rewards difference compring to AB test assuming we don't know the result
+        # (at checkpoints in streaming mode)
         self.rewards_difference_to_ab = []
 
         if name is None:
@@ -222,32 +338,63 @@ class UISimulation:
             self.horizon += 1
             minute_rewards = 0
             possible_minute_rewards = 0
-            for _ in range(random.randint(self.n_customers_low, self.n_customers_high)):
-                chosen_arm = self.algorithm.select_arm()
-                self.chosen_arms.append(chosen_arm)
+            n_customers = self._rng.integers(self.n_customers_low, self.n_customers_high + 1)
+            if self.batch_size == 1:
+                for _ in range(n_customers):
+                    chosen_arm = self.algorithm.select_arm()
+                    if self.streaming:
+                        self.arm_counts[chosen_arm] += 1
+                    else:
+                        self.chosen_arms.append(chosen_arm)
+
+                    # check out if any rewards for the current time and simulation
+                    # save 0 in possible rewards and 1 otherwise
+                    all_rewards = self._reward_source.draw_row()
+                    possible_minute_rewards += int(sum(all_rewards) > 0)
+
+                    reward = all_rewards[chosen_arm]
+                    minute_rewards += reward
+
+                    self.algorithm.update(chosen_arm, reward)
+            else:
+                minute_rewards, possible_minute_rewards = self._run_batches(n_customers)
 
-                # check out if any rewards for the current time and simulation
-                # save 0 in possible rewards and 1 otherwise
-                all_rewards = list(map(lambda x: x.draw(), self.arms))
-                possible_minute_rewards += int(sum(all_rewards) > 0)
+            if not self.streaming:
+                self.rewards_difference_to_ab.append(self.algorithm.compare_to_ab())
+            self._record(minute_rewards, possible_minute_rewards)
 
-                reward = all_rewards[chosen_arm]
-                minute_rewards += reward
+            yield self.env.timeout(1)
 
-                self.algorithm.update(chosen_arm, reward)
+    def checkpoint(self):
+        """Retain means of the minutes since the last checkpoint (streaming mode)"""
+        if self.streaming and (self.checkpoint_times or [0])[-1] != self.horizon:
+            self.rewards_difference_to_ab.append(self.algorithm.compare_to_ab())
+        super().checkpoint()
 
-            self.possible_rewards.append(possible_minute_rewards)
-            self.rewards.append(minute_rewards)
+    def _run_batches(self, n_customers: int) -> Tuple[float, int]:
+        """ Serve customers of the minute batch by batch
 
-            self.rewards_difference_to_ab.append(self.algorithm.compare_to_ab())
-            if self.cumulative_rewards:
-                self.cumulative_rewards.append(
-                    self.cumulative_rewards[-1] + minute_rewards
-                )
-            else:
-                self.cumulative_rewards.append(minute_rewards)
+        Args:
+            n_customers (int): customers of the minute
 
-            yield self.env.timeout(1)
+        Returns:
+            Tuple[float, int]: rewards and possible rewards of the minute
+        """
+        batch_size = self.batch_size or n_customers
+        minute_rewards = 0.0
+        possible_minute_rewards = 0
+        for start in range(0, n_customers, batch_size):
+            size = min(batch_size, n_customers - start)
+            chosen_arms = self.algorithm.select_arms(size)
+            # rewards of all the arms are needed for possible rewards anyway
+            all_rewards = self._reward_source.draw_matrix(size)
+            rewards = all_rewards[np.arange(size), chosen_arms]
+            self.algorithm.update_many(chosen_arms, rewards)
+
+            self._add_arms(chosen_arms)
+            minute_rewards += float(rewards.sum())
+            possible_minute_rewards += int((all_rewards > 0).any(axis=1).sum())
+        return minute_rewards, possible_minute_rewards
 
     def calculate_metrics(
         self, metrics: List[str] = None,
@@ -260,7 +407,9 @@ class UISimulation:
             """
         if not metrics:
             metrics = enums.CORE_METRICS + [enums.Metrics.COMPARE_TO_AB]
-        times = list(range(1, self.horizon + 1))
+        # in streaming mode the metrics are at checkpoints (see checkpoint_times)
+        self.checkpoint()
+        times = list(range(1, len(self.rewards) + 1))
 
         experiment_rewards = metric.ExperimentRewards(
             times=times,
@@ -0,0 +1,279 @@
+"""
+    Multi-tenant registry of Multiarm Bandits with SQLite persistence
+"""
+import sqlite3
+from collections import OrderedDict
+from time import monotonic
+from typing import Dict, Iterator, Tuple, Union
+from mab.mab import MAB
+from mab.snapshot import from_bytes
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS experiments (id TEXT PRIMARY KEY, state BLOB NOT NULL)"
+
+
+class ExperimentRegistry:
+    """
+    Registry of Multiarm Bandits keyed by experiment id
+
+    Hot bandits stay hydrated in LRU cache limited by number of bandits and
+    by size of their snapshots. Cold ones are loaded from SQLite file on first
+    access. Changed bandits are marked dirty and written back in one
+    transaction every flush_every changes or flush_interval seconds (and on
+    eviction, close), so requests don't deserialize or write anything.
+
+    ...
+
+    Attributes:
+    ----------
+
+    path : str
+        SQLite database file (":memory:" for tests)
+
+    max_size : int
+        maximum number of hydrated bandits
+
+    max_bytes : int
+        maximum total size of snapshots of hydrated bandits
+
+    flush_every : int
+        number of dirty bandits to trigger write-back
+
+    flush_interval : float
+        maximum seconds between write-backs (checked on access)
+
+    hits, misses, writes : int
+        cache hits, loads from the store and written snapshots
+
+    Methods:
+    -----------
+    get(experiment_id), put(experiment_id, mab), delete(experiment_id)
+        access bandits
+
+    select_version(experiment_id), update(experiment_id, chosen_arm, reward)
+        select and update bandit of the experiment
+
+    mark_dirty(experiment_id)
+        schedule write-back of the bandit changed directly
+
+    flush()
+        write dirty bandits in one transaction
+
+    close()
+        flush and close the database (or use "with")
+    """
+
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 1000,
+        max_bytes: int = 256 * 2 ** 20,
+        flush_every: int = 100,
+        flush_interval: float = 1.0,
+    ):
+        """
+        Args:
+            path (str): SQLite database file
+            max_size (int, optional): maximum hydrated bandits. Defaults to 1000.
+            max_bytes (int, optional): maximum size of hydrated snapshots.
+                Defaults to 256 MiB.
+            flush_every (int, optional): dirty bandits to trigger write-back.
+                Defaults to 100.
+            flush_interval (float, optional): maximum seconds between write-backs.
+                Defaults to 1.0.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+        # experiment id -> (bandit, size of its last snapshot)
+        self._cache: "OrderedDict[str, Tuple[MAB, int]]" = OrderedDict()
+        self._cached_bytes = 0
+        self._dirty = set()
+        # evicted dirty bandits waiting for write-back
+        self._evicted: Dict[str, MAB] = {}
+        self._last_flush = monotonic()
+
+    def __len__(self) -> int:
+        self.flush()
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM experiments").fetchone()
+        return count
+
+    def __contains__(self, experiment_id: str) -> bool:
+        return (
+            experiment_id in self._cache
+            or experiment_id in self._evicted
+            or self._stored(experiment_id)
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        self.flush()
+        for (experiment_id,) in self._connection.execute("SELECT id FROM experiments"):
+            yield experiment_id
+
+    @property
+    def hydrated(self) -> int:
+        """Number of bandits in the cache"""
+        return len(self._cache)
+
+    @property
+    def dirty(self) -> int:
+        """Number of bandits waiting for write-back"""
+        return len(self._dirty) + len(self._evicted)
+
+    def _stored(self, experiment_id: str) -> bool:
+        row = self._connection.execute(
+            "SELECT 1 FROM experiments WHERE id = ?", (experiment_id,)
+        ).fetchone()
+        return row is not None
+
+    def get(self, experiment_id: str) -> MAB:
+        """ Return hydrated bandit of the experiment
+
+        Args:
+            experiment_id (str): experiment id
+
+        Raises:
+            KeyError: unknown experiment
+
+        Returns:
+            MAB: bandit (changes must be reported with mark_dirty)
+        """
+        if experiment_id in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(experiment_id)
+            return self._cache[experiment_id][0]
+
+        self.misses += 1
+        if experiment_id in self._evicted:
+            mab = self._evicted.pop(experiment_id)
+            self._hydrate(experiment_id, mab, len(mab.to_bytes()), dirty=True)
+            return mab
+
+        row = self._connection.execute(
+            "SELECT state FROM experiments WHERE id = ?", (experiment_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(experiment_id)
+        mab = from_bytes(bytearray(row[0]))
+        self._hydrate(experiment_id, mab, len(row[0]))
+        return mab
+
+    def put(self, experiment_id: str, mab: MAB):
+        """ Add or replace bandit of the experiment
+
+        Args:
+            experiment_id (str): experiment id
+            mab (MAB): bandit
+        """
+        self._evicted.pop(experiment_id, None)
+        if experiment_id in self._cache:
+            self._cached_bytes -= self._cache.pop(experiment_id)[1]
+        self._hydrate(experiment_id, mab, len(mab.to_bytes()), dirty=True)
+
+    def delete(self, experiment_id: str):
+        """ Remove bandit of the experiment from the cache and the store
+
+        Args:
+            experiment_id (str): experiment id
+        """
+        if experiment_id in self._cache:
+            self._cached_bytes -= self._cache.pop(experiment_id)[1]
+        self._dirty.discard(experiment_id)
+        self._evicted.pop(experiment_id, None)
+        with self._connection:
+            self._connection.execute("DELETE FROM experiments WHERE id = ?", (experiment_id,))
+
+    def mark_dirty(self, experiment_id: str):
+        """ Schedule write-back of the bandit changed directly
+
+        Args:
+            experiment_id (str): experiment id
+        """
+        if experiment_id not in self._cache:
+            raise KeyError(experiment_id)
+        self._dirty.add(experiment_id)
+        self._maybe_flush()
+
+    def select_version(self, experiment_id: str) -> str:
+        """Select version of the experiment"""
+        return self.get(experiment_id).select_version()
+
+    def update(self, experiment_id: str, chosen_arm: Union[int, str], reward: float):
+        """ Update bandit of the experiment
+
+        Args:
+            experiment_id (str): experiment id
+            chosen_arm (int or str): arm index or version_id
+            reward (float): reward
+        """
+        mab = self.get(experiment_id)
+        if isinstance(chosen_arm, str):
+            chosen_arm = mab.version_id_index(chosen_arm)
+        mab.update(chosen_arm, reward)
+        self.mark_dirty(experiment_id)
+
+    def _hydrate(self, experiment_id: str, mab: MAB, size: int, dirty: bool = False):
+        self._cache[experiment_id] = (mab, size)
+        self._cached_bytes += size
+        if dirty:
+            self._dirty.add(experiment_id)
+        self._evict()
+        self._maybe_flush()
+
+    def _evict(self):
+        while len(self._cache) > 1 and (
+            len(self._cache) > self.max_size or self._cached_bytes > self.max_bytes
+        ):
+            experiment_id, (mab, size) = self._cache.popitem(last=False)
+            self._cached_bytes -= size
+            if experiment_id in self._dirty:
+                self._dirty.discard(experiment_id)
+                self._evicted[experiment_id] = mab
+
+    def _maybe_flush(self):
+        if (
+            self.dirty >= self.flush_every
+            or monotonic() - self._last_flush > self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """Write dirty bandits in one transaction"""
+        rows = [(experiment_id, mab.to_bytes()) for experiment_id, mab in self._evicted.items()]
+        for experiment_id in self._dirty:
+            mab, size = self._cache[experiment_id]
+            rows.append((experiment_id, mab.to_bytes()))
+            self._cached_bytes += len(rows[-1][1]) - size
+            self._cache[experiment_id] = (mab, len(rows[-1][1]))
+
+        if rows:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO experiments (id, state) VALUES (?, ?)", rows
+                )
+            self.writes += len(rows)
+        self._evicted.clear()
+        self._dirty.clear()
+        self._last_flush = monotonic()
+        self._evict()
+
+    def close(self):
+        """Write dirty bandits and close the database"""
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -2,10 +2,88 @@
     Randomly give reward with probability p
 """
 # pylint: disable=too-few-public-methods
-import random
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+import numpy as np
+from mab.mab import Seed, spawn_seeds
 
 
-class BernoulliArm:
+class _RandomArm(ABC):
+    """Arm with its own random generator. Rewards are generated in blocks"""
+
+    _REWARD_BLOCK = 1024
+
+    def __init__(self, seed: Seed = None):
+        self.reseed(seed)
+
+    def reseed(self, seed: Seed = None):
+        """ Replace the arm random generator and drop generated rewards
+
+        Args:
+            seed (int, SeedSequence or Generator, optional): new seed.
+                Defaults to fresh entropy
+        """
+        self._rng = np.random.default_rng(seed)
+        # generated rewards not drawn yet: _block[_position:]
+        self._block = np.empty(0)
+        self._position = 0
+        self._block_list: List[float] = []
+
+    @abstractmethod
+    def rewards(self, uniforms: np.ndarray) -> np.ndarray:
+        """ Rewards for uniform numbers in [0, 1) (vectorized draw)
+
+        Args:
+            uniforms (np.ndarray): uniform numbers
+
+        Returns:
+            np.ndarray: rewards of the same shape
+        """
+
+    def _refill(self, k: int):
+        """Make at least k rewards available in the block"""
+        left = self._block[self._position :]
+        fresh = self.rewards(self._rng.random(max(k - len(left), self._REWARD_BLOCK)))
+        self._block = np.concatenate([left, fresh]) if len(left) else fresh
+        self._position = 0
+        self._block_list = []
+
+    def draw(self) -> float:
+        """ Next reward
+
+        Returns:
+            float: reward
+        """
+        if not self._block_list:
+            if self._position == len(self._block):
+                self._refill(1)
+            # python floats in reverse order are the cheapest to pop one by one
+            self._block_list = self._block[self._position :][::-1].tolist()
+            self._position = len(self._block)
+        return self._block_list.pop()
+
+    def draw_many(self, k: int) -> np.ndarray:
+        """ Next k rewards. Same stream as k calls of draw
+
+        Args:
+            k (int): number of rewards
+
+        Returns:
+            np.ndarray: rewards
+        """
+        if self._block_list:
+            # return the rewards taken by draw back to the block
+            self._block = np.array(self._block_list[::-1])
+            self._position = 0
+            self._block_list = []
+        if len(self._block) - self._position < k:
+            self._refill(k)
+        rewards = self._block[self._position : self._position + k]
+        self._position += k
+        return rewards
+
+
+class BernoulliArm(_RandomArm):
     """Bernoulli distribution Bandit Arm
     Randomly give reward with probability p
     ...
@@ -21,30 +99,28 @@ class BernoulliArm:
     draw()
         returns reward
 
+    draw_many(k)
+        returns k rewards
+
     """
 
-    def __init__(self, prob: float, seed: int = 30):
+    def __init__(self, prob: float, seed: Seed = None):
         """
         Args:
             prob (float): probabilty of choosing arm [0,1]
+            seed (int, SeedSequence or Generator, optional): seed of the arm
+                random generator. Defaults to fresh entropy
         """
-        random.seed(seed)
+        super().__init__(seed)
         self.prob = prob
         assert 0 <= prob <= 1
 
-    def draw(self) -> float:
-        """Randomly return reward with set probablity
-
-        Returns:
-            float [0.0, 1.0]: reward
-        """
-        if random.random() > self.prob:
-            return 0.0
+    def rewards(self, uniforms: np.ndarray) -> np.ndarray:
+        """Reward 1.0 for uniforms up to prob and 0.0 otherwise"""
+        return (uniforms <= self.prob).astype(np.float64)
 
-        return 1.0
 
-
-class UniformArm:
+class UniformArm(_RandomArm):
     """Bernoulli distribution Bandit Arm
     Randomly give reward with probability p
     ...
@@ -63,21 +139,117 @@ class UniformArm:
     draw()
         returns reward
 
+    draw_many(k)
+        returns k rewards
+
     """
 
-    def __init__(self, lower_bound: float = 0.0, upper_bound: float = 1.0):
+    def __init__(
+        self, lower_bound: float = 0.0, upper_bound: float = 1.0, seed: Seed = None
+    ):
         """
         Args:
             lower_bound (float, optional): lower bound for reward. Defaults to 0.0.
             b (float, optional): upper bound for reward. Defaults to 1.0.
+            seed (int, SeedSequence or Generator, optional): seed of the arm
+                random generator. Defaults to fresh entropy
         """
+        super().__init__(seed)
         self.lower_bound = lower_bound
         self.upper_bound = upper_bound
 
-    def draw(self) -> float:
-        """Randomly return reward as uniform distribution
+    def rewards(self, uniforms: np.ndarray) -> np.ndarray:
+        """Rewards between lower_bound and upper_bound"""
+        return self.lower_bound + (self.upper_bound - self.lower_bound) * uniforms
+
+
+def bernoulli_arms(probs: Sequence[float], seed: Seed = None) -> List[BernoulliArm]:
+    """ Bernoulli arms with independent random streams spawned from one seed
+
+    Args:
+        probs (Sequence[float]): probabilities of the rewards
+        seed (int, SeedSequence or Generator, optional): parent seed. Defaults to None.
+
+    Returns:
+        List[BernoulliArm]: arms
+    """
+    seeds = spawn_seeds(seed, len(probs))
+    return [BernoulliArm(prob, child) for prob, child in zip(probs, seeds)]
+
+
+def draw_matrix(arms: Sequence, steps: int) -> np.ndarray:
+    """ Rewards of every arm for every step from the streams of the arms
+
+    Args:
+        arms (Sequence): arms (draw_many is used when the arm has it)
+        steps (int): number of steps
+
+    Returns:
+        np.ndarray: steps x n_arms matrix of rewards
+    """
+    rewards = np.empty((steps, len(arms)))
+    for column, arm in enumerate(arms):
+        if hasattr(arm, "draw_many"):
+            rewards[:, column] = arm.draw_many(steps)
+        else:
+            rewards[:, column] = [arm.draw() for _ in range(steps)]
+    return rewards
+
+
+class RewardSource:
+    """Rewards of all the arms generated as steps x arms matrices
+    ...
+
+    Attributes:
+    ----------
+
+    arms : list
+        arms with draw (and draw_many)
+
+    Methods:
+    -----------
+    draw_row()
+        returns list of rewards of all the arms for the next step
+
+    draw_matrix(steps)
+        returns steps x n_arms matrix of rewards
+    """
+
+    _BLOCK_STEPS = 1024
+
+    def __init__(self, arms: Sequence):
+        """
+        Args:
+            arms (Sequence): arms
+        """
+        self.arms = arms
+        # generated rows not drawn yet in reverse order
+        self._rows: List[List[float]] = []
+
+    def draw_row(self) -> List[float]:
+        """ Rewards of all the arms for the next step
+
+        Returns:
+            List[float]: reward of every arm
+        """
+        if not self._rows:
+            self._rows = draw_matrix(self.arms, self._BLOCK_STEPS)[::-1].tolist()
+        return self._rows.pop()
+
+    def draw_matrix(self, steps: int) -> np.ndarray:
+        """ Rewards of all the arms for the next steps. Same stream as draw_row
+
+        Args:
+            steps (int): number of steps
 
         Returns:
-            float: reward between a and b
+            np.ndarray: steps x n_arms matrix of rewards
         """
-        return random.uniform(self.lower_bound, self.upper_bound)
+        buffered = min(steps, len(self._rows))
+        rows = np.array(self._rows[len(self._rows) - buffered :][::-1]).reshape(
+            buffered, len(self.arms)
+        )
+        del self._rows[len(self._rows) - buffered :]
+        if buffered == steps:
+            return rows
+        return np.concatenate([rows, draw_matrix(self.arms, steps - buffered)])
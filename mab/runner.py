@@ -0,0 +1,206 @@
+""" Parallel runner of simulations (process pool) """
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+from simpy import Environment
+from mab import enums, metric
+from mab.mab import MAB, Seed, spawn_seeds
+from mab.realtime import EventsSimulation, UISimulation
+from mab.rewards import bernoulli_arms
+
+
+@dataclass
+class SimulationResult:
+    """ Results of n_sims runs of one algorithm as compact arrays """
+
+    name: str
+    rewards: np.ndarray  # n_sims x horizon
+    possible_rewards: np.ndarray  # n_sims x horizon
+    arm_counts: np.ndarray  # n_sims x n_arms, number of selections of every arm
+
+    @property
+    def n_sims(self) -> int:
+        """Number of simulations"""
+        return len(self.rewards)
+
+    def experiment_rewards(self) -> metric.ExperimentRewards:
+        """ Results in the shape of ExperimentRewards (simulations one after another)
+
+        Returns:
+            ExperimentRewards: rewards of all the simulations
+        """
+        horizon = self.rewards.shape[1]
+        return metric.ExperimentRewards(
+            times=np.tile(np.arange(1, horizon + 1), self.n_sims).tolist(),
+            possible_rewards=self.possible_rewards.ravel().tolist(),
+            rewards=self.rewards.ravel().tolist(),
+            cumulative_rewards=np.cumsum(self.rewards, axis=1).ravel().tolist(),
+            n_sims=self.n_sims,
+        )
+
+    def metrics(self, metrics: List[enums.Metrics] = None) -> Dict[enums.Metrics, np.ndarray]:
+        """ Metrics averaged by the simulations at every step 1..horizon
+
+        ACCURACY: rewards divided by possible rewards (0 when nothing was possible)
+        AVERAGE_REWARD: reward of a simulation
+        CUMULATIVE_REWARD: cumulative reward of a simulation
+        REGRET: missed rewards of a simulation with possible rewards
+
+        Args:
+            metrics (list, optional): metrics to calculate. Defaults to CORE_METRICS.
+
+        Returns:
+            dict: metric -> values for every step
+        """
+        if not metrics:
+            metrics = enums.CORE_METRICS
+        rewards = self.rewards.astype(np.float64)
+        possible_rewards = self.possible_rewards.astype(np.float64)
+        with_possible_rewards = np.maximum(1, (possible_rewards > 0).sum(axis=0))
+        reductions = {
+            enums.Metrics.ACCURACY: lambda: rewards.sum(axis=0)
+            / np.maximum(1, possible_rewards.sum(axis=0)),
+            enums.Metrics.AVERAGE_REWARD: lambda: rewards.mean(axis=0),
+            enums.Metrics.CUMULATIVE_REWARD: lambda: rewards.cumsum(axis=1).mean(axis=0),
+            enums.Metrics.REGRET: lambda: (possible_rewards - rewards).sum(axis=0)
+            / with_possible_rewards,
+        }
+        return {metric_name: reductions[metric_name]() for metric_name in metrics}
+
+
+# (algorithm, reward probabilities, horizon, customers range or None, seed)
+_Task = Tuple[MAB, Sequence[float], int, Tuple[int, int], Seed]
+
+
+def _run_task(task: _Task) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Run one simulation in the worker process"""
+    algorithm, probs, horizon, customers, seed = task
+    arms_seed, algorithm_seed, simulation_seed = spawn_seeds(seed, 3)
+    algorithm = copy.deepcopy(algorithm)
+    algorithm.reseed(algorithm_seed)
+    arms = bernoulli_arms(probs, arms_seed)
+
+    env = Environment()
+    if customers is None:
+        simulation = EventsSimulation(env, algorithm, arms)
+    else:
+        simulation = UISimulation(env, algorithm, arms, *customers, seed=simulation_seed)
+    env.run(until=horizon)
+
+    arm_counts = np.bincount(simulation.chosen_arms, minlength=len(probs))
+    return (
+        np.asarray(simulation.rewards, dtype=np.float32),
+        np.asarray(simulation.possible_rewards, dtype=np.int32),
+        arm_counts.astype(np.int32),
+    )
+
+
+class SimulationRunner:
+    """
+    SimulationRunner - runs n_sims simulations (EventsSimulation or UISimulation)
+    of every algorithm in a process pool and reduces them into averaged metrics
+
+    Simulation s of every algorithm uses the same seed of the arms, so
+    algorithms are compared on the same rewards.
+
+    ...
+
+    Attributes:
+    ----------
+
+    algorithms: list
+        Multiarm Bandit algorithms (copied for every simulation)
+
+    probs: list
+        probabilities of Bernoulli arms
+
+    horizon: int
+        number of steps (minutes for UISimulation) of every simulation
+
+    n_sims: int
+        number of simulations of every algorithm
+
+    customers: tuple
+        (n_customers_low, n_customers_high) to run UISimulation, None for EventsSimulation
+
+    max_workers: int
+        number of processes. 1 runs in the current process
+
+    Methods:
+    -----------
+    run()
+        run simulations and return SimulationResult of every algorithm
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        algorithms: List[MAB],
+        probs: Sequence[float],
+        horizon: int,
+        n_sims: int = 10,
+        customers: Tuple[int, int] = None,
+        max_workers: int = None,
+        seed: Seed = None,
+    ):
+        """
+        Args:
+            algorithms (list): Multiarm Bandit algorithms
+            probs (list): probabilities of Bernoulli arms
+            horizon (int): steps of every simulation
+            n_sims (int, optional): simulations of every algorithm. Defaults to 10.
+            customers (tuple, optional): (n_customers_low, n_customers_high) to run
+                UISimulation. Defaults to None (EventsSimulation)
+            max_workers (int, optional): number of processes. Defaults to CPU count
+            seed (int, SeedSequence or Generator, optional): seed of the simulations.
+                Defaults to fresh entropy
+        """
+        self.algorithms = algorithms
+        self.probs = list(probs)
+        self.horizon = horizon
+        self.n_sims = n_sims
+        self.customers = customers
+        self.max_workers = max_workers
+        self.seed = seed
+
+    def run(self) -> List[SimulationResult]:
+        """ Run n_sims simulations of every algorithm
+
+        Returns:
+            List[SimulationResult]: results in the order of algorithms
+        """
+        seeds = spawn_seeds(self.seed, self.n_sims)
+        # spawning children changes SeedSequence, so every task gets its own copy
+        # and every algorithm gets the same arm rewards in and out of the pool
+        tasks = [
+            (algorithm, self.probs, self.horizon, self.customers, copy.deepcopy(seed))
+            for algorithm in self.algorithms
+            for seed in seeds
+        ]
+
+        if self.max_workers == 1:
+            runs = list(map(_run_task, tasks))
+        else:
+            workers = self.max_workers or os.cpu_count() or 1
+            # a few chunks per worker to balance the load with low overhead
+            chunksize = max(1, len(tasks) // (4 * workers))
+            with ProcessPoolExecutor(workers) as executor:
+                runs = list(executor.map(_run_task, tasks, chunksize=chunksize))
+
+        results = []
+        for index, algorithm in enumerate(self.algorithms):
+            rewards, possible_rewards, arm_counts = zip(
+                *runs[index * self.n_sims : (index + 1) * self.n_sims]
+            )
+            results.append(
+                SimulationResult(
+                    name=algorithm.name,
+                    rewards=np.stack(rewards),
+                    possible_rewards=np.stack(possible_rewards),
+                    arm_counts=np.stack(arm_counts),
+                )
+            )
+        return results
@@ -0,0 +1,117 @@
+"""
+    Hot reload of Multiarm Bandit settings from a file
+"""
+import json
+import os
+import threading
+from typing import Optional, Union
+from mab.mab import MAB
+from mab.threadsafe import ThreadSafeMAB
+
+
+class SettingsWatcher:
+    """
+    Watcher of the settings file (json with "active_versions")
+
+    When modification time or size of the file changes the settings are read
+    and applied with sync_settings, which changes only the difference with
+    the current arms. ThreadSafeMAB is synced inside of exclusive(), so its
+    threads keep selecting with their replicas while settings are applied.
+    Plain MAB swaps in the new active arms and mask with one assignment each,
+    so request threads selecting with it never see a half changed list.
+
+    ...
+
+    Attributes:
+    ----------
+
+    path : str
+        settings file
+
+    interval : float
+        seconds between checks of the file
+
+    reloads : int
+        number of applied settings
+
+    Methods:
+    -----------
+    check()
+        apply the settings if the file changed
+
+    start(), stop()
+        check the file in background thread (or use "with")
+    """
+
+    def __init__(self, mab: Union[MAB, ThreadSafeMAB], path: str, interval: float = 1.0):
+        """
+        Args:
+            mab (MAB or ThreadSafeMAB): multiarm bandit to sync
+            path (str): settings file
+            interval (float, optional): seconds between checks. Defaults to 1.0.
+        """
+        self.path = path
+        self.interval = interval
+        self.reloads = 0
+
+        self._mab = mab
+        self._signature = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> bool:
+        """ Apply the settings if the file changed since the last check
+
+        Returns:
+            bool: True if the settings were applied
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return False
+
+        try:
+            with open(self.path) as file:
+                settings = json.load(file)
+        except ValueError:
+            # file is being written, try on the next check
+            return False
+
+        if isinstance(self._mab, ThreadSafeMAB):
+            with self._mab.exclusive() as mab:
+                mab.sync_settings(settings)
+        else:
+            self._mab.sync_settings(settings)
+
+        self._signature = signature
+        self.reloads += 1
+        return True
+
+    def _watch(self):
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def start(self):
+        """Apply current settings and start checking the file in background thread"""
+        if self._thread is None:
+            self.check()
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._watch, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop checking the file"""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
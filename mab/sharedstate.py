@@ -0,0 +1,322 @@
+"""
+    Shared memory state of Multiarm Bandit for multi-process workers
+"""
+from multiprocessing import shared_memory
+from time import monotonic
+from typing import Dict, List, Tuple, Union
+import numpy as np
+from mab.mab import MAB
+
+_HEADER_DTYPE = np.int64
+_HEADER_SIZE = 2  # n_arms, n_workers
+_ALIGNMENT = 8
+
+
+def _layout(mab: MAB, n_arms: int, n_workers: int) -> Tuple[Dict[str, tuple], int]:
+    """Offsets, dtypes and shapes of the arrays in the shared memory block"""
+    blocks = [("header", _HEADER_DTYPE, (_HEADER_SIZE,)), ("active", np.uint8, (n_arms,))]
+    blocks.append(("slot_updates", np.int64, (n_workers,)))
+    blocks.append(("slot_settings", np.int64, (n_workers,)))
+    for name, (dtype, _) in mab._ARM_COLUMNS.items():
+        blocks.append(("base_" + name, dtype, (n_arms,)))
+
+    blocks.append(("slot_counts", np.int64, (n_workers, n_arms)))
+    blocks.append(("slot_values", np.float64, (n_workers, n_arms)))
+    for name in mab._column_increments(np.empty(0)):
+        blocks.append(("slot_" + name, np.float64, (n_workers, n_arms)))
+
+    layout, offset = {}, 0
+    for name, dtype, shape in blocks:
+        layout[name] = (offset, dtype, shape)
+        offset += np.dtype(dtype).itemsize * int(np.prod(shape))
+        offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+    return layout, offset
+
+
+class SharedMAB:
+    """
+    Multiarm Bandit state shared by worker processes
+
+    Counts, values (and additive columns like BetaTS alpha/beta) and active mask
+    live in one multiprocessing.shared_memory block. Every worker writes its
+    updates only into its own slot (row of counts and reward sums), so no locks
+    are needed, and the state is the base state plus sum of all the slots.
+    Worker keeps its own MAB, applies own updates to it right away
+    and reloads the shared state before selections (every refresh_interval)
+    if other workers wrote updates or changed active arms since the last
+    reload. Every slot has counters of updates and of changes of active arms
+    (written only by its worker), so the check is O(n_workers) and caches of the local mab (Softmax alias table, UCB1 heap) survive
+    selections without updates of other workers.
+
+    Arm table (version ids) is fixed: all workers must have the same arms.
+
+    ...
+
+    Attributes:
+    ----------
+
+    mab: MAB
+        local multiarm bandit of the worker
+
+    name : str
+        name of the shared memory block to attach from other workers
+
+    worker : int
+        index of the worker slot
+
+    refresh_interval : float
+        seconds between checks of the shared state. 0 means before every selection
+
+    Methods:
+    -----------
+    create(mab, n_workers), attach(mab, name, worker)
+        create shared state from mab / attach to existing one
+
+    select_arm(), select_version(), select_arms(n), select_versions(n)
+        select with the shared state
+
+    update(chosen_arm, reward), update_many(chosen_arms, rewards)
+        write updates into the worker slot
+
+    activate_arm(index), deactivate_arm(index)
+        change active arms for all the workers
+
+    refresh()
+        reload shared state into the local mab
+
+    close(), unlink()
+        detach from / destroy the shared memory block
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        mab: MAB,
+        shm: shared_memory.SharedMemory,
+        n_workers: int,
+        worker: int,
+        refresh_interval: float = 0.0,
+    ):
+        """ Use create or attach instead
+
+        Args:
+            mab (MAB): local multiarm bandit
+            shm (SharedMemory): shared memory block
+            n_workers (int): number of worker slots
+            worker (int): index of the worker slot
+            refresh_interval (float, optional): seconds between reloads. Defaults to 0.0.
+        """
+        assert 0 <= worker < n_workers
+        self.mab = mab
+        self.name = shm.name
+        self.worker = worker
+        self.refresh_interval = refresh_interval
+
+        self._shm = shm
+        layout, _ = _layout(mab, mab.n_arms, n_workers)
+        self._blocks = {
+            name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            for name, (offset, dtype, shape) in layout.items()
+        }
+        self._increments = list(mab._column_increments(np.empty(0)))
+        self._last_refresh = None
+        # counters of updates and changes of active arms of other workers
+        # at the last reload
+        self._seen_counters = None
+
+    @classmethod
+    def create(
+        cls, mab: MAB, n_workers: int, name: str = None, refresh_interval: float = 0.0
+    ) -> "SharedMAB":
+        """ Create shared state with the current state of mab. Returns worker 0
+
+        Args:
+            mab (MAB): multiarm bandit with the initial state
+            n_workers (int): number of worker slots
+            name (str, optional): name of the block. Defaults to random name
+            refresh_interval (float, optional): seconds between reloads. Defaults to 0.0.
+
+        Returns:
+            SharedMAB: shared state for worker 0
+        """
+        _, size = _layout(mab, mab.n_arms, n_workers)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        shared = cls(mab, shm, n_workers, 0, refresh_interval)
+
+        blocks = shared._blocks
+        blocks["header"][:] = [mab.n_arms, n_workers]
+        blocks["slot_updates"][:] = 0
+        blocks["slot_settings"][:] = 0
+        blocks["active"][:] = mab._active_mask()
+        for name_ in mab._ARM_COLUMNS:
+            blocks["base_" + name_][:] = np.asarray(getattr(mab, name_))
+        blocks["slot_counts"][:] = 0
+        blocks["slot_values"][:] = 0.0
+        for name_ in shared._increments:
+            blocks["slot_" + name_][:] = 0.0
+        return shared
+
+    @classmethod
+    def attach(
+        cls, mab: MAB, name: str, worker: int, refresh_interval: float = 0.0
+    ) -> "SharedMAB":
+        """ Attach to existing shared state
+
+        Args:
+            mab (MAB): local multiarm bandit with the same arms
+            name (str): name of the shared memory block
+            worker (int): index of the worker slot
+            refresh_interval (float, optional): seconds between reloads. Defaults to 0.0.
+
+        Returns:
+            SharedMAB: shared state for the worker
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        n_arms, n_workers = np.ndarray(_HEADER_SIZE, dtype=_HEADER_DTYPE, buffer=shm.buf)
+        if n_arms != mab.n_arms:
+            shm.close()
+            raise ValueError(f"Shared state has {n_arms} arms, mab has {mab.n_arms}")
+
+        shared = cls(mab, shm, int(n_workers), worker, refresh_interval)
+        shared.refresh()
+        return shared
+
+    def refresh(self):
+        """Reload shared state (base state plus all the slots) into the local mab"""
+        blocks = self._blocks
+        # counters are read before the state, so updates written during
+        # the reload are noticed by the next check
+        self._seen_counters = self._other_counters()
+        base_counts = blocks["base_counts"]
+        base_values = blocks["base_values"]
+
+        counts = base_counts + blocks["slot_counts"].sum(axis=0)
+        rewards = base_values * base_counts + blocks["slot_values"].sum(axis=0)
+        values = np.divide(rewards, counts, out=base_values.copy(), where=counts > 0)
+
+        columns = {"counts": counts, "values": values}
+        for name in self._increments:
+            columns[name] = blocks["base_" + name] + blocks["slot_" + name].sum(axis=0)
+        self.mab.load_arm_state(**columns)
+
+        active_mask = blocks["active"].astype(bool)
+        if not np.array_equal(active_mask, self.mab._active_mask()):
+            version_ids = self.mab.version_ids
+            self.mab.sync_settings(
+                {"active_versions": [version_ids[i] for i in np.flatnonzero(active_mask)]}
+            )
+        self._last_refresh = monotonic()
+
+    def _other_counters(self) -> np.ndarray:
+        """Counters of updates and changes of active arms of other workers
+           (own ones are in the local mab)
+        """
+        counters = np.stack([self._blocks["slot_updates"], self._blocks["slot_settings"]])
+        counters[:, self.worker] = 0
+        return counters
+
+    def _changed(self) -> bool:
+        """Other workers wrote updates or changed active arms since the last reload"""
+        return not np.array_equal(self._seen_counters, self._other_counters())
+
+    def _maybe_refresh(self):
+        if self._last_refresh is None:
+            self.refresh()
+        elif monotonic() - self._last_refresh >= self.refresh_interval:
+            if self._changed():
+                self.refresh()
+            else:
+                self._last_refresh = monotonic()
+
+    def select_arm(self) -> int:
+        """Select arm with the shared state"""
+        self._maybe_refresh()
+        return self.mab.select_arm()
+
+    def select_version(self) -> str:
+        """Select version with the shared state"""
+        self._maybe_refresh()
+        return self.mab.select_version()
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """Select n arms with the shared state"""
+        self._maybe_refresh()
+        return self.mab.select_arms(n)
+
+    def select_versions(self, n: int) -> List[str]:
+        """Select n versions with the shared state"""
+        self._maybe_refresh()
+        return self.mab.select_versions(n)
+
+    def update(self, chosen_arm: Union[int, str], reward: float):
+        """ Write update into the worker slot and the local mab
+
+        Args:
+            chosen_arm (int or str): arm index or version_id
+            reward (float): reward
+        """
+        if isinstance(chosen_arm, str):
+            chosen_arm = self.mab.version_id_index(chosen_arm)
+
+        blocks, worker = self._blocks, self.worker
+        blocks["slot_counts"][worker, chosen_arm] += 1
+        blocks["slot_values"][worker, chosen_arm] += reward
+        increments = self.mab._column_increments(np.array([reward], dtype=np.float64))
+        for name, increment in increments.items():
+            blocks["slot_" + name][worker, chosen_arm] += increment[0]
+        blocks["slot_updates"][worker] += 1
+
+        self.mab.update(chosen_arm, reward)
+
+    def update_many(self, chosen_arms, rewards):
+        """ Write batch of updates into the worker slot and the local mab
+
+        Args:
+            chosen_arms (array-like of int or str): arm indexes or version_ids
+            rewards (array-like of float): rewards
+        """
+        chosen_arms = self.mab._arm_indexes(chosen_arms)
+        rewards = np.asarray(rewards, dtype=np.float64)
+        blocks, worker, n_arms = self._blocks, self.worker, self.mab.n_arms
+
+        blocks["slot_counts"][worker] += np.bincount(chosen_arms, minlength=n_arms)
+        blocks["slot_values"][worker] += np.bincount(
+            chosen_arms, weights=rewards, minlength=n_arms
+        )
+        for name, increments in self.mab._column_increments(rewards).items():
+            blocks["slot_" + name][worker] += np.bincount(
+                chosen_arms, weights=increments, minlength=n_arms
+            )
+        blocks["slot_updates"][worker] += len(chosen_arms)
+
+        self.mab.update_many(chosen_arms, rewards)
+
+    def activate_arm(self, index: int):
+        """ Make arm active for all the workers
+
+        Args:
+            index (int): index of the arm
+        """
+        self.mab.activate_arm(index)
+        self._blocks["active"][index] = self.mab.is_active(index)
+        self._blocks["slot_settings"][self.worker] += 1
+
+    def deactivate_arm(self, index: int):
+        """ Make arm inactive for all the workers
+
+        Args:
+            index (int): index of the arm
+        """
+        self.mab.deactivate_arm(index)
+        self._blocks["active"][index] = self.mab.is_active(index)
+        self._blocks["slot_settings"][self.worker] += 1
+
+    def close(self):
+        """Detach from the shared memory block"""
+        # numpy views must be released before the block is closed
+        self._blocks = {}
+        self._shm.close()
+
+    def unlink(self):
+        """Destroy the shared memory block (call once, usually by the creator)"""
+        self._shm.unlink()
@@ -0,0 +1,134 @@
+"""
+    Compact binary snapshot of Multiarm Bandit state
+
+    Layout (little-endian, every block starts at 8 bytes boundary):
+
+    header        magic b"MABS", format version (uint16), reserved (uint16),
+                  length of the json description (uint32)
+    description   json with class name, scalar parameters, column dtypes
+                  and replication state (node id and ledger of merges)
+    columns       raw arrays of per-arm state (counts, values, alpha, beta, ...)
+    active mask   one byte per arm
+    version ids   length of the table (uint32) and utf-8 version ids joined by "\\0"
+"""
+import json
+import struct
+from typing import Union
+import numpy as np
+from mab.mab import MAB
+from mab.merge import replication_state
+from mab.tools import dict2MAB
+
+MAGIC = b"MABS"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHI")
+_TABLE_LENGTH = struct.Struct("<I")
+_ALIGNMENT = 8
+
+# parameters stored outside of the json description
+_TABLE_PARAMS = ("version_ids", "active_arms")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _padding(offset: int) -> bytes:
+    return b"\0" * (_align(offset) - offset)
+
+
+def to_bytes(mab: MAB) -> bytes:
+    """ Serialize MAB into binary snapshot
+
+    Args:
+        mab (MAB): multiarm bandit to serialize
+
+    Returns:
+        bytes: snapshot
+    """
+    params = dict(mab)
+    columns = [np.asarray(params.pop(name)) for name in mab._ARM_COLUMNS]
+    columns = [column.astype(column.dtype.newbyteorder("<")) for column in columns]
+    for name in _TABLE_PARAMS:
+        params.pop(name)
+
+    description = json.dumps(
+        {
+            "name": mab.__class__.__name__,
+            "params": params,
+            "columns": [
+                [name, column.dtype.str]
+                for name, column in zip(mab._ARM_COLUMNS, columns)
+            ],
+            "replication": replication_state(mab),
+        },
+        default=lambda value: value.item(),
+    ).encode()
+
+    assert not any("\0" in version for version in mab.version_ids)
+    version_table = "\0".join(mab.version_ids).encode()
+
+    chunks = [_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(description)), description]
+    offset = _HEADER.size + len(description)
+    for block in columns + [mab._active_mask().astype(np.uint8)]:
+        chunks.append(_padding(offset))
+        offset = _align(offset)
+        chunks.append(block.tobytes())
+        offset += block.nbytes
+
+    chunks.append(_padding(offset))
+    chunks.append(_TABLE_LENGTH.pack(len(version_table)))
+    chunks.append(version_table)
+    return b"".join(chunks)
+
+
+def from_bytes(data: Union[bytes, bytearray, memoryview]) -> MAB:
+    """ Restore MAB from binary snapshot.
+        Per-arm arrays are read with np.frombuffer, if data is writable
+        (bytearray, writable memoryview) array backed MAB uses it without copy
+
+    Args:
+        data (bytes, bytearray, memoryview): snapshot
+
+    Returns:
+        MAB: restored multiarm bandit
+    """
+    buffer = memoryview(data)
+    magic, version, _, description_length = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Not a MAB snapshot")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+
+    offset = _HEADER.size
+    description = json.loads(bytes(buffer[offset : offset + description_length]))
+    offset += description_length
+
+    params = description["params"]
+    n_arms = params["n_arms"]
+    array_backed = params.get("array_backed", False)
+
+    for name, dtype in description["columns"]:
+        offset = _align(offset)
+        column = np.frombuffer(buffer, dtype=dtype, count=n_arms, offset=offset)
+        offset += column.nbytes
+        params[name] = column if array_backed else column.tolist()
+
+    offset = _align(offset)
+    active_mask = np.frombuffer(buffer, dtype=np.uint8, count=n_arms, offset=offset)
+    params["active_arms"] = np.flatnonzero(active_mask).tolist()
+    offset = _align(offset + n_arms)
+
+    (table_length,) = _TABLE_LENGTH.unpack_from(buffer, offset)
+    offset += _TABLE_LENGTH.size
+    version_table = bytes(buffer[offset : offset + table_length]).decode()
+    params["version_ids"] = version_table.split("\0") if n_arms else []
+
+    return dict2MAB(
+        {
+            "name": description["name"],
+            "params": params,
+            "replication": description.get("replication"),
+        }
+    )
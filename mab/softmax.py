@@ -2,10 +2,11 @@
     Softmax Muli-armed banded
 """
 
-from random import choices
 from math import exp
-from typing import List, Set
-from mab.mab import MAB
+from typing import List, Optional, Set
+import numpy as np
+from mab.alias import AliasTable
+from mab.mab import MAB, Seed
 
 
 class Softmax(MAB):
@@ -41,6 +42,12 @@ class Softmax(MAB):
 
     select_arm()
         select index of arm to chose next (the core of the algorithm)
+
+    select_arms(n)
+        select n arms at once
+
+    probabilities
+        probabilities of selecting each arm (cached until update)
     """
 
     # pylint: disable=too-many-arguments
@@ -52,6 +59,8 @@ class Softmax(MAB):
         version_ids: List[str] = None,
         active_arms: Set[int] = None,
         temperature: float = 0.1,
+        array_backed: bool = False,
+        seed: Seed = None,
     ):
         """
         Args:
@@ -66,10 +75,16 @@ class Softmax(MAB):
             version_ids (list): list of version ids. 
                                 Defaults to list of indexes as strings
             active_arms (set): set of indexes of active arms
+            array_backed (bool): store per-arm state as numpy arrays. Defaults to False
+            seed (int, SeedSequence or Generator, optional): seed of the instance
+                random generator. Defaults to fresh entropy
         """
 
-        super().__init__(counts, values, n_arms, version_ids, active_arms)
+        super().__init__(
+            counts, values, n_arms, version_ids, active_arms, array_backed, seed
+        )
         self.temperature = temperature  # parameter of the algorithm
+        self._state_changed()
 
     @property
     def name(self) -> str:
@@ -85,16 +100,118 @@ class Softmax(MAB):
         """High level produnction name"""
         return "Custom solution - 2"
 
+    def _state_changed(self):
+        """Drop cached distribution"""
+        super()._state_changed()
+        self._probabilities = None
+        self._alias = None
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        """Probabilities of selecting each arm. Inactive arms have zero probability.
+           Distribution is cached until update (or temperature change)
+
+        Returns:
+            np.ndarray: probabilities of the arms
+        """
+        self._refresh_distribution()
+        return self._probabilities
+
+    def _refresh_distribution(self):
+        """Recalculate distribution if it was dropped or temperature changed"""
+        if self._probabilities is None or self._temperature != self.temperature:
+            self._temperature = self.temperature
+            active_arms = np.asarray(self.active_arms, dtype=np.int64)
+            scaled = np.asarray(self.values, dtype=np.float64)[active_arms]
+            scaled /= self.temperature
+
+            # log-sum-exp to avoid overflow for small temperatures
+            max_scaled = scaled.max()
+            log_norm = max_scaled + np.log(np.exp(scaled - max_scaled).sum())
+            active_probabilities = np.exp(scaled - log_norm)
+
+            self._probabilities = np.zeros(self.n_arms)
+            self._probabilities[active_arms] = active_probabilities
+            self._sampled_arms = active_arms
+            self._cum_probabilities = np.cumsum(active_probabilities)
+            self._alias = None
+            self._draws = 0
+
+    def arm_probabilities(self) -> np.ndarray:
+        """Probabilities of selecting each arm (same as probabilities)
+
+        Returns:
+            np.ndarray: probabilities of the arms
+        """
+        return self.probabilities.copy()
+
+    def _alias_table(self, n_draws: int) -> Optional[AliasTable]:
+        """Alias table of the current distribution.
+           It's built only after the distribution served as many draws
+           as there are active arms so O(n_arms) build is amortized.
+           Before that draws use binary search over cumulative probabilities
+
+        Args:
+            n_draws (int): number of draws to make
+
+        Returns:
+            AliasTable: alias table or None if it's not built yet
+        """
+        self._refresh_distribution()
+        if self._alias is None:
+            self._draws += n_draws
+            if self._draws >= len(self._sampled_arms):
+                self._alias = AliasTable(
+                    self._probabilities[self._sampled_arms], self._sampled_arms
+                )
+        return self._alias
+
+    def _search_arms(self, uniforms):
+        """Map uniform numbers into arms with binary search"""
+        positions = np.searchsorted(
+            self._cum_probabilities,
+            uniforms * self._cum_probabilities[-1],
+            side="right",
+        )
+        return self._sampled_arms[np.minimum(positions, len(self._sampled_arms) - 1)]
+
     def select_arm(self) -> int:
         """Softmax algorythm implementaion
 
         Returns:
             int: arm to select next
         """
-        # update epsilon if weaknes multipler was set
-        # TODO: Implement logic to handle active versions
-        probs = [exp(v / self.temperature) for v in self.values]
-        scale_denomiator = sum(probs)
-        probs = [p / scale_denomiator for p in probs]
+        if self._arm_state is None:
+            return self._select_arm_scalar()
+        alias_table = self._alias_table(1)
+        if alias_table is not None:
+            return alias_table.draw(self._uniform())
+        return int(self._search_arms(self._uniform()))
+
+    def _select_arm_scalar(self) -> int:
+        """Softmax over python lists (list backed state)"""
+        values, temperature, active_arms = self.values, self.temperature, self.active_arms
+        max_value = max(values[arm] for arm in active_arms)
+        weights = [exp((values[arm] - max_value) / temperature) for arm in active_arms]
+
+        threshold = self._uniform() * sum(weights)
+        for arm, weight in zip(active_arms, weights):
+            threshold -= weight
+            if threshold < 0:
+                return arm
+        return active_arms[-1]
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """Select n arms at once
+
+        Args:
+            n (int): number of arms to select
 
-        return choices(range(self.n_arms), weights=probs)[0]
+        Returns:
+            np.ndarray: indexes of the selected arms
+        """
+        alias_table = self._alias_table(n)
+        uniforms = self._rng.random(n)
+        if alias_table is not None:
+            return alias_table.draw_many(uniforms)
+        return self._search_arms(uniforms)
@@ -0,0 +1,194 @@
+"""
+    Thread-safe wrapper for Multiarm Bandits
+"""
+import copy
+import threading
+from contextlib import contextmanager
+from time import monotonic
+from typing import List, Tuple, Union
+import numpy as np
+from mab.mab import MAB, spawn_seeds
+
+
+class _UpdateShard:
+    """Per-thread buffer of not merged updates"""
+
+    # pylint: disable=too-few-public-methods
+    __slots__ = ("lock", "arms", "rewards", "size")
+
+    def __init__(self, capacity: int):
+        # the lock is taken only by the owner thread and by merges
+        self.lock = threading.Lock()
+        self.arms = np.empty(capacity, dtype=np.int64)
+        self.rewards = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+
+    def drain(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Take buffered updates out of the shard"""
+        with self.lock:
+            arms = self.arms[: self.size].copy()
+            rewards = self.rewards[: self.size].copy()
+            self.size = 0
+        return arms, rewards
+
+
+class ThreadSafeMAB:
+    """
+    Thread-safe wrapper for Multiarm Bandit
+
+    Updates go to per-thread buffers (shards) that are merged into the shared
+    state with update_many when a buffer is full or flush_interval passed.
+    After every merge one read-only copy of the state is published. Every
+    thread selects with a shallow view of it: per-arm state is shared, only
+    the random generator and selection state (like AB.current_arm) are the
+    thread's own, so selections never wait for updates and a merge costs one
+    copy of the state, not one per thread.
+
+    ...
+
+    Attributes:
+    ----------
+
+    buffer_size : int
+        number of updates buffered by a thread before merge
+
+    flush_interval : float
+        maximum seconds between merges (checked on update)
+
+    Methods:
+    -----------
+    select_arm(), select_version(), select_arms(n), select_versions(n)
+        select with the view of the current thread
+
+    update(chosen_arm, reward)
+        buffer the update
+
+    flush()
+        merge buffered updates of all the threads
+
+    exclusive()
+        context manager with the merged MAB for changes like add_arm
+    """
+
+    def __init__(self, mab: MAB, buffer_size: int = 1024, flush_interval: float = 0.1):
+        """
+        Args:
+            mab (MAB): multiarm bandit to wrap. It shouldn't be used directly after that
+            buffer_size (int, optional): updates buffered by a thread. Defaults to 1024.
+            flush_interval (float, optional): maximum seconds between merges.
+                Defaults to 0.1.
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+
+        self._mab = mab
+        self._merge_lock = threading.Lock()
+        self._shards: List[_UpdateShard] = []
+        self._local = threading.local()
+        self._seed_lock = threading.Lock()
+        self._version = 0
+        self._published = copy.deepcopy(mab)
+        self._last_merge = monotonic()
+
+    @property
+    def version(self) -> int:
+        """Number of published states"""
+        return self._version
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered updates not merged yet"""
+        return sum(shard.size for shard in self._shards)
+
+    def _replica(self) -> MAB:
+        """View of the published state for the current thread (refreshed after merges)"""
+        local = self._local
+        if getattr(local, "version", None) != self._version:
+            # read version first, published state can only become newer
+            local.version = self._version
+            previous = getattr(local, "replica", None)
+            replica = copy.copy(self._published)
+            if previous is None:
+                # threads would repeat the same random draws otherwise
+                with self._seed_lock:
+                    replica.reseed(spawn_seeds(self._published._rng, 1)[0])
+            else:
+                replica._continue_selections(previous)
+            local.replica = replica
+        return local.replica
+
+    def select_arm(self) -> int:
+        """Select arm with the view of the current thread"""
+        return self._replica().select_arm()
+
+    def select_version(self) -> str:
+        """Select version with the view of the current thread"""
+        return self._replica().select_version()
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """Select n arms with the view of the current thread"""
+        return self._replica().select_arms(n)
+
+    def select_versions(self, n: int) -> List[str]:
+        """Select n versions with the view of the current thread"""
+        return self._replica().select_versions(n)
+
+    def update(self, chosen_arm: Union[int, str], reward: float):
+        """ Buffer update in the shard of the current thread
+
+        Args:
+            chosen_arm (int or str): arm index or version_id
+            reward (float): reward
+        """
+        if isinstance(chosen_arm, str):
+            chosen_arm = self._published.version_id_index(chosen_arm)
+
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _UpdateShard(self.buffer_size)
+            with self._merge_lock:
+                self._shards.append(shard)
+
+        with shard.lock:
+            shard.arms[shard.size] = chosen_arm
+            shard.rewards[shard.size] = reward
+            shard.size += 1
+            is_full = shard.size == self.buffer_size
+
+        if is_full:
+            self._merge([shard])
+        elif monotonic() - self._last_merge > self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Merge buffered updates of all the threads and publish new state"""
+        self._merge(self._shards)
+
+    def _merge(self, shards: List[_UpdateShard]):
+        with self._merge_lock:
+            self._merge_locked(shards)
+
+    def _merge_locked(self, shards: List[_UpdateShard]):
+        batches = [shard.drain() for shard in list(shards)]
+        arms = np.concatenate([batch[0] for batch in batches] or [np.empty(0, np.int64)])
+        rewards = np.concatenate([batch[1] for batch in batches] or [np.empty(0)])
+        if len(arms):
+            self._mab.update_many(arms, rewards)
+            self._publish()
+        else:
+            self._last_merge = monotonic()
+
+    def _publish(self):
+        self._published = copy.deepcopy(self._mab)
+        self._version += 1
+        self._last_merge = monotonic()
+
+    @contextmanager
+    def exclusive(self):
+        """ Context manager with merged MAB for changes like add_arm or sync_settings.
+            New state is published on exit
+        """
+        with self._merge_lock:
+            self._merge_locked(self._shards)
+            yield self._mab
+            self._publish()
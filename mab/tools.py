@@ -7,6 +7,7 @@ from mab.betats import BetaTS
 from mab.softmax import Softmax
 from mab.epsilongreedy import EpsilonGreedy
 from mab.randomselect import RandomSelect
+from mab.merge import load_replication_state
 
 # pylint: disable = invalid-name
 def dict2MAB(d: dict):
@@ -14,6 +15,7 @@ def dict2MAB(d: dict):
 
     Args:
         d (dict): dictionary with the class attributes like name and internal paramters
+            (and node id and ledger of merges, see mab.merge)
     """
     class_mapping = {
         "AB": AB,
@@ -28,4 +30,9 @@ def dict2MAB(d: dict):
     class_instance = class_mapping[d["name"]]
     parameters = d["params"]
     mab_object = class_instance(**parameters)
+    if "epsilon" in parameters:
+        # __init__ starts decay from 1.0 if weakness_mult is set, keep the decayed epsilon
+        mab_object.epsilon = parameters["epsilon"]
+    if d.get("replication") is not None:
+        load_replication_state(mab_object, d["replication"])
     return mab_object
@@ -1,6 +1,9 @@
 """ Upper Confidence Boundary1 Muli-armed banded """
-from math import log, sqrt
-from mab.mab import MAB
+from heapq import heapify, heappop, heappush
+from math import inf, log, sqrt
+from typing import List, Set
+import numpy as np
+from mab.mab import MAB, Seed
 
 
 class UCB1(MAB):
@@ -25,6 +28,10 @@ class UCB1(MAB):
     active_arms set: 
         set of indexes of active arms
 
+    lazy_index: bool
+        keep arms in lazily refreshed max-heap of UCB values
+        (sub-linear selection for very large number of arms)
+
     Methods:
     -----------
     All the methods from MAB plus
@@ -32,7 +39,50 @@ class UCB1(MAB):
     select_arm()
         select index of arm to chose next (the core of the algorythm)
 
+    select_arms(n)
+        select n arms at once
+
     """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        counts: List[int] = None,
+        values: List[float] = None,
+        n_arms: int = None,
+        version_ids: List[str] = None,
+        active_arms: Set[int] = None,
+        array_backed: bool = False,
+        lazy_index: bool = False,
+        seed: Seed = None,
+    ):
+        """
+        Args:
+            counts (list[int]): number of times event happend for each arm.
+                                Defaults to [0] * n_arms
+            values (list[float]): total rewards for each arm
+                                Defaults to [0.0] * n_arms
+            n_arms (int): Number of arms. Defaults to len(counts)
+            version_ids (list): list of version ids.
+                                Defaults to list of indexes as strings
+            active_arms (set): set of indexes of active arms
+            array_backed (bool): store per-arm state as numpy arrays. Defaults to False
+            lazy_index (bool): select with lazily refreshed max-heap. Defaults to False
+            seed (int, SeedSequence or Generator, optional): seed of the instance
+                random generator. Defaults to fresh entropy
+        """
+        super().__init__(
+            counts, values, n_arms, version_ids, active_arms, array_backed, seed
+        )
+        self.lazy_index = lazy_index
+        self._heap = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # selections change the lazy index in place, copies rebuild their own
+        state["_heap"] = None
+        return state
+
     @property
     def name(self) -> str:
         """Name of the algorythm (depends on parameters)
@@ -53,21 +103,204 @@ class UCB1(MAB):
         Returns:
             int: arm to select next
         """
+        if self.lazy_index:
+            return self._select_arm_lazy()
+        if self._arm_state is None:
+            return self._select_arm_scalar()
 
+        active_arms = np.asarray(self.active_arms, dtype=np.int64)
+        counts = np.asarray(self.counts)[active_arms]
+
+        # observe arms with no counts
+        not_played = np.flatnonzero(counts == 0)
+        if not_played.size:
+            return int(active_arms[not_played[0]])
+
+        values = np.asarray(self.values)[active_arms]
+        ucb_values = values + np.sqrt(2 * log(self.total_count) / counts)
+        return int(active_arms[np.argmax(ucb_values)])
+
+    def _select_arm_scalar(self) -> int:
+        """UCB1 over python lists (list backed state)"""
+        counts, values, active_arms = self.counts, self.values, self.active_arms
         # observe arms with no counts
-        for arm, count in enumerate(self.counts):
-            if count == 0:
+        for arm in active_arms:
+            if counts[arm] == 0:
                 return arm
 
-        max_ind = 0
-        max_val = 0
-        total_counts = sum(self.counts)
+        log_total = 2 * log(self.total_count)
+        best_arm, best_value = active_arms[0], -inf
+        for arm in active_arms:
+            value = values[arm] + sqrt(log_total / counts[arm])
+            if value > best_value:
+                best_arm, best_value = arm, value
+        return best_arm
+
+    def select_arms(self, n: int) -> np.ndarray:
+        """Select n arms at once. UCB1 is deterministic, so without updates
+           in between every decision is the same arm
+
+        Args:
+            n (int): number of arms to select
+
+        Returns:
+            np.ndarray: indexes of the selected arms
+        """
+        return np.full(n, self.select_arm(), dtype=np.int64)
+
+    def arm_probabilities(self) -> np.ndarray:
+        """UCB1 is deterministic: the selected arm has probability 1
+
+        Returns:
+            np.ndarray: probabilities of the arms
+        """
+        probabilities = np.zeros(self.n_arms)
+        probabilities[self.select_arm()] = 1.0
+        return probabilities
+
+    # Lazy index. Every active arm has an entry (-upper bound, arm) in the heap.
+    # Upper bound is the UCB value for the count horizon (total count at the
+    # time of building plus _HORIZON_SLACK of it), UCB values only grow with
+    # total count so they stay upper bounds until total count reaches the
+    # horizon. Rebuild is O(n_arms) and amortized over the slack updates,
+    # it's skipped while there are not played arms (their bound is infinity).
+    # Entries of updated or deactivated arms are dropped when they are popped.
+
+    _HORIZON_SLACK = 1 / 64
+
+    def _rebuild_index(self):
+        """Recalculate upper bounds of all the arms and heapify them. O(n_arms)"""
+        slack = max(int(self.total_count * self._HORIZON_SLACK), 2)
+        self._horizon = self.total_count + slack
+        self._log_horizon = 2 * log(self._horizon)
+        with np.errstate(divide="ignore"):
+            upper_bounds = np.asarray(self.values, dtype=np.float64) + np.sqrt(
+                self._log_horizon / np.asarray(self.counts, dtype=np.float64)
+            )
+        self._upper_bounds = upper_bounds.tolist()
+        self._heap = [(-self._upper_bounds[arm], arm) for arm in self.active_arms]
+        heapify(self._heap)
+
+    def _push_arms(self, arms: List[int]):
+        """Refresh upper bounds of the arms and push their new entries. O(len(arms) log n_arms)"""
+        if self._heap is None:
+            return
 
-        for arm in range(self.n_arms):
-            curr_value = self.values[arm] + sqrt(
-                2 * log(total_counts) / float(self.counts[arm])
+        if len(self._heap) + len(arms) > 2 * self.n_arms + 64:
+            # too many stale entries
+            self._heap = None
+            return
+
+        active_mask = self._active_mask()
+        for arm in arms:
+            count = self.counts[arm]
+            upper_bound = (
+                self.values[arm] + sqrt(self._log_horizon / count) if count else inf
             )
-            if curr_value > max_val:
-                max_val = curr_value
-                max_ind = arm
-        return max_ind
+            self._upper_bounds[arm] = upper_bound
+            if active_mask[arm]:
+                heappush(self._heap, (-upper_bound, arm))
+
+    def _drop_stale_top(self, active_mask: np.ndarray):
+        """Pop entries of updated or deactivated arms from the top of the heap"""
+        heap = self._heap
+        while heap and (
+            -heap[0][0] != self._upper_bounds[heap[0][1]] or not active_mask[heap[0][1]]
+        ):
+            heappop(heap)
+
+    def _select_arm_lazy(self) -> int:
+        """Pop arms while their upper bound can beat the best UCB value found,
+           evaluate only them and push them back
+
+        Returns:
+            int: arm to select next
+        """
+        active_mask = self._active_mask()
+        if self._heap is not None:
+            self._drop_stale_top(active_mask)
+        if self._heap is None or (
+            self.total_count > self._horizon and self._heap and self._heap[0][0] != -inf
+        ):
+            # upper bounds are outdated (not played arms go first anyway)
+            self._rebuild_index()
+
+        heap = self._heap
+        log_total = 2 * log(max(self.total_count, 1))
+        popped = []
+        best_arm, best_value = None, -inf
+        while heap and -heap[0][0] > best_value:
+            entry = heappop(heap)
+            upper_bound, arm = -entry[0], entry[1]
+            if upper_bound != self._upper_bounds[arm] or not active_mask[arm]:
+                # stale entry
+                continue
+
+            popped.append(entry)
+            if upper_bound == inf:
+                # not played arm with the smallest index
+                best_arm = arm
+                break
+
+            value = self.values[arm] + sqrt(log_total / self.counts[arm])
+            if value > best_value:
+                best_arm, best_value = arm, value
+
+        for entry in popped:
+            heappush(heap, entry)
+
+        if best_arm is None:
+            return self.active_arms[0]
+        return best_arm
+
+    def update(self, chosen_arm, reward):
+        """Update chosen arm and its entry of the lazy index
+
+        Args:
+            chosen_arm (int or str): arm index or version_id
+            reward (float): reward
+        """
+        if isinstance(chosen_arm, str):
+            chosen_arm = self.version_id_index(chosen_arm)
+        super().update(chosen_arm, reward)
+        self._push_arms([chosen_arm])
+
+    def update_many(self, chosen_arms, rewards):
+        """Update arms with the batch of rewards and their entries of the lazy index
+
+        Args:
+            chosen_arms (array-like of int or str): arm indexes or version_ids
+            rewards (array-like of float): rewards
+        """
+        chosen_arms = self._arm_indexes(chosen_arms)
+        super().update_many(chosen_arms, rewards)
+        self._push_arms(np.unique(chosen_arms).tolist())
+
+    def _active_changed(self, activated, deactivated):
+        """Add activated arms to the lazy index (entries of deactivated ones
+           are dropped when they are popped)
+
+        Args:
+            activated (list[int]): indexes of activated arms
+            deactivated (list[int]): indexes of deactivated arms
+        """
+        super()._active_changed(activated, deactivated)
+        self._push_arms(activated)
+
+    def add_arm(self, version_id: str = None, is_active: bool = True):
+        """Add arm and keep upper bounds of the lazy index aligned with arms
+
+        Args:
+            version_id (str, optional): version_id of the MAB arm. Defaults to None.
+            is_active (bool, optional): parameter if new version is active
+        """
+        super().add_arm(version_id, is_active=False)
+        if self._heap is not None:
+            self._upper_bounds.append(inf)
+        if is_active:
+            self.activate_arm(self.n_arms - 1)
+
+    def _state_reloaded(self):
+        """Drop the lazy index after reset or state reload"""
+        super()._state_reloaded()
+        self._heap = None
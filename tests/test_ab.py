@@ -21,3 +21,13 @@ def test_reset(model):
     model.reset()
     assert sum(model.counts) == 30
     assert model.current_arm == 0
+
+
+def test_select_arms():
+    sequential = AB(n_arms=5)
+    batched = AB(n_arms=5)
+    for m in (sequential, batched):
+        m.deactivate_arm(2)
+    expected = [sequential.select_arm() for _ in range(7)]
+    assert batched.select_arms(7).tolist() == expected
+    assert batched.current_arm == sequential.current_arm
@@ -0,0 +1,23 @@
+from mab.alias import AliasTable
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def table():
+    return AliasTable([0.1, 0.0, 0.6, 0.3], outcomes=[10, 11, 12, 13])
+
+
+def test_size(table):
+    assert table.size == 4
+
+
+def test_draw(table):
+    draws = [table.draw(u) for u in np.random.random(1000).tolist()]
+    assert set(draws) <= {10, 12, 13}
+
+
+def test_draw_many_frequencies(table):
+    draws = table.draw_many(np.random.random(200000))
+    frequencies = np.bincount(draws - 10, minlength=4) / len(draws)
+    assert frequencies == pytest.approx([0.1, 0.0, 0.6, 0.3], abs=0.01)
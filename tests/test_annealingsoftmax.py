@@ -1,5 +1,6 @@
 from mab.annealingsoftmax import AnnealingSoftmax
 import pytest
+from math import log
 
 
 @pytest.fixture
@@ -17,3 +18,45 @@ def test_name(model):
 
 def test_select_arm(model):
     assert model.select_arm() in [0, 1]
+
+
+def test_select_arms(model):
+    arms = model.select_arms(50)
+    assert len(arms) == 50
+    assert set(arms.tolist()) <= {0, 1}
+
+
+def _rescan_temperature(model):
+    temp = 1
+    for arm in model.active_arms:
+        temp += model.counts[arm] + 1
+    return 1.0 / log(temp + model._EPSILON)
+
+
+def test_temperature_incremental(model):
+    model.add_arm(is_active=False)
+    model.update(0, 1.0)
+    model.update(model.version_ids[2], 0.0)
+    model.update_many([0, 1, 2, 2], [1.0, 0.0, 1.0, 1.0])
+    model.select_arm()
+    assert model.temperature == pytest.approx(_rescan_temperature(model))
+
+    model.activate_arm(2)
+    model.deactivate_arm(0)
+    model.select_arm()
+    assert model.temperature == pytest.approx(_rescan_temperature(model))
+
+    model.sync_settings({"active_versions": ["0", "1"]})
+    model.select_arm()
+    assert model.temperature == pytest.approx(_rescan_temperature(model))
+
+    model.reset()
+    model.select_arms(3)
+    assert model.temperature == pytest.approx(_rescan_temperature(model))
+
+
+def test_cached_distribution(model):
+    model.select_arm()
+    probabilities = model.probabilities
+    model.select_arm()
+    assert model.probabilities is probabilities
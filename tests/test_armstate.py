@@ -0,0 +1,35 @@
+from mab.armstate import ArmState
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def state():
+    s = ArmState(2)
+    s.add_column("counts", [10, 20], np.int64)
+    s.add_column("alpha", [1.0, 2.0], np.float64, default=1.0)
+    return s
+
+
+def test_columns(state):
+    assert state.columns == ["counts", "alpha"]
+    assert state.column("counts").tolist() == [10, 20]
+    assert state.column("counts").dtype == np.int64
+
+
+def test_append_defaults(state):
+    state.append(2)
+    assert state.n_arms == 4
+    assert state.column("counts").tolist() == [10, 20, 0, 0]
+    assert state.column("alpha").tolist() == [1.0, 2.0, 1.0, 1.0]
+
+
+def test_append_amortized(state):
+    capacities = set()
+    for _ in range(1000):
+        state.append()
+        capacities.add(state.capacity)
+    assert state.n_arms == 1002
+    assert state.capacity >= 1002
+    # buffers are reallocated only a logarithmic number of times
+    assert len(capacities) < 12
@@ -0,0 +1,88 @@
+from mab.asyncbandit import AsyncBandit
+from mab.betats import BetaTS
+import asyncio
+import time
+import pytest
+
+
+@pytest.fixture
+def mab():
+    return BetaTS(n_arms=3, version_ids=["a", "b", "c"])
+
+
+def test_queue_and_flush(mab):
+    async def scenario():
+        bandit = AsyncBandit(mab, batch_size=100, flush_interval=10)
+        await bandit.update("b", 1)
+        await bandit.update(2, 0)
+        assert bandit.queue_depth == 2
+        assert mab.counts == [0, 0, 0]
+        bandit.flush()
+        assert bandit.queue_depth == 0
+        assert mab.counts == [0, 1, 1]
+        assert bandit.stats.flushes == 1
+        assert bandit.stats.updates == 2
+
+    asyncio.run(scenario())
+
+
+def test_select(mab):
+    async def scenario():
+        bandit = AsyncBandit(mab)
+        assert await bandit.select_version() in ["a", "b", "c"]
+        assert await bandit.select_arm() in [0, 1, 2]
+        assert len(await bandit.select_versions(5)) == 5
+
+    asyncio.run(scenario())
+
+
+def test_size_trigger(mab):
+    async def scenario():
+        async with AsyncBandit(mab, batch_size=10, flush_interval=10) as bandit:
+            for _ in range(10):
+                await bandit.update("a", 1)
+            await asyncio.sleep(0.05)
+            assert bandit.queue_depth == 0
+            assert bandit.mab.counts[0] == 10
+
+    asyncio.run(scenario())
+
+
+def test_time_trigger_and_close(mab):
+    async def scenario():
+        async with AsyncBandit(mab, batch_size=1000, flush_interval=0.01) as bandit:
+            await bandit.update("a", 1)
+            await asyncio.sleep(0.05)
+            assert bandit.mab.counts[0] == 1
+            await bandit.update("c", 1)
+        assert bandit.mab.counts == [1, 0, 1]
+        assert bandit.stats.max_latency >= bandit.stats.mean_latency > 0
+
+    asyncio.run(scenario())
+
+
+def test_flush_off_loop(mab, monkeypatch):
+    update_many = BetaTS.update_many
+
+    def slow_update_many(self, chosen_arms, rewards):
+        time.sleep(0.1)
+        update_many(self, chosen_arms, rewards)
+
+    monkeypatch.setattr(BetaTS, "update_many", slow_update_many)
+
+    async def scenario():
+        bandit = AsyncBandit(mab, batch_size=100, flush_interval=10)
+        await bandit.update("a", 1)
+        flush = asyncio.get_running_loop().create_task(bandit.flush_async())
+        await asyncio.sleep(0.01)
+        # the loop serves decisions and sync flushes while the copy is updated
+        assert not flush.done()
+        assert await bandit.select_arm() in [0, 1, 2]
+        await bandit.update("b", 1)
+        bandit.flush()
+        await flush
+        assert bandit.mab is not mab
+        assert bandit.mab.counts == [1, 1, 0]
+        assert bandit.stats.flushes == 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,70 @@
+from mab.betats import BetaTS
+import pytest
+
+
+@pytest.fixture
+def model():
+    return BetaTS([1, 2], [3, 4], [10, 20], [0.1, 0.5])
+
+
+def test_type(model):
+    assert isinstance(model, BetaTS)
+
+
+def test_name(model):
+    assert model.name == "BetaTS"
+
+
+def test_select_arm_active(model):
+    model.add_arm(is_active=True)
+    model.add_arm(is_active=True)
+    model.deactivate_arm(0)
+    for _ in range(20):
+        assert model.select_arm() in [1, 2, 3]
+
+
+def test_add_arm_priors(model):
+    model.add_arm()
+    assert model.alpha == [1, 2, 1]
+    assert model.beta == [3, 4, 1]
+
+
+def test_reset(model):
+    model.update(0, 1)
+    model.reset()
+    assert model.alpha == [1, 2]
+    assert model.counts == [10, 20]
+
+
+def test_select_arms(model):
+    model.add_arm(is_active=False)
+    arms = model.select_arms(100)
+    assert len(arms) == 100
+    assert set(arms.tolist()) <= {0, 1}
+
+
+def test_update_many(model):
+    sequential = BetaTS(n_arms=3)
+    arms = [0, 2, 2, 1, 0, 2]
+    rewards = [1, 0, 1, 1, 1, 0]
+    for arm, reward in zip(arms, rewards):
+        sequential.update(arm, reward)
+    batched = BetaTS(n_arms=3, array_backed=True)
+    batched.update_many(arms, rewards)
+    assert batched.alpha.tolist() == sequential.alpha
+    assert batched.beta.tolist() == sequential.beta
+    assert batched.counts.tolist() == sequential.counts
+
+
+def test_update_version(model):
+    model.update("1", 1)
+    assert model.alpha == [1, 3]
+
+
+def test_seed_reproducible():
+    first = BetaTS(n_arms=100, seed=7, array_backed=True)
+    second = BetaTS(n_arms=100, seed=7, array_backed=True)
+    assert [first.select_arm() for _ in range(10)] == [
+        second.select_arm() for _ in range(10)
+    ]
+    assert first.select_arms(10).tolist() == second.select_arms(10).tolist()
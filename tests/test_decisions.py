@@ -0,0 +1,75 @@
+from mab.decisions import DecisionRegistry
+from mab.epsilongreedy import EpsilonGreedy
+import numpy as np
+import pytest
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def registry(clock):
+    mab = EpsilonGreedy(0.1, n_arms=3, array_backed=True)
+    return DecisionRegistry(mab, capacity=8, ttl=10.0, clock=clock)
+
+
+def test_reward(registry):
+    version, decision_id = registry.select_version()
+    arm = registry.mab.version_id_index(version)
+    assert registry.pending == 1
+    assert registry.reward(decision_id, 1.0)
+    assert registry.mab.counts[arm] == 1
+    assert registry.mab.values[arm] == 1.0
+    assert registry.pending == 0
+    assert not registry.reward(decision_id, 1.0)
+
+
+def test_ttl(registry, clock):
+    _, old = registry.select_arm()
+    clock.now = 5.0
+    _, new = registry.select_arm()
+    clock.now = 12.0
+    assert registry.expire() == 1
+    assert not registry.reward(old, 1.0)
+    assert registry.reward(new, 1.0)
+    assert registry.expired == 1
+
+
+def test_capacity(registry):
+    _, ids = registry.select_arms(6)
+    _, more = registry.select_arms(6)
+    assert registry.pending == 8
+    assert registry.expired == 4
+    assert not registry.reward(ids[3], 1.0)
+    assert registry.reward(ids[4], 1.0)
+    assert registry.reward(more[5], 1.0)
+
+
+def test_reward_many(registry):
+    arms, ids = registry.select_arms(5)
+    applied = registry.reward_many([ids[0], ids[0], ids[2], 100], [1.0, 1.0, 0.0, 1.0])
+    assert applied == 2
+    assert registry.mab.counts.sum() == 2
+    assert registry.mab.counts[arms[0]] >= 1
+    assert registry.pending == 3
+
+
+def test_wrap_around(registry, clock):
+    for step in range(5):
+        clock.now = float(step)
+        arms, ids = registry.select_arms(3)
+        assert registry.reward_many(ids, np.ones(3)) == 3
+    assert registry.pending == 0
+    assert registry.mab.counts.sum() == 15
+    clock.now = 100.0
+    assert registry.expire() == 0
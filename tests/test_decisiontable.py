@@ -0,0 +1,90 @@
+from mab.decisiontable import DecisionTable
+from mab.ab import AB
+from mab.mab import MAB
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+from mab.randomselect import RandomSelect
+from mab.softmax import Softmax
+from mab.ucb import UCB1
+import numpy as np
+import pytest
+
+
+def test_rebuild_every():
+    table = DecisionTable(UCB1([5, 5], [0.5, 0.6]), rebuild_every=3, max_age=None)
+    assert table.select_arm() == 1
+    for _ in range(2):
+        table.update(1, 0.0)
+    assert table.select_arm() == 1
+    assert table.rebuilds == 1
+    table.update(1, 0.0)
+    assert table.select_arm() == 0
+    assert table.rebuilds == 2
+
+
+def test_max_age():
+    table = DecisionTable(RandomSelect(n_arms=3), rebuild_every=10 ** 6, max_age=0.0)
+    table.select_arm()
+    table.select_arm()
+    assert table.rebuilds == 2
+
+
+def test_distribution():
+    mab = EpsilonGreedy(0.2, [1, 1, 1, 1], [0.1, 0.5, 0.2, 0.0], active_arms=[0, 1, 2])
+    table = DecisionTable(mab)
+    arms = table.select_arms(100_000)
+    frequencies = np.bincount(arms, minlength=4) / len(arms)
+    assert frequencies == pytest.approx(mab.arm_probabilities(), abs=0.01)
+    assert frequencies[3] == 0
+    assert table.select_version() in ["0", "1", "2"]
+
+
+@pytest.mark.parametrize(
+    "mab",
+    [
+        EpsilonGreedy(0.1, n_arms=3),
+        Softmax([1, 1, 1], [0.1, 0.2, 0.3]),
+        UCB1(n_arms=3),
+        RandomSelect(n_arms=3),
+        BetaTS([1, 5, 1], [1, 1, 5], n_arms=3),
+    ],
+)
+def test_arm_probabilities(mab):
+    probabilities = mab.arm_probabilities()
+    assert len(probabilities) == 3
+    assert probabilities.sum() == pytest.approx(1.0)
+
+
+def test_betats_probabilities():
+    probabilities = BetaTS([1, 50, 1], [1, 1, 50], n_arms=3).arm_probabilities()
+    assert probabilities[1] > 0.9
+
+
+def test_ab_probabilities():
+    table = DecisionTable(AB(n_arms=3, active_arms=[0, 2]))
+    arms = table.select_arms(10_000)
+    assert table.mab.arm_probabilities().tolist() == [0.5, 0.0, 0.5]
+    assert np.bincount(arms, minlength=3)[1] == 0
+
+
+class FirstActive(MAB):
+    def select_arm(self):
+        return self.active_arms[0]
+
+
+def test_estimated_probabilities():
+    assert FirstActive(n_arms=3, active_arms=[1, 2]).arm_probabilities().tolist() == [0, 1, 0]
+
+
+def test_decaying_epsilon():
+    mab = EpsilonGreedy(weakness_mult=0.99, counts=[1, 1, 1], values=[0.1, 0.2, 0.9])
+    table = DecisionTable(mab, rebuild_every=100, max_age=None)
+    arms = []
+    for _ in range(2500):
+        arms.append(table.select_arm())
+        table.update(arms[-1], float(arms[-1] == 2))
+    for _ in range(25):
+        arms.extend(table.select_arms(100).tolist())
+        table.update_many(arms[-100:], np.equal(arms[-100:], 2))
+    assert mab.epsilon == pytest.approx(0.99 ** 5000)
+    assert np.bincount(arms, minlength=3)[2] > 4500
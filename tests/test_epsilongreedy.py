@@ -27,3 +27,23 @@ def test_epsilon_check(model):
 def test_weakness(model_added_weakness):
     model_added_weakness.select_arm()
     assert model_added_weakness.epsilon == 0.9
+
+
+def test_select_arms(model):
+    arms = model.select_arms(1000)
+    assert set(arms.tolist()) <= {0, 1}
+    assert (arms == 1).sum() > 900
+
+
+def test_select_arms_weakness(model_added_weakness):
+    model_added_weakness.select_arms(2)
+    assert model_added_weakness.epsilon == pytest.approx(0.81)
+
+
+def test_seed_reproducible():
+    first = EpsilonGreedy(0.5, [1, 1, 1], [0.1, 0.3, 0.2], seed=5)
+    second = EpsilonGreedy(0.5, [1, 1, 1], [0.1, 0.3, 0.2], seed=5)
+    assert [first.select_arm() for _ in range(50)] == [
+        second.select_arm() for _ in range(50)
+    ]
+    assert first.select_arms(100).tolist() == second.select_arms(100).tolist()
@@ -0,0 +1,70 @@
+from mab.journal import UpdateLog
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+import os
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "journal")
+
+
+def test_requires_mab(path):
+    with pytest.raises(ValueError):
+        UpdateLog(path)
+
+
+def test_replay(path):
+    with UpdateLog(path, BetaTS(n_arms=3), buffer_size=2) as log:
+        log.update(0, 1)
+        log.update_many([1, 2, 2], [0, 1, 1])
+        log.add_arm("a very long version id with ünicode")
+        log.update("a very long version id with ünicode", 1)
+        log.deactivate_arm(0)
+        log.activate_arm(0)
+        log.deactivate_arm(1)
+        log.update(3, 0)
+        expected = dict(log.mab)
+
+    recovered = UpdateLog(path)
+    assert dict(recovered.mab) == expected
+    assert recovered.replayed == 13
+    recovered.close()
+
+
+def test_compaction(path):
+    with UpdateLog(path, EpsilonGreedy(0.1, n_arms=2), compact_every=3) as log:
+        for reward in [1.0, 0.0, 1.0, 1.0]:
+            log.update(1, reward)
+        expected = dict(log.mab)
+
+    assert sorted(os.listdir(path)) == ["log.1", "snapshot"]
+    recovered = UpdateLog(path)
+    assert dict(recovered.mab) == expected
+    assert recovered.replayed == 1
+    recovered.close()
+
+
+def test_torn_tail(path):
+    with UpdateLog(path, EpsilonGreedy(0.1, n_arms=2)) as log:
+        log.update(0, 1.0)
+        log.update(1, 1.0)
+    with open(os.path.join(path, "log.0"), "ab") as file:
+        file.write(b"\0" * 5)
+
+    recovered = UpdateLog(path)
+    assert recovered.mab.counts == [1, 1]
+    recovered.update(0, 0.0)
+    recovered.close()
+    assert UpdateLog(path).mab.counts == [2, 1]
+
+
+def test_array_backed_replay(path):
+    arms = np.random.randint(5, size=1000)
+    rewards = np.random.random(1000) < 0.3
+    with UpdateLog(path, BetaTS(n_arms=5, array_backed=True)) as log:
+        log.update_many(arms, rewards)
+        expected = log.mab.alpha.copy()
+    assert UpdateLog(path).mab.alpha.tolist() == expected.tolist()
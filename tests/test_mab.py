@@ -1,6 +1,8 @@
 from mab.mab import MAB
 import pytest
 import pickle, codecs
+import base64
+import numpy as np
 
 
 @pytest.fixture
@@ -176,3 +178,150 @@ def test_sync_settings(model):
     assert 1 not in model.active_arms
     assert 3 == len(model.active_arms)
     assert "version2" not in model.active_versions
+
+
+@pytest.fixture
+def array_model():
+    return MAB(
+        [10, 20], [0.1, 0.5], version_ids=["version1", "version2"], array_backed=True
+    )
+
+
+def test_array_backed_state(array_model):
+    assert isinstance(array_model.counts, np.ndarray)
+    assert array_model.counts.dtype == np.int64
+    assert array_model.values.dtype == np.float64
+    array_model.update("version2", 1.0)
+    assert array_model.counts.tolist() == [10, 21]
+
+
+def test_array_backed_add_arm_reset(array_model):
+    for _ in range(20):
+        array_model.add_arm()
+    array_model.update(21, 1.0)
+    assert len(array_model.counts) == array_model.n_arms == 22
+    array_model.reset()
+    assert array_model.counts.tolist() == [10, 20] + [0] * 20
+    assert array_model.values[21] == 0.0
+
+
+def test_array_backed_pickle(array_model):
+    unpickled_model = pickle.loads(codecs.decode(array_model.pickle().encode(), "base64"))
+    assert unpickled_model == array_model
+    unpickled_model.add_arm()
+    unpickled_model.update(2, 1.0)
+    assert unpickled_model.counts.tolist() == [10, 20, 1]
+
+
+def test_array_backed_to_dict(array_model):
+    params = array_model.to_dict()["params"]
+    assert params["counts"] == [10, 20]
+    assert params["array_backed"]
+
+
+@pytest.mark.parametrize("array_backed", [False, True])
+def test_update_many(array_backed):
+    sequential = MAB(n_arms=4, array_backed=array_backed)
+    batched = MAB(n_arms=4, array_backed=array_backed)
+    arms = np.random.randint(3, size=1000)
+    rewards = np.random.random(1000)
+    for arm, reward in zip(arms.tolist(), rewards.tolist()):
+        sequential.update(arm, reward)
+    batched.update_many(arms, rewards)
+
+    assert list(batched.counts) == list(sequential.counts)
+    assert list(batched.values) == pytest.approx(list(sequential.values))
+
+
+def test_update_many_versions(model):
+    model.update_many(["version2", "version2", "version1"], [1.0, 0.0, 1.0])
+    assert model.counts == [11, 22]
+    assert model.values == pytest.approx([(1.0 + 1.0) / 11, (10.0 + 1.0) / 22])
+
+
+def _compare_to_ab_rescan(m):
+    counts, values = np.asarray(m.counts), np.asarray(m.values)
+    return values @ counts - values.sum() * (counts.sum() // m.n_arms)
+
+
+def test_compare_to_ab(model):
+    assert model.compare_to_ab() == pytest.approx(_compare_to_ab_rescan(model))
+    for arm, reward in [(0, 1.0), (1, 0.0), (1, 1.0)]:
+        model.update(arm, reward)
+    model.update_many([0, 1, 1], [0.0, 1.0, 1.0])
+    model.add_arm()
+    model.update(2, 1.0)
+    assert model.total_count == 37
+    assert model.difference_to_ab == pytest.approx(_compare_to_ab_rescan(model))
+
+    model.reset()
+    assert model.total_count == 30
+    assert model.compare_to_ab() == pytest.approx(_compare_to_ab_rescan(model))
+
+
+def test_active_index(model):
+    for _ in range(3):
+        model.add_arm(is_active=False)
+    model.activate_arm(3)
+    model.activate_arm(3)
+    model.activate_arm(2)
+    assert model.active_arms == [0, 1, 2, 3]
+    model.deactivate_arm(1)
+    assert model.active_arms == [0, 2, 3]
+    assert not model.is_active(1)
+    assert model.is_active(3)
+    assert model._active_mask().tolist() == [True, False, True, True, False]
+
+
+def test_sync_settings_grows_state(model):
+    model.sync_settings({"active_versions": ["version2", "version3"]})
+    assert model.n_arms == 3
+    assert len(model.counts) == len(model.values) == 3
+    assert model.active_arms == [1, 2]
+    assert model.is_active(2)
+    assert not model.is_active(0)
+
+
+def test_sync_settings_keeps_state(array_model):
+    array_model.update(0, 1.0)
+    array_model.sync_settings({"active_versions": ["version2", "version3", "version4"]})
+    assert array_model.n_arms == 4
+    assert array_model.counts.tolist() == [11, 20, 0, 0]
+    assert array_model.active_arms == [1, 2, 3]
+    assert array_model.total_count == 31
+
+    array_model.sync_settings({"active_versions": ["version1"]})
+    assert array_model.active_arms == [0]
+    assert array_model._active_mask().tolist() == [True, False, False, False]
+
+
+# pickled by MAB.pickle() before arm state, active index, totals,
+# random generators and node ids were added
+OLD_PICKLES = {
+    "BetaTS": "gASVeQEAAAAAAACMCm1hYi5iZXRhdHOUjAZCZXRhVFOUk5QpgZR9lCiMBm5fYXJtc5RLA4wGY291bnRzlF2UKEsCSwBLAWWMBnZhbHVlc5RdlChHP+AAAAAAAABHAAAAAAAAAABHP/AAAAAAAABljBFfTUFCX19pbml0X2NvdW50c5RdlChLAEsASwBljBFfTUFCX19pbml0X3ZhbHVlc5RdlChHAAAAAAAAAABHAAAAAAAAAABHAAAAAAAAAABljAt2ZXJzaW9uX2lkc5RdlCiMAWGUjAFilIwBY5RljBZfTUFCX192ZXJzaW9uX3RvX2luZGV4lH2UKGgQSwBoEUsBaBJLAnWMC2FjdGl2ZV9hcm1zlF2UKEsASwFLAmWMBWFscGhhlF2UKEsCSwFLAmWMBGJldGGUXZQoSwJLAUsBZYwTX0JldGFUU19faW5pdF9hbHBoYZRdlChLAUsBSwFljBJfQmV0YVRTX19pbml0X2JldGGUXZQoSwFLAUsBZXViLg==",
+    "EpsilonGreedy": "gASVeQEAAAAAAACMEW1hYi5lcHNpbG9uZ3JlZWR5lIwNRXBzaWxvbkdyZWVkeZSTlCmBlH2UKIwGbl9hcm1zlEsDjAZjb3VudHOUXZQoSwBLAUsBZYwGdmFsdWVzlF2UKEcAAAAAAAAAAEc/8AAAAAAAAEcAAAAAAAAAAGWMEV9NQUJfX2luaXRfY291bnRzlF2UKEsASwBLAGWMEV9NQUJfX2luaXRfdmFsdWVzlF2UKEcAAAAAAAAAAEc/8AAAAAAAAEcAAAAAAAAAAGWMC3ZlcnNpb25faWRzlF2UKIwBMJSMATGUjAEylGWMFl9NQUJfX3ZlcnNpb25fdG9faW5kZXiUfZQoaBBLAGgRSwFoEksCdYwLYWN0aXZlX2FybXOUXZQoSwBLAUsCZYwHZXBzaWxvbpRHP9AAAAAAAACMDXdlYWtuZXNzX211bHSURz/gAAAAAAAAjBxfRXBzaWxvbkdyZWVkeV9faW5pdF9lcHNpbG9ulEc/8AAAAAAAAHViLg==",
+}
+
+
+def test_old_pickles():
+    betats = pickle.loads(base64.b64decode(OLD_PICKLES["BetaTS"]))
+    assert betats.counts == [2, 0, 1]
+    assert betats.alpha == [2, 1, 2]
+    assert betats.version_id_index("c") == 2
+    assert betats.is_active(1)
+    assert betats.total_count == 3
+    assert betats.select_version() in ["a", "b", "c"]
+    betats.update("b", 1)
+    assert betats.total_count == 4
+    betats.reset()
+    assert betats.counts == [0, 0, 0]
+    assert betats.alpha == [1, 1, 1]
+
+    epsilon_greedy = pickle.loads(base64.b64decode(OLD_PICKLES["EpsilonGreedy"]))
+    assert epsilon_greedy.epsilon == 0.25
+    assert epsilon_greedy.weakness_mult == 0.5
+    assert epsilon_greedy.values == [0.0, 1.0, 0.0]
+    assert epsilon_greedy.select_arm() in [0, 1, 2]
+    assert epsilon_greedy.node_id
+    epsilon_greedy.reset()
+    assert epsilon_greedy.epsilon == 1.0
@@ -0,0 +1,154 @@
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+import copy
+import json
+import pickle
+import pytest
+from mab.snapshot import from_bytes
+from mab.tools import dict2MAB
+
+
+def nodes(mab, n):
+    copies = [mab.fork() for _ in range(n)]
+    for index, node in enumerate(copies):
+        node.node_id = f"node-{index}"
+    return copies
+
+
+@pytest.fixture
+def betats():
+    return BetaTS([1, 2, 1], [3, 4, 1], [5, 5, 0], [0.2, 0.2, 0.0])
+
+
+def test_merge_is_exact(betats):
+    a, b = nodes(betats, 2)
+    single = copy.deepcopy(betats)
+    for arm, reward in [(0, 1), (1, 0), (2, 1)]:
+        a.update(arm, reward)
+        single.update(arm, reward)
+    for arm, reward in [(0, 0), (2, 1), (2, 1)]:
+        b.update(arm, reward)
+        single.update(arm, reward)
+
+    a.merge(b.export_delta())
+    b.merge(a.export_delta())
+    for node in (a, b):
+        assert node.counts == single.counts
+        assert node.values == pytest.approx(single.values)
+        assert node.alpha == single.alpha
+        assert node.beta == single.beta
+        assert node.total_count == single.total_count
+
+
+def test_merge_is_idempotent(betats):
+    a, b = nodes(betats, 2)
+    b.update(0, 1)
+    delta = b.export_delta()
+    a.merge(delta)
+    a.merge(delta)
+    a.merge(b)
+    assert a.counts == [6, 5, 0]
+    assert a.alpha == [2, 2, 1]
+
+
+def test_delta_is_small(betats):
+    a, b = nodes(betats, 2)
+    b.update(0, 1)
+    b.update(1, 1)
+    assert b.export_delta()["node-1"]["version_ids"] == ["0", "1"]
+    b.update(1, 0)
+    delta = b.export_delta()
+    assert delta["node-1"]["version_ids"] == ["1"]
+    assert json.loads(json.dumps(delta)) == delta
+    a.merge(delta)
+    assert a.counts == [5, 7, 0]
+
+
+def test_merge_relays_other_nodes():
+    mab = EpsilonGreedy(0.1, n_arms=2, array_backed=True)
+    a, b, c = nodes(mab, 3)
+    a.update(0, 1.0)
+    b.merge(a.export_delta())
+    b.update(1, 0.5)
+    c.merge(b)
+    assert c.counts.tolist() == [1, 1]
+    assert c.values.tolist() == [1.0, 0.5]
+    c.merge(a)
+    assert c.counts.tolist() == [1, 1]
+
+
+def test_merge_new_arm(betats):
+    a, b = nodes(betats, 2)
+    b.add_arm("new")
+    b.update("new", 1)
+    a.merge(b.export_delta())
+    assert a.version_ids[-1] == "new"
+    assert a.counts[-1] == 1
+    assert not a.is_active(a.n_arms - 1)
+
+
+def test_own_updates_after_merge(betats):
+    a, b = nodes(betats, 2)
+    b.update(2, 1)
+    a.merge(b.export_delta())
+    a.update(2, 0)
+    b.merge(a.export_delta())
+    assert b.counts == [5, 5, 2]
+    assert b.values == pytest.approx([0.2, 0.2, 0.5])
+
+
+@pytest.mark.parametrize(
+    "restore",
+    [lambda mab: from_bytes(mab.to_bytes()), lambda mab: dict2MAB(json.loads(json.dumps(mab.to_dict())))],
+)
+def test_merge_after_restore(betats, restore):
+    a, b, c = nodes(betats, 3)
+    for _ in range(5):
+        b.update(0, 1)
+    a.merge(b.export_delta())
+    a.update(1, 1)
+    c.merge(a.export_delta())
+    a.update(1, 0)
+
+    restored = restore(a)
+    assert restored.node_id == a.node_id
+    restored.merge(b.export_delta(full=True))
+    assert restored.counts == a.counts == [10, 7, 0]
+
+    # own updates before and after the restore reach other nodes once
+    restored.update(2, 1)
+    c.merge(restored.export_delta())
+    c.merge(restored.export_delta(full=True))
+    assert c.counts == restored.counts == [10, 7, 1]
+    assert c.alpha == restored.alpha
+    assert c.values == pytest.approx(restored.values)
+
+
+def test_forks_are_new_nodes():
+    a = EpsilonGreedy(0.1, n_arms=2)
+    a.update(1, 1.0)
+    fork_of_a = a.fork()
+    assert fork_of_a.node_id != a.node_id
+    fork_of_a.update(0, 1.0)
+
+    a.merge(fork_of_a)
+    assert a.counts == [1, 1]
+    # the fork knows the updates of a made before forking
+    a.update(1, 0.0)
+    fork_of_a.merge(a.export_delta())
+    assert fork_of_a.counts == [1, 2]
+    assert fork_of_a.values == pytest.approx([1.0, 0.5])
+
+
+def test_copies_keep_node_id():
+    a = EpsilonGreedy(0.1, n_arms=2)
+    a.update(1, 1.0)
+    for same_node in (copy.deepcopy(a), pickle.loads(pickle.dumps(a))):
+        assert same_node.node_id == a.node_id
+        a.merge(same_node)
+        assert a.counts == [0, 1]
+
+    copy_of_a = copy.deepcopy(a)
+    copy_of_a.update(0, 1.0)
+    with pytest.raises(ValueError):
+        a.merge(copy_of_a)
@@ -0,0 +1,66 @@
+from mab.montecarlo import MonteCarloSimulation
+from mab import enums
+from mab.ab import AB
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+from mab.rewards import BernoulliArm, UniformArm
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def arms():
+    return [BernoulliArm(0.6), BernoulliArm(0.1), BernoulliArm(0.1)]
+
+
+def test_arm_rewards():
+    uniform = UniformArm(2, 3, seed=5)
+    expected = UniformArm(2, 3, seed=5).draw_many(10)
+    simulation = MonteCarloSimulation(
+        AB(n_arms=3), [BernoulliArm(1.0), BernoulliArm(0.0), uniform], n_sims=2, horizon=90
+    )
+    simulation.run()
+    rewards = [simulation.rewards[simulation.chosen_arms == arm] for arm in range(3)]
+    assert (rewards[0] == 1).all() and (rewards[1] == 0).all()
+    assert ((rewards[2] >= 2) & (rewards[2] < 3)).all()
+    # simulations draw from reseeded copies of the arms
+    assert (uniform.draw_many(10) == expected).all()
+
+
+def test_experiment_rewards_shape(arms):
+    simulation = MonteCarloSimulation(AB(n_arms=3), arms, n_sims=3, horizon=50, seed=1)
+    experiment_rewards = simulation.run()
+    assert len(experiment_rewards.times) == 150
+    assert experiment_rewards.times[:2] == [1, 2]
+    assert experiment_rewards.times[50] == 1
+    assert len(experiment_rewards.rewards) == len(experiment_rewards.possible_rewards)
+    assert experiment_rewards.n_sims == 3
+    assert simulation.cumulative_rewards[:, -1].tolist() == simulation.rewards.sum(axis=1).tolist()
+    # the algorithm itself isn't changed
+    assert simulation.algorithm.counts == [0, 0, 0]
+
+
+def test_seed_reproducible(arms):
+    first = MonteCarloSimulation(BetaTS(n_arms=3), arms, n_sims=2, horizon=300, seed=4)
+    second = MonteCarloSimulation(BetaTS(n_arms=3), arms, n_sims=2, horizon=300, seed=4)
+    first.run()
+    second.run()
+    assert (first.chosen_arms == second.chosen_arms).all()
+    assert (first.rewards == second.rewards).all()
+
+
+@pytest.mark.parametrize("block_size", [1, 64])
+def test_learns_best_arm(arms, block_size):
+    simulation = MonteCarloSimulation(
+        EpsilonGreedy(0.1, n_arms=3), arms, horizon=3000, block_size=block_size, seed=2
+    )
+    simulation.run()
+    assert (simulation.chosen_arms[0, -1000:] == 0).mean() > 0.8
+
+
+def test_calculate_metrics(arms):
+    simulation = MonteCarloSimulation(BetaTS(n_arms=3), arms, n_sims=2, horizon=100)
+    simulation.run()
+    simulation.calculate_metrics()
+    assert set(simulation.metrics) == set(enums.CORE_METRICS)
+    assert len(simulation.metrics[enums.Metrics.CUMULATIVE_REWARD]) == 101
@@ -17,3 +17,21 @@ def test_name(model):
 
 def test_select_arm(model):
     assert model.select_arm() in [0, 1]
+
+
+def test_select_arms(model):
+    arms = model.select_arms(100)
+    assert len(arms) == 100
+    assert set(arms.tolist()) <= {0, 1}
+
+
+def test_select_versions(model):
+    assert set(model.select_versions(10)) <= {"0", "1"}
+
+
+def test_seed_reproducible():
+    first, second = RandomSelect(n_arms=5, seed=8), RandomSelect(n_arms=5, seed=8)
+    assert [first.select_arm() for _ in range(50)] == [
+        second.select_arm() for _ in range(50)
+    ]
+    assert first.select_arms(100).tolist() == second.select_arms(100).tolist()
@@ -0,0 +1,68 @@
+from mab.registry import ExperimentRegistry
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+import pytest
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "experiments.db")
+
+
+@pytest.fixture
+def registry(path):
+    registry = ExperimentRegistry(path, max_size=2, flush_every=10, flush_interval=60)
+    yield registry
+    registry.close()
+
+
+def test_get_is_cached(registry):
+    registry.put("a", BetaTS(n_arms=3))
+    assert registry.get("a") is registry.get("a")
+    assert registry.hits == 2
+    with pytest.raises(KeyError):
+        registry.get("unknown")
+
+
+def test_update_write_back(path, registry):
+    registry.put("a", BetaTS(n_arms=3))
+    registry.update("a", "1", 1)
+    assert registry.dirty == 1
+    registry.flush()
+    assert registry.dirty == 0
+
+    other = ExperimentRegistry(path)
+    assert other.get("a").counts == [0, 1, 0]
+    assert other.get("a").alpha == [1, 2, 1]
+    other.close()
+
+
+def test_lru_eviction(registry):
+    for experiment_id in "abc":
+        registry.put(experiment_id, EpsilonGreedy(0.1, n_arms=2))
+    assert registry.hydrated == 2
+    registry.update("a", 0, 1.0)
+    assert registry.get("a").counts == [1, 0]
+    assert registry.misses == 1
+    assert len(registry) == 3
+    assert "b" in registry
+    registry.delete("b")
+    assert "b" not in registry
+
+
+def test_max_bytes(path):
+    registry = ExperimentRegistry(path, max_bytes=1)
+    registry.put("a", BetaTS(n_arms=3))
+    registry.put("b", BetaTS(n_arms=3))
+    assert registry.hydrated == 1
+    assert registry.get("a").n_arms == 3
+    registry.close()
+
+
+def test_flush_every(path):
+    registry = ExperimentRegistry(path, flush_every=2, flush_interval=60)
+    registry.put("a", BetaTS(n_arms=2))
+    registry.put("b", BetaTS(n_arms=2))
+    assert registry.writes == 2
+    assert registry.dirty == 0
+    registry.close()
@@ -1,4 +1,5 @@
-from mab.rewards import BernoulliArm
+import numpy as np
+from mab.rewards import BernoulliArm, RewardSource, bernoulli_arms, draw_matrix
 import pytest
 from mab.rewards import UniformArm
 
@@ -28,3 +29,61 @@ def test_utype_check(umodel):
 def test_udraw(umodel):
     reward = umodel.draw()
     assert reward >= 0 and reward <= 100
+
+
+def test_seed_reproducible():
+    first = [BernoulliArm(0.5, seed=3).draw() for _ in range(2)]
+    draws = [BernoulliArm(0.5, seed=3) for _ in range(2)]
+    assert [arm.draw() for arm in draws] == [first[0], first[0]]
+    assert UniformArm(0, 1, seed=1).draw() == UniformArm(0, 1, seed=1).draw()
+
+
+def test_reseed():
+    arm = BernoulliArm(0.5, seed=3)
+    first = arm.draw_many(10)
+    arm.draw()
+    arm.reseed(3)
+    assert (arm.draw_many(10) == first).all()
+
+
+def test_bernoulli_arms_streams():
+    first = bernoulli_arms([0.5] * 4, seed=11)
+    second = bernoulli_arms([0.5] * 4, seed=11)
+    sequences = [[arm.draw() for _ in range(64)] for arm in first]
+    assert sequences == [[arm.draw() for _ in range(64)] for arm in second]
+    # children streams are independent
+    assert len({tuple(sequence) for sequence in sequences}) == 4
+
+
+def test_draw_many_stream():
+    arm = UniformArm(0, 1, seed=5)
+    expected = [arm.draw() for _ in range(3000)]
+
+    arm = UniformArm(0, 1, seed=5)
+    mixed = [arm.draw()] + arm.draw_many(1500).tolist() + [arm.draw() for _ in range(10)]
+    mixed += arm.draw_many(1489).tolist()
+    assert mixed == expected
+    assert len(arm.draw_many(0)) == 0
+
+    rewards = BernoulliArm(0.3, seed=1).draw_many(10000)
+    assert set(rewards.tolist()) == {0.0, 1.0}
+    assert rewards.mean() == pytest.approx(0.3, abs=0.02)
+
+
+class CountingArm:
+    def __init__(self):
+        self.n = 0
+
+    def draw(self):
+        self.n += 1
+        return float(self.n)
+
+
+def test_reward_source():
+    source = RewardSource(bernoulli_arms([0.2, 0.5, 0.9], seed=2) + [CountingArm()])
+    matrix = np.vstack([[source.draw_row() for _ in range(5)], source.draw_matrix(2000)])
+    assert matrix.shape == (2005, 4)
+    assert matrix[:, 3].tolist() == list(range(1, 2006))
+
+    expected = draw_matrix(bernoulli_arms([0.2, 0.5, 0.9], seed=2), 2005)
+    assert (matrix[:, :3] == expected).all()
@@ -0,0 +1,65 @@
+from mab.runner import SimulationResult, SimulationRunner
+import numpy as np
+from mab import enums
+from mab.ab import AB
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+import pytest
+
+
+@pytest.fixture
+def algorithms():
+    return [AB(n_arms=3), EpsilonGreedy(0.1, n_arms=3), BetaTS(n_arms=3)]
+
+
+@pytest.fixture
+def probs():
+    return [0.6, 0.1, 0.1]
+
+
+def test_events_runner(algorithms, probs):
+    results = SimulationRunner(algorithms, probs, horizon=200, n_sims=4, max_workers=2, seed=1).run()
+    assert [result.name for result in results] == [a.name for a in algorithms]
+    for result in results:
+        assert result.rewards.shape == (4, 200)
+        assert result.arm_counts.sum() == 4 * 200
+        metrics = result.metrics()
+        assert set(metrics) == set(enums.CORE_METRICS)
+        assert all(len(values) == 200 for values in metrics.values())
+    # AB spreads selections, BetaTS finds the best arm
+    assert results[2].arm_counts[:, 0].sum() > results[0].arm_counts[:, 0].sum()
+    # the same seeds give the same possible rewards to every algorithm
+    assert (results[0].possible_rewards == results[1].possible_rewards).all()
+
+
+def test_runner_reproducible(algorithms, probs):
+    first = SimulationRunner(algorithms[1:], probs, horizon=100, n_sims=2, max_workers=1, seed=3)
+    inline = first.run()
+    assert (inline[0].possible_rewards == inline[1].possible_rewards).all()
+    second = SimulationRunner(algorithms[1:], probs, horizon=100, n_sims=2, max_workers=2, seed=3)
+    for a, b in zip(inline, second.run()):
+        assert (a.rewards == b.rewards).all()
+
+
+def test_ui_runner(algorithms, probs):
+    runner = SimulationRunner(
+        algorithms[:1], probs, horizon=10, n_sims=2, customers=(5, 10), max_workers=1
+    )
+    (result,) = runner.run()
+    assert result.rewards.shape == (2, 10)
+    assert 2 * 10 * 5 <= result.arm_counts.sum() <= 2 * 10 * 10
+    assert result.experiment_rewards().n_sims == 2
+
+
+def test_result_metrics():
+    result = SimulationResult(
+        name="test",
+        rewards=np.array([[1, 0, 0], [0, 1, 0], [1, 1, 0], [0, 0, 0]]),
+        possible_rewards=np.array([[1, 1, 0], [1, 1, 0], [1, 1, 1], [0, 1, 0]]),
+        arm_counts=np.zeros((4, 2)),
+    )
+    metrics = result.metrics()
+    assert metrics[enums.Metrics.ACCURACY].tolist() == pytest.approx([2 / 3, 2 / 4, 0.0])
+    assert metrics[enums.Metrics.AVERAGE_REWARD].tolist() == pytest.approx([0.5, 0.5, 0.0])
+    assert metrics[enums.Metrics.CUMULATIVE_REWARD].tolist() == pytest.approx([0.5, 1.0, 1.0])
+    assert metrics[enums.Metrics.REGRET].tolist() == pytest.approx([1 / 3, 2 / 4, 1.0])
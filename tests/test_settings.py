@@ -0,0 +1,60 @@
+from mab.settings import SettingsWatcher
+from mab.betats import BetaTS
+from mab.threadsafe import ThreadSafeMAB
+import json
+import os
+import time
+import pytest
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "settings.json")
+
+
+def write(path, versions):
+    with open(path, "w") as file:
+        json.dump({"active_versions": versions}, file)
+    # make sure the file signature changes
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_check(path):
+    mab = BetaTS(n_arms=2)
+    watcher = SettingsWatcher(mab, path)
+    assert not watcher.check()
+
+    write(path, ["1", "new"])
+    assert watcher.check()
+    assert not watcher.check()
+    assert mab.version_ids == ["0", "1", "new"]
+    assert mab.alpha == [1, 1, 1]
+    assert mab.active_versions == ["1", "new"]
+    assert watcher.reloads == 1
+
+
+def test_thread_safe_mab(path):
+    mab = ThreadSafeMAB(BetaTS(n_arms=3))
+    write(path, ["0", "2"])
+    with SettingsWatcher(mab, path, interval=0.01) as watcher:
+        assert watcher.reloads == 1
+        assert mab.select_arm() in [0, 2]
+        write(path, ["1", "2"])
+        deadline = time.monotonic() + 5
+        while watcher.reloads < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert watcher.reloads == 2
+    assert mab.select_arm() in [1, 2]
+
+
+def test_plain_mab_swaps_active_arms(path):
+    mab = BetaTS(n_arms=4)
+    active_arms, active_mask = mab.active_arms, mab._active_mask()
+    write(path, ["1", "3"])
+    assert SettingsWatcher(mab, path).check()
+    # readers holding the old list and mask see them unchanged
+    assert active_arms == [0, 1, 2, 3]
+    assert active_mask.all()
+    assert mab.active_arms == [1, 3]
+    assert mab._active_mask().tolist() == [False, True, False, True]
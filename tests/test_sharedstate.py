@@ -0,0 +1,139 @@
+from mab.sharedstate import SharedMAB
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+import multiprocessing
+import pytest
+
+
+@pytest.fixture
+def shared():
+    mab = BetaTS([1, 2, 1], [3, 4, 1], [10, 20, 0], [0.1, 0.5, 0.0])
+    shared = SharedMAB.create(mab, n_workers=3)
+    yield shared
+    shared.close()
+    shared.unlink()
+
+
+def _worker(name, worker, arms, rewards):
+    mab = BetaTS(n_arms=3)
+    shared = SharedMAB.attach(mab, name, worker)
+    shared.update_many(arms, rewards)
+    shared.close()
+
+
+def test_attach_reads_state(shared):
+    other = SharedMAB.attach(BetaTS(n_arms=3), shared.name, worker=1)
+    assert other.mab.counts == [10, 20, 0]
+    assert other.mab.alpha == [1, 2, 1]
+    other.close()
+
+
+def test_updates_are_shared(shared):
+    other = SharedMAB.attach(BetaTS(n_arms=3), shared.name, worker=1)
+    shared.update(0, 1)
+    other.update_many([0, 2, 2], [1, 0, 1])
+    shared.refresh()
+    other.refresh()
+    for mab in (shared.mab, other.mab):
+        assert mab.counts == [12, 20, 2]
+        assert mab.values == pytest.approx([(1.0 + 2.0) / 12, 0.5, 0.5])
+        assert mab.alpha == [3, 2, 2]
+        assert mab.beta == [3, 4, 2]
+    other.close()
+
+
+def test_active_mask_is_shared(shared):
+    other = SharedMAB.attach(BetaTS(n_arms=3), shared.name, worker=2)
+    shared.deactivate_arm(0)
+    assert other.select_arm() in [1, 2]
+    assert other.mab.active_arms == [1, 2]
+    other.close()
+
+
+def test_processes(shared):
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_worker, args=(shared.name, w, [w, w], [1.0, 0.0]))
+        for w in (1, 2)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    shared.refresh()
+    assert shared.mab.counts == [10, 22, 2]
+
+
+def test_wrong_arms(shared):
+    with pytest.raises(ValueError):
+        SharedMAB.attach(BetaTS(n_arms=4), shared.name, worker=1)
+
+
+def test_plain_mab_columns():
+    shared = SharedMAB.create(EpsilonGreedy(0.1, n_arms=2, array_backed=True), 2)
+    shared.update(1, 1.0)
+    shared.refresh()
+    assert shared.mab.counts.tolist() == [0, 1]
+    assert shared.select_arm() in [0, 1]
+    shared.close()
+    shared.unlink()
+
+
+def test_reload_only_after_changes(shared, monkeypatch):
+    other = SharedMAB.attach(BetaTS(n_arms=3), shared.name, worker=1)
+    shared.select_arm()
+    reloads = []
+    load_arm_state = shared.mab.load_arm_state
+    monkeypatch.setattr(
+        shared.mab, "load_arm_state", lambda **columns: reloads.append(load_arm_state(**columns))
+    )
+
+    shared.select_arms(2)
+    shared.update(0, 1)
+    shared.select_arm()
+    assert len(reloads) == 0
+
+    other.update(2, 1)
+    shared.select_arm()
+    shared.select_arm()
+    assert len(reloads) == 1
+    assert shared.mab.counts == [11, 20, 1]
+
+    other.deactivate_arm(2)
+    shared.select_version()
+    assert len(reloads) == 2
+    assert shared.mab.active_arms == [0, 1]
+    other.close()
+
+
+def _toggle_worker(name, worker, n):
+    shared = SharedMAB.attach(BetaTS(n_arms=3), name, worker)
+    for _ in range(n):
+        shared.deactivate_arm(worker)
+        shared.activate_arm(worker)
+    shared.close()
+
+
+def test_settings_counters_per_worker(shared, monkeypatch):
+    # every worker counts only its own changes of active arms, so no change is lost
+    processes = [
+        multiprocessing.Process(target=_toggle_worker, args=(shared.name, worker, 200))
+        for worker in (1, 2)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert shared._blocks["slot_settings"].tolist() == [0, 400, 400]
+
+    shared.select_arm()
+    reloads = []
+    load_arm_state = shared.mab.load_arm_state
+    monkeypatch.setattr(
+        shared.mab, "load_arm_state", lambda **columns: reloads.append(load_arm_state(**columns))
+    )
+    # own changes are already in the local mab
+    shared.deactivate_arm(0)
+    shared.select_arm()
+    assert len(reloads) == 0
+    assert shared.mab.active_arms == [1, 2]
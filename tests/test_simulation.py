@@ -6,6 +6,8 @@ import mab.betats as betats
 import mab.rewards as rewards
 import simpy
 import mab.realtime as realtime
+from mab import enums
+import numpy as np
 
 
 @pytest.fixture
@@ -75,3 +77,85 @@ def test_simulation(mu, n_arms, horizon, algorithms, n_customers_low, n_customer
         names.append(s.name)
     assert len(metrics) == len(algorithms)
     assert len(names) == len(algorithms)
+
+
+@pytest.mark.parametrize("batch_size", [None, 10])
+def test_batched_simulation(mu, n_arms, algorithms, n_customers_low, n_customers_high, batch_size):
+    for a in algorithms:
+        env = simpy.Environment()
+        s = realtime.UISimulation(
+            env,
+            algorithm=a,
+            arms=rewards.bernoulli_arms(mu, seed=1),
+            n_customers_low=n_customers_low,
+            n_customers_high=n_customers_high,
+            seed=2,
+            batch_size=batch_size,
+        )
+        env.run(until=30)
+
+        assert len(s.rewards) == len(s.possible_rewards) == 30
+        assert len(s.chosen_arms) == sum(a.counts)
+        assert n_customers_low * 30 <= len(s.chosen_arms) <= n_customers_high * 30
+        assert sum(s.rewards) == pytest.approx(sum(c * v for c, v in zip(a.counts, a.values)))
+        assert all(r <= p for r, p in zip(s.rewards, s.possible_rewards))
+
+        s.calculate_metrics()
+        assert len(s.metrics[enums.Metrics.ACCURACY]) == 30
+
+
+def run_events(mu, until, **kwargs):
+    env = simpy.Environment()
+    algorithm = eg.EpsilonGreedy(0.3, n_arms=len(mu), seed=4)
+    s = realtime.EventsSimulation(env, algorithm, rewards.bernoulli_arms(mu, seed=3), **kwargs)
+    env.run(until=until)
+    return s
+
+
+def test_streaming_simulation(mu):
+    full = run_events(mu, 1000)
+    every_step = run_events(mu, 1000, checkpoint_every=1)
+    assert every_step.rewards == full.rewards
+    assert every_step.possible_rewards == full.possible_rewards
+    assert every_step.cumulative_rewards == full.cumulative_rewards
+    assert every_step.chosen_arms is None
+    assert every_step.arm_counts.tolist() == np.bincount(full.chosen_arms).tolist()
+
+    s = run_events(mu, 950, checkpoint_every=100)
+    assert s.checkpoint_times == list(range(100, 1000, 100))
+    assert s.rewards == pytest.approx(np.reshape(full.rewards, (10, 100)).mean(axis=1)[:9])
+    assert s.cumulative_rewards == full.cumulative_rewards[99:900:100]
+
+    # the last steps are retained by calculate_metrics
+    s.calculate_metrics(["regret"])
+    assert s.checkpoint_times[-1] == 950
+    assert len(s.metrics["regret"]) == 11
+    assert s.cumulative_rewards[-1] == full.cumulative_rewards[949]
+
+    # regret at checkpoints is the full regret averaged over each window
+    full.calculate_metrics(["regret"])
+    windows = np.split(np.array(full.metrics["regret"][1:951]), s.checkpoint_times[:-1])
+    assert s.metrics["regret"][1:] == pytest.approx([w.mean() for w in windows])
+
+
+def test_log_spaced_checkpoints(mu, n_customers_low, n_customers_high):
+    assert run_events(mu, 1000, checkpoint_growth=2).checkpoint_times == [
+        1, 2, 4, 8, 16, 32, 64, 128, 256, 512
+    ]
+    assert run_events(mu, 1000, checkpoint_every=10, checkpoint_growth=2).checkpoint_times == [
+        10, 20, 40, 80, 160, 320, 640
+    ]
+
+    env = simpy.Environment()
+    algorithm = betats.BetaTS(n_arms=len(mu))
+    s = realtime.UISimulation(
+        env, algorithm, rewards.bernoulli_arms(mu), n_customers_low, n_customers_high,
+        batch_size=None, checkpoint_growth=1.5,
+    )
+    env.run(until=200)
+    s.calculate_metrics()
+    assert len(s.rewards_difference_to_ab) == len(s.checkpoint_times) == len(s.rewards)
+    assert s.arm_counts.sum() == sum(algorithm.counts)
+    windows = np.diff([0] + s.checkpoint_times)
+    assert np.dot(s.rewards, windows) == pytest.approx(s.cumulative_rewards[-1])
+    assert len(s.metrics[enums.Metrics.ACCURACY]) == len(s.checkpoint_times)
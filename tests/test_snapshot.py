@@ -0,0 +1,67 @@
+from mab.snapshot import from_bytes, to_bytes
+from mab.ab import AB
+from mab.betats import BetaTS
+from mab.epsilongreedy import EpsilonGreedy
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def model():
+    m = BetaTS([1, 2], [3, 4], [10, 20], [0.1, 0.5], version_ids=["a", "b"])
+    m.add_version("c", is_active=False)
+    m.update("b", 1)
+    return m
+
+
+def test_round_trip(model):
+    restored = from_bytes(model.to_bytes())
+    assert isinstance(restored, BetaTS)
+    assert restored == model
+    assert restored.alpha == [1, 3, 1]
+    assert restored.active_arms == [0, 1]
+    assert restored.version_ids == ["a", "b", "c"]
+
+
+def test_round_trip_scalar_params():
+    m = EpsilonGreedy(0.3, [1, 2], [0.5, 0.25])
+    m.select_arm()
+    restored = from_bytes(to_bytes(m))
+    assert restored == m
+    assert restored.epsilon == m.epsilon
+
+    m = EpsilonGreedy(n_arms=2, weakness_mult=0.9)
+    for _ in range(10):
+        m.select_arm()
+    restored = from_bytes(to_bytes(m))
+    assert restored.epsilon == m.epsilon == pytest.approx(0.3487, abs=1e-4)
+
+    m = AB(n_arms=3)
+    m.select_arms(2)
+    assert from_bytes(to_bytes(m)).current_arm == 2
+
+
+def test_zero_copy():
+    m = BetaTS(n_arms=1000, array_backed=True)
+    m.update_many(np.arange(1000), np.ones(1000))
+    data = bytearray(to_bytes(m))
+    restored = from_bytes(data)
+    assert restored == m
+    assert np.shares_memory(restored.counts, np.frombuffer(data, dtype=np.uint8))
+    # restored model is still updatable and can grow
+    restored.update(5, 1.0)
+    restored.add_arm()
+    assert restored.counts[5] == 2
+    assert restored.n_arms == 1001
+
+
+def test_read_only_buffer():
+    m = BetaTS(n_arms=10, array_backed=True)
+    restored = from_bytes(bytes(to_bytes(m)))
+    restored.update(0, 1.0)
+    assert restored.alpha[0] == 2
+
+
+def test_bad_magic(model):
+    with pytest.raises(ValueError):
+        from_bytes(b"XXXX" + model.to_bytes()[4:])
@@ -1,5 +1,6 @@
 from mab.softmax import Softmax
 import pytest
+import numpy as np
 
 
 @pytest.fixture
@@ -21,3 +22,70 @@ def test_temperature_check(model):
 
 def test_select_arm(model):
     assert model.select_arm() in [0, 1]
+
+
+def test_select_arms(model):
+    arms = model.select_arms(1000)
+    assert len(arms) == 1000
+    assert set(arms.tolist()) <= {0, 1}
+    # exp(0.5 / 0.1) / exp(0.1 / 0.1) ~ 55 times more probable
+    assert (arms == 1).sum() > 900
+
+
+def test_probabilities(model):
+    probabilities = model.probabilities
+    assert probabilities.sum() == pytest.approx(1.0)
+    assert probabilities[1] / probabilities[0] == pytest.approx(np.exp(4.0))
+    # cached until update
+    assert model.probabilities is probabilities
+    model.update(0, 1.0)
+    assert model.probabilities is not probabilities
+
+
+def test_probabilities_temperature(model):
+    model.probabilities
+    model.temperature = 1.0
+    assert model.probabilities[1] / model.probabilities[0] == pytest.approx(
+        np.exp(0.4)
+    )
+
+
+def test_probabilities_stable():
+    model = Softmax([1, 1], [1000.0, 999.0], temperature=0.001)
+    assert np.isfinite(model.probabilities).all()
+    assert model.probabilities[0] == pytest.approx(1.0)
+
+
+def test_inactive_arms(model):
+    model.add_arm(is_active=True)
+    model.add_arm(is_active=True)
+    model.deactivate_arm(1)
+    assert model.probabilities[1] == 0.0
+    assert 1 not in [model.select_arm() for _ in range(200)]
+    assert 1 not in model.select_arms(1000).tolist()
+
+
+def test_alias_sampling():
+    model = Softmax([1, 1, 1, 1], [0.0, 0.1, 0.2, 0.3], temperature=0.1)
+    arms = model.select_arms(100000)
+    frequencies = np.bincount(arms, minlength=4) / len(arms)
+    assert frequencies == pytest.approx(model.probabilities, abs=0.01)
+
+
+def test_seed_reproducible():
+    first = Softmax([1, 1, 1], [0.1, 0.3, 0.2], seed=5)
+    second = Softmax([1, 1, 1], [0.1, 0.3, 0.2], seed=5)
+    assert [first.select_arm() for _ in range(50)] == [
+        second.select_arm() for _ in range(50)
+    ]
+    assert first.select_arms(100).tolist() == second.select_arms(100).tolist()
+
+
+@pytest.mark.parametrize("array_backed", [False, True])
+def test_select_arm_distribution(array_backed):
+    model = Softmax(
+        [1, 1, 1, 1], [0.0, 0.1, 0.2, 0.3], temperature=0.1, array_backed=array_backed
+    )
+    arms = [model.select_arm() for _ in range(20000)]
+    frequencies = np.bincount(arms, minlength=4) / len(arms)
+    assert frequencies == pytest.approx(model.probabilities, abs=0.015)
@@ -0,0 +1,103 @@
+from mab.threadsafe import ThreadSafeMAB
+from mab.ab import AB
+from mab.betats import BetaTS
+import threading
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def model():
+    return ThreadSafeMAB(BetaTS(n_arms=4, array_backed=True), buffer_size=16)
+
+
+def test_buffered_update(model):
+    model.update(1, 1.0)
+    model.update("2", 0.0)
+    assert model.pending == 2
+    model.flush()
+    assert model.pending == 0
+    with model.exclusive() as mab:
+        assert mab.counts.tolist() == [0, 1, 1, 0]
+        assert mab.alpha.tolist() == [1, 2, 1, 1]
+
+
+def test_select(model):
+    assert model.select_arm() in range(4)
+    assert set(model.select_arms(10).tolist()) <= set(range(4))
+    assert model.select_version() in ["0", "1", "2", "3"]
+
+
+def test_replica_refresh(model):
+    version = model.version
+    for _ in range(16):
+        model.update(3, 1.0)
+    assert model.version == version + 1
+    assert model.pending == 0
+    assert model._replica().counts[3] == 16
+
+
+def test_exclusive_publish(model):
+    with model.exclusive() as mab:
+        mab.add_arm()
+    assert model._replica().n_arms == 5
+
+
+def test_concurrent_updates():
+    model = ThreadSafeMAB(AB(n_arms=3), buffer_size=64)
+    n_threads, n_updates = 8, 2000
+
+    def work(seed):
+        rng = np.random.default_rng(seed)
+        for _ in range(n_updates):
+            arm = model.select_arm()
+            model.update(arm, float(rng.random() < 0.5))
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    model.flush()
+
+    with model.exclusive() as mab:
+        assert sum(mab.counts) == n_threads * n_updates
+        assert mab.total_count == n_threads * n_updates
+
+
+def test_replicas_have_own_streams():
+    model = ThreadSafeMAB(BetaTS(n_arms=50, seed=1))
+    draws = []
+
+    def work():
+        draws.append(model.select_arms(20).tolist())
+
+    threads = [threading.Thread(target=work) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert draws[0] != draws[1]
+
+
+def test_views_share_published_state(model):
+    for _ in range(16):
+        model.update(3, 1.0)
+    view = model._replica()
+    # per-arm state isn't copied for the thread, only the random generator is own
+    assert np.shares_memory(view.alpha, model._published.alpha)
+    assert view._rng is not model._published._rng
+
+    rng = view._rng
+    for _ in range(16):
+        model.update(2, 1.0)
+    assert model._replica() is not view
+    assert model._replica()._rng is rng
+
+
+def test_ab_cursor_kept_after_merge():
+    model = ThreadSafeMAB(AB(n_arms=3), buffer_size=2)
+    assert model.select_arms(2).tolist() == [0, 1]
+    model.update(0, 1.0)
+    model.update(1, 0.0)
+    assert model.select_arm() == 2
@@ -6,6 +6,7 @@ from mab.betats import BetaTS
 from mab.softmax import Softmax
 from mab.epsilongreedy import EpsilonGreedy
 from mab.randomselect import RandomSelect
+import pytest
 
 
 def test_dict2MAB_AB():
@@ -50,6 +51,17 @@ def test_dict2MAB_EpsilonGreedy():
     assert obj.epsilon == 0.6
 
 
+def test_dict2MAB_decayed_epsilon():
+    m = EpsilonGreedy(n_arms=2, weakness_mult=0.9)
+    for _ in range(10):
+        m.select_arm()
+    assert m.epsilon == pytest.approx(0.3487, abs=1e-4)
+
+    obj = dict2MAB(m.to_dict())
+    assert obj.epsilon == m.epsilon
+    assert obj.weakness_mult == 0.9
+
+
 def test_dict2MAB_RandomSelect():
     m = RandomSelect([10, 20], [0.1, 0.5])
 
@@ -62,3 +74,14 @@ def test_dict2MAB_UCB1():
 
     obj = dict2MAB(m.to_dict())
     assert isinstance(obj, UCB1)
+
+
+def test_dict2MAB_array_backed():
+    m = BetaTS([1, 2], [3, 4], [10, 20], [0.1, 0.5], array_backed=True)
+    m.add_arm()
+
+    obj = dict2MAB(m.to_dict())
+    assert isinstance(obj, BetaTS)
+    assert obj == m
+    assert obj.alpha.tolist() == [1, 2, 1]
+    assert obj.counts.tolist() == [10, 20, 0]
@@ -1,5 +1,6 @@
 from mab.ucb import UCB1
 import pytest
+import numpy as np
 
 
 @pytest.fixture
@@ -17,3 +18,81 @@ def test_name(model):
 
 def test_select_arm(model):
     assert model.select_arm() == 0
+
+
+def test_select_arms(model):
+    assert model.select_arms(3).tolist() == [0, 0, 0]
+
+
+def test_select_arm_inactive(model):
+    model.add_arm(is_active=True)
+    model.deactivate_arm(0)
+    assert model.active_arms == [1, 2]
+    model.update(2, 1.0)
+    assert model.select_arm() == 2
+
+
+def _ucb_value(model, arm):
+    if model.counts[arm] == 0:
+        return np.inf
+    return model.values[arm] + np.sqrt(2 * np.log(model.total_count) / model.counts[arm])
+
+
+def test_lazy_index_matches_scan():
+    np.random.seed(3)
+    probs = np.random.random(301)
+    scan = UCB1(n_arms=300)
+    lazy = UCB1(n_arms=300, lazy_index=True)
+    for step in range(3000):
+        arm = scan.select_arm()
+        lazy_arm = lazy.select_arm()
+        # ties are possible up to rounding, compare UCB values
+        assert _ucb_value(scan, lazy_arm) == pytest.approx(_ucb_value(scan, arm))
+        reward = float(np.random.random() < probs[arm])
+        scan.update(arm, reward)
+        lazy.update(arm, reward)
+        if step == 1000:
+            for m in (scan, lazy):
+                m.add_arm()
+                m.deactivate_arm(int(np.argmax(probs[:300])))
+
+
+def test_lazy_index_update_many():
+    lazy = UCB1(n_arms=5, lazy_index=True)
+    lazy.update_many([0, 1, 2, 3, 4, 4], [0.0, 0.0, 1.0, 0.0, 0.0, 0.0])
+    assert lazy.select_arm() == 2
+    lazy.add_arm(is_active=True)
+    assert lazy.select_arm() == 5
+
+
+def test_select_arm_list_and_array_backed():
+    rewards = np.random.default_rng(0).random((200, 5)) < [0.1, 0.2, 0.3, 0.4, 0.5]
+    listed = UCB1(n_arms=5)
+    arrayed = UCB1(n_arms=5, array_backed=True)
+    for row in rewards:
+        arm = listed.select_arm()
+        assert arm == arrayed.select_arm()
+        listed.update(arm, float(row[arm]))
+        arrayed.update(arm, float(row[arm]))
+
+
+def test_lazy_index_rebuilds(monkeypatch):
+    rng = np.random.default_rng(0)
+    probs = rng.random(1000)
+    lazy = UCB1(n_arms=1000, lazy_index=True)
+    rebuilds = []
+    rebuild_index = lazy._rebuild_index
+    monkeypatch.setattr(lazy, "_rebuild_index", lambda: rebuilds.append(rebuild_index()))
+
+    def play(n):
+        for _ in range(n):
+            arm = lazy.select_arm()
+            lazy.update(arm, float(rng.random() < probs[arm]))
+
+    # not played arms are selected without rebuilds
+    play(1000)
+    assert len(rebuilds) <= 2
+    # then the horizon moves with 1/64 of the total count
+    play(3000)
+    assert len(rebuilds) < 100
+    assert lazy._horizon - lazy.total_count <= lazy.total_count // 64 + 1